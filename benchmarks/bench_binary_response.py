@@ -0,0 +1,78 @@
+import argparse
+import os
+import time
+import tracemalloc
+from typing import Any, Callable, Iterator, Tuple
+
+import httpx
+
+from vedro_replay import BinaryResponse
+from vedro_replay.compare import compare_responses
+
+CHUNK_SIZE = 1 << 16
+
+
+class _IteratorStream(httpx.SyncByteStream):
+    def __init__(self, iterator: Iterator[bytes]) -> None:
+        self._iterator = iterator
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self._iterator
+
+
+def make_response(size: int, changed_offset: int = -1) -> httpx.Response:
+    # The body is generated chunk by chunk as it is read, like the body of a large response read from a socket
+    def iter_content() -> Iterator[bytes]:
+        chunk = os.urandom(CHUNK_SIZE)
+        for offset in range(0, size, CHUNK_SIZE):
+            if offset <= changed_offset < offset + CHUNK_SIZE:
+                yield b'\x00' + chunk[1:]
+            else:
+                yield chunk
+
+    return httpx.Response(
+        200,
+        headers={'content-type': 'application/octet-stream'},
+        stream=_IteratorStream(iter_content()),
+        request=httpx.Request('GET', 'http://localhost/file'),
+    )
+
+
+def measure(fn: Callable[[], Any]) -> Tuple[float, float]:
+    started_at = time.perf_counter()
+    assert fn()
+    duration = time.perf_counter() - started_at
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return duration, peak / 2 ** 20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark of the comparison of large binary responses')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[16, 128], help='Sizes of the bodies in MB')
+    args = parser.parse_args()
+
+    for size_mb in args.sizes:
+        size = size_mb * 2 ** 20
+        changed_offset = size // 2
+
+        def compare_content() -> Any:
+            golden, testing = make_response(size), make_response(size, changed_offset)
+            return golden.read() != testing.read()
+
+        def compare_streams() -> Any:
+            golden = BinaryResponse.from_response(make_response(size))
+            testing = BinaryResponse.from_response(make_response(size, changed_offset))
+            return compare_responses(golden, testing)
+
+        content_time, content_peak = measure(compare_content)
+        stream_time, stream_peak = measure(compare_streams)
+        print(f'{size_mb:>5}MB: read content {content_time:.3f}s (peak {content_peak:.1f}MB), '
+              f'BinaryResponse {stream_time:.3f}s (peak {stream_peak:.1f}MB)')
+
+
+if __name__ == '__main__':
+    main()
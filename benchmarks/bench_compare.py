@@ -0,0 +1,44 @@
+import argparse
+import copy
+import time
+from typing import Any, Callable
+
+from bench_excludes import generate_body
+from d42.utils import from_native
+
+from vedro_replay.compare import diff_data, is_same_data
+from vedro_replay.digest import digest_data
+
+
+def measure(fn: Callable[[], Any], repeat: int) -> float:
+    started_at = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started_at) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark of the comparison of bodies with d42 and natively')
+    parser.add_argument('--items', type=int, nargs='+', default=[10, 100, 1000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    for number_items in args.items:
+        golden = generate_body(number_items)
+        same, different = copy.deepcopy(golden), copy.deepcopy(golden)
+        different['items'][0]['name'] = 'changed'
+
+        assert from_native(golden) == same and is_same_data(golden, same)
+        assert from_native(golden) != different and not is_same_data(golden, different)
+
+        d42_time = measure(lambda: from_native(golden) == same, args.repeat)
+        native_time = measure(lambda: diff_data(golden, same), args.repeat)
+        digest_time = measure(lambda: digest_data(golden) == digest_data(same), args.repeat)
+        early_exit_time = measure(lambda: diff_data(golden, different, limit=1), args.repeat)
+        print(f'{number_items:>8} items: d42 {d42_time:.4f}s, native {native_time:.4f}s '
+              f'(x{d42_time / native_time:.1f}), digests {digest_time:.4f}s (x{d42_time / digest_time:.1f}), '
+              f'first difference {early_exit_time:.6f}s')
+
+
+if __name__ == '__main__':
+    main()
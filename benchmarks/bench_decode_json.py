@@ -0,0 +1,69 @@
+import argparse
+import json
+import random
+import time
+import tracemalloc
+from typing import Any, Callable, Dict
+
+from bench_excludes import generate_body
+
+from vedro_replay.decode_json import decode_json
+from vedro_replay.parse_excludes import compile_excludes
+
+EXCLUDES = ['debug', 'meta.request_id', 'items.*.trace', 'items.*.id:\\d+']
+
+
+def generate_heavy_body(number_queries: int) -> Dict[str, Any]:
+    # Most of the body is the debug blob, which is excluded
+    rnd = random.Random(number_queries)
+    body = generate_body(1000)
+    body['debug'] = {
+        'queries': [
+            {'sql': f'select * from items where id = {i}', 'params': [i, 'x' * 20, {'a': rnd.random()}],
+             'time': rnd.random()}
+            for i in range(number_queries)
+        ],
+        'log': [f'line {i}' for i in range(number_queries // 5)],
+    }
+    return body
+
+
+def measure(fn: Callable[[], Any], repeat: int) -> Any:
+    started_at = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    duration = (time.perf_counter() - started_at) / repeat
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return duration, peak / 2 ** 20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark of decoding of a body with large excluded subtrees')
+    parser.add_argument('--queries', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    excludes = compile_excludes(EXCLUDES)
+
+    def decode_and_exclude(content: bytes) -> Any:
+        body = json.loads(content)
+        excludes.execute(body)
+        return body
+
+    for number_queries in args.queries:
+        content = json.dumps(generate_heavy_body(number_queries)).encode()
+        assert decode_json(content, excludes) == decode_and_exclude(content)
+
+        loads_time, loads_peak = measure(lambda: decode_and_exclude(content), args.repeat)
+        stream_time, stream_peak = measure(lambda: decode_json(content, excludes), args.repeat)
+        print(f'{len(content) / 2 ** 20:>6.1f}MB body: json.loads and excludes {loads_time:.3f}s, '
+              f'peak {loads_peak:.1f}MB; decode_json {stream_time:.3f}s, peak {stream_peak:.1f}MB '
+              f'(x{loads_peak / stream_peak:.1f} less memory)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+import argparse
+import copy
+import random
+import time
+from typing import Any, Callable, Dict, List
+
+from vedro_replay.exclude import ExcludeSet
+from vedro_replay.parse_excludes import parse_excludes
+
+EXCLUDES = [
+    'meta.request_id',
+    'meta.server_time',
+    'meta.api_version:\\d+',
+    'debug',
+    'items.*.id:\\d+',
+    'items.*.updated_at',
+    'items.*.created_at',
+    'items.*.trace.span_id',
+    'items.*.trace.parent_id',
+    'items.*.price.currency_rate',
+    'items.*.price.discount.expires_at',
+    'items.*.seller.rating',
+    'items.*.seller.last_seen',
+    'items.*.images.*.url:[a-z]+',
+    'items.*.images.*.etag',
+    'items.*.variants.*.stock',
+    'items.*.variants.*.reserved',
+    'items.*.variants.*.sku:\\d+',
+    'items.*.tags.0',
+    'pagination.cursor',
+    'pagination.generated_at',
+    'experiments',
+]
+
+
+def generate_body(number_items: int) -> Dict[str, Any]:
+    rnd = random.Random(number_items)
+    return {
+        'meta': {'request_id': 'a82ec47d', 'server_time': 1700000000, 'api_version': '2_beta'},
+        'debug': {'sql': ['select 1'] * 50, 'timings': {str(i): i for i in range(50)}},
+        'experiments': [{'name': f'exp_{i}', 'group': i % 2} for i in range(20)],
+        'pagination': {'cursor': 'abc', 'generated_at': 1700000000, 'total': number_items},
+        'items': [
+            {
+                'id': f'{i}_{rnd.randint(0, 10 ** 6)}',
+                'name': f'item {i}',
+                'created_at': 1700000000 + i,
+                'updated_at': 1700000000 + i,
+                'trace': {'span_id': rnd.random(), 'parent_id': rnd.random(), 'sampled': True},
+                'price': {'value': i * 10, 'currency_rate': rnd.random(), 'discount': {'expires_at': i, 'value': 5}},
+                'seller': {'id': i % 100, 'rating': rnd.random(), 'last_seen': i},
+                'images': [{'url': f'https://cdn/{i}/{j}.png', 'etag': str(rnd.random())} for j in range(3)],
+                'variants': [{'sku': f'{i}{j}_x', 'stock': j, 'reserved': j} for j in range(4)],
+                'tags': ['new', 'sale', 'popular'],
+            }
+            for i in range(number_items)
+        ],
+    }
+
+
+def measure(fn: Callable[[Any], None], bodies: List[Any]) -> float:
+    started_at = time.perf_counter()
+    for body in bodies:
+        fn(body)
+    return time.perf_counter() - started_at
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark of the exclude engine on a large nested body')
+    parser.add_argument('--items', type=int, nargs='+', default=[100, 1000, 10000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    excludes = parse_excludes(EXCLUDES)
+    exclude_set = ExcludeSet(excludes)
+
+    def execute_per_rule(body: Any) -> None:
+        for exclude in excludes:
+            exclude.execute(body)
+
+    for number_items in args.items:
+        body = generate_body(number_items)
+
+        expected, actual = copy.deepcopy(body), copy.deepcopy(body)
+        execute_per_rule(expected)
+        exclude_set.execute(actual)
+        assert expected == actual
+
+        per_rule_time = measure(execute_per_rule, [copy.deepcopy(body) for _ in range(args.repeat)])
+        trie_time = measure(exclude_set.execute, [copy.deepcopy(body) for _ in range(args.repeat)])
+        print(f'{number_items:>8} items, {len(EXCLUDES)} excludes: '
+              f'per rule {per_rule_time / args.repeat:.4f}s, '
+              f'single traversal {trie_time / args.repeat:.4f}s '
+              f'(x{per_rule_time / trie_time:.1f})')
+
+
+if __name__ == '__main__':
+    main()
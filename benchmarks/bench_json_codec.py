@@ -0,0 +1,42 @@
+import argparse
+import json
+import time
+from typing import Any, Callable
+
+from bench_excludes import generate_body
+
+from vedro_replay.json_codec import JSON_BACKEND_JSON, JSON_BACKEND_ORJSON, JsonCodec
+
+
+def measure(fn: Callable[[], Any], repeat: int) -> float:
+    started_at = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started_at) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark of the json backends on bodies of responses')
+    parser.add_argument('--items', type=int, nargs='+', default=[10, 100, 1000, 10000])
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    codecs = {}
+    for backend in (JSON_BACKEND_JSON, JSON_BACKEND_ORJSON):
+        codecs[backend] = JsonCodec()
+        codecs[backend].configure(backend)
+
+    for number_items in args.items:
+        body = generate_body(number_items)
+        content = json.dumps(body).encode()
+        results = []
+        for backend, codec in codecs.items():
+            assert codec.loads(content) == body
+            loads_time = measure(lambda: codec.loads(content), args.repeat)
+            dumps_time = measure(lambda: codec.dumps(body), args.repeat)
+            results.append(f'{backend} loads {loads_time * 1000:.2f}ms, dumps {dumps_time * 1000:.2f}ms')
+        print(f'{len(content) / 1024:>9.1f}KB body: ' + '; '.join(results))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Tuple
+
+import httpx
+from bench_excludes import generate_body
+
+from vedro_replay import LazyMultipartResponse, MultipartResponse
+from vedro_replay.compare import compare_responses
+
+BOUNDARY = 'b0undary'
+
+
+def make_response(number_parts: int, number_items: int) -> httpx.Response:
+    content = b''
+    for _ in range(number_parts):
+        content += (f'--{BOUNDARY}\r\nContent-Type: application/json\r\n\r\n'.encode()
+                    + json.dumps(generate_body(number_items)).encode() + b'\r\n')
+    return httpx.Response(
+        200,
+        headers={'content-type': f'multipart/mixed; boundary={BOUNDARY}'},
+        content=content + f'--{BOUNDARY}--\r\n'.encode(),
+        request=httpx.Request('GET', 'http://localhost/batch'),
+    )
+
+
+def measure(fn: Callable[[], Any], repeat: int) -> Tuple[float, float]:
+    started_at = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    duration = (time.perf_counter() - started_at) / repeat
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return duration, peak / 2 ** 20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark of decoding and comparison of multipart responses')
+    parser.add_argument('--parts', type=int, nargs='+', default=[100, 500])
+    parser.add_argument('--items', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    for number_parts in args.parts:
+        golden = make_response(number_parts, args.items)
+        testing = make_response(number_parts, args.items + 1)
+
+        for response_type in (MultipartResponse, LazyMultipartResponse):
+            def compare(limit: Any) -> Any:
+                return compare_responses(
+                    response_type.from_response(golden), response_type.from_response(testing), limit
+                )
+
+            assert compare(None)
+            full_time, full_peak = measure(lambda: compare(None), args.repeat)
+            first_time, first_peak = measure(lambda: compare(1), args.repeat)
+            print(f'{number_parts:>5} parts, {len(golden.content) / 2 ** 20:.1f}MB, {response_type.__name__}: '
+                  f'all differences {full_time:.3f}s (peak {full_peak:.1f}MB), '
+                  f'first difference {first_time:.3f}s (peak {first_peak:.1f}MB)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+import argparse
+import gc
+import os
+import tempfile
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+from bench_parse_requests import generate_http_file
+
+from vedro_replay import JsonResponse
+from vedro_replay.parse_requests import iter_requests
+
+
+class DictRequest:
+    # The request with __dict__, the path parsed in __init__ and a headers dict in every request,
+    # as it was before the slotted Request
+    def __init__(self, method: str, url: str, comment: str = '', headers: Optional[Dict[Any, Any]] = None,
+                 json_body: Any = None) -> None:
+        self.comment = comment
+        self.method = method
+        self.url = url
+        self.path = urlparse(url).path
+        self.headers = headers or {}
+        self.json_body = json_body
+
+
+class DictResponse:
+    def __init__(self, status: int, headers: Dict[Any, Any], body: Any, request_url: str) -> None:
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.request_url = request_url
+
+
+def measure(fn: Callable[[], List[Any]]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    objects = fn()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / len(objects)
+
+
+def parse_dict_requests(path: str) -> List[DictRequest]:
+    # The strings of header names are copied, as they were not interned by the parser
+    return [
+        DictRequest(
+            method=request.method.encode().decode(),
+            url=request.url,
+            comment=request.comment,
+            headers={name.encode().decode(): value for name, value in request.headers.items()},
+            json_body=request.json_body,
+        )
+        for request in iter_requests(path)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark of the memory of requests and responses')
+    parser.add_argument('--requests', type=int, default=100000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'requests.http')
+        generate_http_file(path, args.requests)
+
+        dict_size = measure(lambda: parse_dict_requests(path))
+        slots_size = measure(lambda: list(iter_requests(path)))
+        print(f'{args.requests} requests: {dict_size:.0f} bytes per request with __dict__, '
+              f'{slots_size:.0f} bytes per slotted request (x{dict_size / slots_size:.2f})')
+
+    dict_size = measure(lambda: [DictResponse(200, {}, None, '/') for _ in range(args.requests)])
+    slots_size = measure(lambda: [JsonResponse(200, {}, None, '/') for _ in range(args.requests)])
+    print(f'{args.requests} responses: {dict_size:.0f} bytes per response with __dict__, '
+          f'{slots_size:.0f} bytes per slotted response')
+
+
+if __name__ == '__main__':
+    main()
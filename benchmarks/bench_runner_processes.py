@@ -0,0 +1,94 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from bench_excludes import EXCLUDES, generate_body
+
+from vedro_replay.runner import ReplayRunner
+
+HELPERS = f'''
+from vedro_replay import JsonResponse, filter_response
+
+
+def prepare_requests(response):
+    return filter_response(JsonResponse.from_response(response), ['date'], {EXCLUDES!r})
+'''
+
+SERVER = '''
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+body = open(sys.argv[2], 'rb').read()
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+ThreadingHTTPServer(('127.0.0.1', int(sys.argv[1])), Handler).serve_forever()
+'''
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark of vedro-replay run with the responses compared '
+                                                 'in the process sending requests and in a pool of processes')
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--items', type=int, default=100)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--processes', type=int, nargs='+', default=[0, os.cpu_count() or 1])
+    parser.add_argument('--port', type=int, default=18080)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.makedirs(os.path.join(tmp_dir, 'requests'))
+        with open(os.path.join(tmp_dir, 'requests', 'requests.txt'), 'w') as f:
+            f.writelines(f'/items?page={i}\n' for i in range(args.requests))
+        os.makedirs(os.path.join(tmp_dir, 'bench_helpers'))
+        with open(os.path.join(tmp_dir, 'bench_helpers', '__init__.py'), 'w') as f:
+            f.write(HELPERS)
+        with open(os.path.join(tmp_dir, 'body.json'), 'w') as f:
+            json.dump(generate_body(args.items), f)
+
+        server = subprocess.Popen([sys.executable, '-c', SERVER, str(args.port), os.path.join(tmp_dir, 'body.json')])
+        os.chdir(tmp_dir)
+        sys.path.insert(0, tmp_dir)
+        try:
+            time.sleep(1)
+            import bench_helpers
+
+            for processes in args.processes:
+                runner = ReplayRunner(
+                    golden_url=f'http://127.0.0.1:{args.port}',
+                    testing_url=f'http://127.0.0.1:{args.port}',
+                    concurrency=args.concurrency,
+                    helpers=bench_helpers,
+                    log=logging.getLogger('Runner'),
+                    timeout=60,
+                    processes=processes,
+                )
+                started_at = time.perf_counter()
+                summary = asyncio.run(runner.run(['requests/requests.txt']))
+                duration = time.perf_counter() - started_at
+                assert summary.passed == args.requests, summary.render()
+                print(f'{args.requests} requests, {args.items} items in body, {processes} processes: '
+                      f'{duration:.2f}s ({args.requests / duration:.1f} requests/s)')
+        finally:
+            server.terminate()
+
+
+if __name__ == '__main__':
+    main()
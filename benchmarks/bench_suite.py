@@ -0,0 +1,174 @@
+import argparse
+import copy
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from bench_excludes import EXCLUDES, generate_body
+from bench_parse_requests import generate_http_file
+
+from vedro_replay import JsonResponse, filter_response
+from vedro_replay.exclude import ExcludeSet
+from vedro_replay.import_requests import format_jsonl_request
+from vedro_replay.parse_excludes import ExcludeParser, parse_excludes
+from vedro_replay.parse_requests import HttpRequestParser, JsonlRequestParser
+
+BASELINES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines.json')
+
+
+class Case(NamedTuple):
+    # The data of each run is prepared outside of the measured time, e.g. a fresh copy of the body for excludes
+    run: Callable[[Any], Any]
+    prepare: Callable[[], Any] = lambda: None
+
+
+def generate_excludes(number_excludes: int) -> List[str]:
+    excludes = []
+    for i in range(number_excludes):
+        if i % 4 == 0:
+            excludes.append(f'field_{i}')
+        elif i % 4 == 1:
+            excludes.append(f'field_{i}:\\d+')
+        elif i % 4 == 2:
+            excludes.append(f'items.*.field_{i}')
+        else:
+            excludes.append(f'items.*.nested.{i % 10}.field_{i}:[a-z]+')
+    return excludes
+
+
+def generate_wide_body(number_keys: int) -> Dict[str, Any]:
+    body: Dict[str, Any] = {f'field_{i}': f'value_{i}_{i * 7}' for i in range(number_keys)}
+    body['items'] = [{f'field_{i}': i for i in range(number_keys // 10)} for _ in range(200)]
+    return body
+
+
+def generate_deep_body(depth: int, width: int) -> Dict[str, Any]:
+    body: Dict[str, Any] = {'id': depth, 'value': 'leaf'}
+    for level in range(depth - 1, -1, -1):
+        body = {'id': level, 'child': body, 'siblings': [{'id': i, 'value': str(i)} for i in range(width)]}
+    return body
+
+
+def deep_excludes(depth: int) -> List[str]:
+    return ['.'.join(['child'] * level + ['siblings', '*', 'value']) for level in range(depth)]
+
+
+def read_lines(path: str) -> List[str]:
+    with open(path) as f:
+        return f.readlines()
+
+
+def make_cases(tmp_dir: str) -> Dict[str, Case]:
+    http_path = os.path.join(tmp_dir, 'requests.http')
+    generate_http_file(http_path, 20000)
+    http_lines = read_lines(http_path)
+    jsonl_lines = [format_jsonl_request(request) for request in HttpRequestParser.parse_lines(http_lines)]
+
+    many_excludes = generate_excludes(1000)
+    body = generate_body(1000)
+    wide_body, wide_excludes = generate_wide_body(5000), ExcludeSet(parse_excludes(generate_excludes(500)))
+    deep_body, deep_exclude_set = generate_deep_body(100, 100), ExcludeSet(parse_excludes(deep_excludes(100)))
+    body_excludes = parse_excludes(EXCLUDES)
+    headers = {f'X-Header-{i}': str(i) for i in range(20)}
+
+    def execute_per_rule(data: Any) -> None:
+        for exclude in body_excludes:
+            exclude.execute(data)
+
+    return {
+        'parse_http_20k': Case(lambda _: list(HttpRequestParser.parse_lines(http_lines))),
+        'parse_jsonl_20k': Case(lambda _: list(JsonlRequestParser.parse_lines(jsonl_lines))),
+        'parse_excludes_1k': Case(lambda _: [ExcludeParser.parse(exclude) for exclude in many_excludes]),
+        'exclude_execute_per_rule': Case(execute_per_rule, lambda: copy.deepcopy(body)),
+        'exclude_set_execute': Case(ExcludeSet(body_excludes).execute, lambda: copy.deepcopy(body)),
+        'exclude_set_wide_body': Case(wide_excludes.execute, lambda: copy.deepcopy(wide_body)),
+        'exclude_set_deep_body': Case(deep_exclude_set.execute, lambda: copy.deepcopy(deep_body)),
+        'filter_response': Case(
+            lambda response: filter_response(response, ['X-Header-1', 'X-Header-2'], EXCLUDES),
+            lambda: JsonResponse(200, dict(headers), copy.deepcopy(body), '/items'),
+        ),
+    }
+
+
+def calibrate() -> Callable[[Any], Any]:
+    # Pure python work of the same kind as the benchmarks: the baselines are scaled by its time,
+    # so they can be compared on a slower or faster machine
+    def run(_: Any) -> Any:
+        data = {str(i): [i, str(i)] for i in range(100000)}
+        return sum(len(value[1]) for key, value in data.items() if key.isdigit())
+    return run
+
+
+def measure(case: Case, repeat: int) -> float:
+    # The minimum is the least noisy estimate: the other runs are only slower because of the noise
+    timings = []
+    for _ in range(repeat):
+        data = case.prepare()
+        started_at = time.perf_counter()
+        case.run(data)
+        timings.append(time.perf_counter() - started_at)
+    return min(timings)
+
+
+def load_baselines(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path) as f:
+            return json.load(f)  # type: ignore[no-any-return]
+    except FileNotFoundError:
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Suite of micro-benchmarks compared with the stored baselines')
+    parser.add_argument('--repeat', type=int, default=7)
+    parser.add_argument('--tolerance', type=float, default=20.0,
+                        help='Percents by which a benchmark may be slower than its baseline')
+    parser.add_argument('--filter', help='Run only the benchmarks containing the substring')
+    parser.add_argument('--baselines', default=BASELINES_PATH)
+    parser.add_argument('--update', action='store_true', help='Store the results as the new baselines')
+    args = parser.parse_args()
+
+    baselines = load_baselines(args.baselines)
+    calibration = measure(Case(calibrate()), args.repeat)
+    # The baselines are scaled to the speed of this machine
+    scale = calibration / baselines['calibration'] if baselines else 1.0
+
+    results: Dict[str, float] = {}
+    regressions = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, case in make_cases(tmp_dir).items():
+            if args.filter and args.filter not in name:
+                continue
+            results[name] = measure(case, args.repeat)
+            baseline = baselines['results'].get(name) if baselines else None
+            if baseline is None:
+                print(f'{name:<28} {results[name] * 1000:>9.2f}ms  (no baseline)')
+                continue
+            change = (results[name] / (baseline * scale) - 1) * 100
+            status = ''
+            if change > args.tolerance:
+                status = '  REGRESSION'
+                regressions.append(name)
+            print(f'{name:<28} {results[name] * 1000:>9.2f}ms  baseline {baseline * scale * 1000:>9.2f}ms  '
+                  f'{change:+6.1f}%{status}')
+
+    if args.update:
+        # The baselines of the benchmarks which were not run are kept
+        stored = baselines['results'] if baselines else {}
+        stored.update({name: result / scale for name, result in results.items()})
+        with open(args.baselines, 'w') as f:
+            json.dump({'calibration': baselines['calibration'] if baselines else calibration,
+                       'results': stored}, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f'Baselines are stored in {args.baselines}')
+    elif regressions:
+        print(f'{len(regressions)} benchmarks are more than {args.tolerance:g}% slower than the baselines: '
+              f'{", ".join(regressions)}')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
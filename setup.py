@@ -19,6 +19,9 @@ setup(
     license="Apache-2.0",
     packages=['vedro_replay'],
     install_requires=find_required(),
+    extras_require={
+        "orjson": ["orjson>=3.6.0,<4.0.0"],
+    },
     classifiers=[
         "License :: OSI Approved :: Apache Software License",
         "Programming Language :: Python :: 3.9",
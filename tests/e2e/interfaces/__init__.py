@@ -1,3 +1,3 @@
-from .cli import VedroReplayCLI, VedroTestCLI
+from .cli import VedroReplayCLI, VedroReplayRunCLI, VedroTestCLI
 
-__all__ = ("VedroTestCLI", "VedroReplayCLI")
+__all__ = ("VedroTestCLI", "VedroReplayCLI", "VedroReplayRunCLI")
@@ -20,13 +20,14 @@ class AbstractCLI(ABC, vedro.Interface):
 
 
 class VedroReplayCLI(AbstractCLI):
-    def __init__(self, dir_launch: str, dir_requests: str) -> None:
+    def __init__(self, dir_launch: str, dir_requests: str, options: str = '') -> None:
         self.dir_launch = dir_launch
         self.dir_requests = dir_requests
+        self.options = options
 
     async def run(self) -> Tuple[str, str]:
         return await self._run(
-            command=f'vedro-replay generate {self.__requests_dir()}',
+            command=f'vedro-replay generate {self.__requests_dir()} {self.options}',
             cwd=f'{os.getcwd()}/{self.dir_launch}'
         )
 
@@ -34,6 +35,18 @@ class VedroReplayCLI(AbstractCLI):
         return '' if self.dir_requests == 'requests' else f'--requests-dir={self.dir_requests}'
 
 
+class VedroReplayRunCLI(AbstractCLI):
+    def __init__(self, dir_launch: str, options: str = '') -> None:
+        self.dir_launch = dir_launch
+        self.options = options
+
+    async def run(self) -> Tuple[str, str]:
+        return await self._run(
+            command=f'vedro-replay run {self.options}',
+            cwd=f'{os.getcwd()}/{self.dir_launch}'
+        )
+
+
 class VedroTestCLI(AbstractCLI):
     def __init__(self, dir_launch: str) -> None:
         self.dir_launch = dir_launch
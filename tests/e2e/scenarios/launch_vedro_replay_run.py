@@ -0,0 +1,50 @@
+import os
+
+import vedro
+from contexts import added_request_file, execution_directory, mocked_api
+from interfaces import VedroReplayCLI, VedroReplayRunCLI
+from jj_d42 import HistorySchema
+from vedro import params
+
+from vedro_replay import parse_requests
+
+
+class Scenario(vedro.Scenario):
+    subject = 'launch vedro-replay run without vedro tests: {options}'
+
+    @params('--concurrency=4')
+    @params('--concurrency=4 --processes=2')
+    @params('--concurrency=4 --latency-group-by=path')
+    def __init__(self, options):
+        self.dir_launch = 'launch'
+        self.dir_requests = 'requests'
+        self.files_requests = ['get_1_0_items.http', 'post_v2_admin_users.http']
+        self.options = options
+
+    def given_prepared_execution_directory(self):
+        execution_directory(dir_launch=self.dir_launch)
+
+    def given_added_files_with_requests(self):
+        self.requests = []
+        for file_requests in self.files_requests:
+            added_request_file(os.path.join(self.dir_launch, self.dir_requests, file_requests))
+            self.requests += parse_requests(os.path.join('test_data', file_requests))
+
+    async def given_generated_helpers(self):
+        await VedroReplayCLI(dir_launch=self.dir_launch, dir_requests=self.dir_requests).run()
+
+    async def when_requests_replayed(self):
+        async with mocked_api() as self.api_mock:
+            self.stdout, self.stderr = await VedroReplayRunCLI(
+                dir_launch=self.dir_launch,
+                options=self.options
+            ).run()
+
+    def then_requests_ended_with_correct_statistics(self):
+        assert f'{len(self.requests)} passed, 0 failed, 0 errors' in self.stderr
+
+    def and_then_number_requests_sent_should_be_correct(self):
+        assert self.api_mock.history == HistorySchema.len(len(self.requests) * 2)
+
+    def and_then_latency_should_be_reported_if_grouped(self):
+        assert ('Latency of golden -> testing, ms:' in self.stderr) == ('--latency-group-by' in self.options)
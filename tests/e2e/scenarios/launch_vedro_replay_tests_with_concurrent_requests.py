@@ -0,0 +1,55 @@
+import os
+
+import vedro
+from contexts import added_request_file, execution_directory, mocked_api
+from interfaces import VedroReplayCLI, VedroTestCLI
+from jj_d42 import HistorySchema
+from vedro import params
+
+from vedro_replay import parse_requests
+
+
+class Scenario(vedro.Scenario):
+    subject = 'launch vedro-replay tests generated with {options}'
+
+    @params('--concurrent')
+    @params('--concurrent --comparison native')
+    def __init__(self, options):
+        self.options = options
+        self.dir_launch = 'launch'
+        self.dir_requests = 'requests'
+        self.file_requests = 'post_v2_admin_users.http'
+
+    def given_prepared_execution_directory(self):
+        execution_directory(dir_launch=self.dir_launch)
+
+    def given_added_file_with_requests(self):
+        added_request_file(os.path.join(self.dir_launch, self.dir_requests, self.file_requests))
+        self.requests = parse_requests(os.path.join('test_data', self.file_requests))
+
+    async def given_vedro_replay_tests(self):
+        self.stdout_vedro_replay, self.stderr_vedro_replay = await VedroReplayCLI(
+            dir_launch=self.dir_launch,
+            dir_requests=self.dir_requests,
+            options=self.options
+        ).run()
+
+    async def when_replay_tests_running(self):
+        async with mocked_api() as self.api_mock:
+            self.stdout_vedro_test, self.stderr_vedro_test = await VedroTestCLI(
+                dir_launch=self.dir_launch
+            ).run()
+
+    def then_tests_ended_with_correct_statistics(self):
+        assert f'# {len(self.requests)} scenarios, {len(self.requests)} passed' in self.stdout_vedro_test
+
+    def and_then_number_requests_sent_should_be_correct(self):
+        assert self.api_mock.history == HistorySchema % [
+            {
+                'request': {
+                    'method': request.method,
+                    'path': request.path,
+                    'body': request.json_body,
+                }
+            } for request in [r for r in reversed(self.requests) for _ in range(2)]
+        ]
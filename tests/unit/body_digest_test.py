@@ -0,0 +1,131 @@
+import asyncio
+import os
+
+import httpx
+import pytest
+
+from vedro_replay import (
+    BinaryResponse,
+    BodyDigest,
+    Request,
+    SnapshotStore,
+    TextResponse,
+    filter_response,
+)
+from vedro_replay.compare import Difference, compare_responses
+
+CONTENT = os.urandom(100_000)
+
+
+def make_digest(content: bytes, chunk_size: int = 1 << 16) -> BodyDigest:
+    body_digest = BodyDigest()
+    for position in range(0, len(content), chunk_size):
+        body_digest.update(content[position:position + chunk_size])
+    return body_digest
+
+
+def change_byte(content: bytes, offset: int) -> bytes:
+    return content[:offset] + bytes([content[offset] ^ 1]) + content[offset + 1:]
+
+
+def make_response(content: bytes = CONTENT, headers=None, stream: bool = False) -> httpx.Response:
+    return httpx.Response(
+        200,
+        headers={"content-type": "image/png", "date": "Mon, 01 Jan 2024 00:00:00 GMT", **(headers or {})},
+        **({"stream": httpx.ByteStream(content)} if stream else {"content": content}),
+        request=httpx.Request("GET", "http://localhost/image.png"),
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [1, 1000, 4096, 1 << 16])
+def test_digest_does_not_depend_on_chunks(chunk_size):
+    body_digest = make_digest(CONTENT[:20_000], chunk_size)
+    expected = make_digest(CONTENT[:20_000])
+
+    assert body_digest == expected
+    assert body_digest.to_dict() == expected.to_dict()
+    assert body_digest.size == 20_000
+
+
+@pytest.mark.parametrize("testing,offset", [
+    pytest.param(CONTENT, None, id="same"),
+    pytest.param(change_byte(CONTENT, 0), 0, id="first byte"),
+    pytest.param(change_byte(CONTENT, 12345), 12288, id="middle byte"),
+    pytest.param(change_byte(CONTENT, 99_999), 98304, id="last byte out of complete blocks"),
+    pytest.param(change_byte(CONTENT, 100)[:-1], 0, id="shorter with difference"),
+    pytest.param(CONTENT[:50_000], None, id="shorter"),
+    pytest.param(CONTENT + b"\x00", None, id="longer"),
+])
+def test_find_difference(testing, offset):
+    assert make_digest(CONTENT).find_difference(make_digest(testing)) == offset
+
+
+def test_number_of_blocks_is_bounded(monkeypatch):
+    monkeypatch.setattr(BodyDigest, "MAX_BLOCKS", 4)
+    golden = make_digest(CONTENT)
+    testing = make_digest(change_byte(CONTENT, 70_000))
+
+    assert golden.block_size == testing.block_size == 16384
+    assert len(golden.to_dict()["blocks"]) // 16 == 6
+    assert golden.find_difference(testing) == 65536
+    assert make_digest(CONTENT[:40_000]).find_difference(make_digest(change_byte(CONTENT, 20_000))) == 16384
+
+
+@pytest.mark.parametrize("golden,testing,differences", [
+    (make_response(), make_response(), []),
+    (make_response(), make_response(change_byte(CONTENT, 5000)), [Difference("body.4096", "value")]),
+    (make_response(), make_response(CONTENT + b"\x00"),
+     [Difference("headers.content-length", "value"), Difference("body", "size")]),
+    (make_response(), make_response(headers={"content-type": "image/jpeg"}),
+     [Difference("headers.content-type", "value")]),
+])
+def test_compare_binary_responses(golden, testing, differences):
+    assert compare_responses(BinaryResponse.from_response(golden),
+                             BinaryResponse.from_response(testing)) == differences
+
+
+def test_filter_binary_response():
+    response = filter_response(BinaryResponse.from_response(make_response()), ["date"], ["id"])
+
+    assert response.headers == {"content-type": "image/png", "content-length": str(len(CONTENT))}
+    assert response.body == make_digest(CONTENT)
+
+
+def test_binary_response_is_streamed():
+    response = make_response(stream=True)
+    binary_response = BinaryResponse.from_response(response)
+
+    assert binary_response.body == make_digest(CONTENT)
+    assert not hasattr(response, "_content")
+
+
+def test_binary_response_from_async_stream():
+    response = make_response(stream=True)
+    binary_response = asyncio.run(BinaryResponse.from_stream(response))
+
+    assert binary_response.body == make_digest(CONTENT)
+    assert response.is_closed
+
+
+def test_text_response():
+    text = "Привет, мир!\n" * 1000
+    golden = make_response(text.encode("utf-8"), {"content-type": "text/plain; charset=utf-8"})
+    testing = make_response(text.encode("cp1251"), {"content-type": "text/plain; charset=cp1251"})
+
+    assert TextResponse.from_response(golden).body == TextResponse.from_response(testing).body
+    assert BinaryResponse.from_response(golden).body != BinaryResponse.from_response(testing).body
+
+
+@pytest.mark.parametrize("response_type", [BinaryResponse, TextResponse])
+def test_binary_snapshot(tmp_path, response_type):
+    content = b"id,name\n" + b"1,chair\n" * 10_000
+    store = SnapshotStore(str(tmp_path), mode=SnapshotStore.MODE_USE)
+    request = Request(method="GET", url="/items.csv")
+    store.save(request, "prepare_items", response_type.from_response(make_response(content)))
+    snapshot = store.load(request, "prepare_items")
+
+    assert isinstance(snapshot, response_type)
+    assert snapshot.body == make_digest(content)
+    assert compare_responses(snapshot, response_type.from_response(make_response(change_byte(content, 9000)))) == [
+        Difference("body.8192", "value")
+    ]
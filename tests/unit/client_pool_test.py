@@ -0,0 +1,31 @@
+import asyncio
+
+from vedro_replay import ClientPool
+
+
+def test_client_pool_shares_client_by_base_url():
+    async def get_clients():
+        pool = ClientPool()
+        clients = [pool.get("http://golden"), pool.get("http://golden"), pool.get("http://testing")]
+        await pool.aclose()
+        return clients
+
+    golden_client, same_golden_client, testing_client = asyncio.run(get_clients())
+
+    assert golden_client is same_golden_client
+    assert golden_client is not testing_client
+    assert golden_client.is_closed and testing_client.is_closed
+
+
+def test_client_pool_creates_client_after_close():
+    async def get_clients():
+        pool = ClientPool()
+        client = pool.get("http://golden")
+        await pool.aclose()
+        new_client = pool.get("http://golden")
+        await pool.aclose()
+        return client, new_client
+
+    client, new_client = asyncio.run(get_clients())
+
+    assert client is not new_client
@@ -0,0 +1,81 @@
+import pytest
+
+from vedro_replay import Difference, JsonResponse, assert_same_data, diff_data, is_same_data
+from vedro_replay.compare import compare_responses
+from vedro_replay.digest import digest_data
+
+
+def response(body, status=200, headers=None) -> JsonResponse:
+    return JsonResponse(status=status, headers=headers or {}, body=body, request_url="/")
+
+
+@pytest.mark.parametrize("golden,testing,differences", [
+    ({"a": [1, {"b": None}]}, {"a": [1, {"b": None}]}, []),
+    ({"a": 1}, {"a": 2}, [Difference("a", "value")]),
+    ({"a": 1}, {"a": 1.0}, [Difference("a", "type")]),
+    ({"a": 1}, {"a": True}, [Difference("a", "type")]),
+    ({"a": {"b": 1}}, {"a": [1]}, [Difference("a", "type")]),
+    ({"a": 1, "b": 2}, {"b": 2, "c": 3}, [Difference("a", "missing key"), Difference("c", "extra key")]),
+    ({"items": [1, 2]}, {"items": [1]}, [Difference("items.1", "missing element")]),
+    ({"items": [1]}, {"items": [1, 2]}, [Difference("items.1", "extra element")]),
+    ({"items": [{"id": 1}]}, {"items": [{"id": 2}]}, [Difference("items.0.id", "value")]),
+    ([1, 2], [1, 3], [Difference("1", "value")]),
+    ("a", "b", [Difference("", "value")]),
+])
+def test_diff_data(golden, testing, differences):
+    assert diff_data(golden, testing) == differences
+
+
+def test_diff_data_with_path():
+    assert diff_data({"id": 1}, {"id": 2}, "body") == [Difference("body.id", "value")]
+
+
+@pytest.mark.parametrize("limit,paths", [
+    (None, ["0", "1", "2", "3", "4"]),
+    (1, ["0"]),
+    (3, ["0", "1", "2"]),
+])
+def test_diff_data_limit(limit, paths):
+    assert [d.path for d in diff_data([1, 2, 3, 4, 5], [0, 0, 0, 0, 0], limit=limit)] == paths
+
+
+@pytest.mark.parametrize("golden,testing,result", [
+    ({"a": [1, 2]}, {"a": [1, 2]}, True),
+    ({"a": [1, 2]}, {"a": [2, 1]}, False),
+    ({"a": 0}, {"a": False}, False),
+])
+def test_is_same_data(golden, testing, result):
+    assert is_same_data(golden, testing) is result
+
+
+def test_assert_same_data():
+    assert_same_data({"a": 1}, {"a": 1}, "body")
+
+    with pytest.raises(AssertionError) as exc_info:
+        assert_same_data({"a": 1, "b": [1]}, {"a": 2, "b": []}, "body")
+
+    assert str(exc_info.value) == ("The testing body differs from the golden one:\n"
+                                   "  body.a: value\n"
+                                   "  body.b.0: missing element")
+
+
+@pytest.mark.parametrize("golden,testing,same_digest", [
+    ({"a": 1, "b": [1, 2]}, {"b": [1, 2], "a": 1}, True),
+    ({"a": [1, 2]}, {"a": [2, 1]}, False),
+    ({"a": 1}, {"a": 1.0}, False),
+    ({"a": 1}, {"a": True}, False),
+    ({"a": None}, {}, False),
+])
+def test_digest_data(golden, testing, same_digest):
+    assert (digest_data(golden) == digest_data(testing)) is same_digest
+    assert is_same_data(golden, testing) is same_digest
+
+
+@pytest.mark.parametrize("golden,testing,same_digest", [
+    (response({"a": 1, "b": 2}), response({"b": 2, "a": 1}), True),
+    (response({"a": 1}, headers={"x": "1"}), response({"a": 1}, headers={"x": "2"}), False),
+    (response({"a": 1}), response({"a": 1}, status=500), False),
+])
+def test_response_digest(golden, testing, same_digest):
+    assert (golden.digest() == testing.digest()) is same_digest
+    assert (compare_responses(golden, testing) == []) is same_digest
@@ -0,0 +1,71 @@
+import json
+from json import JSONDecodeError
+
+import httpx
+import pytest
+
+from vedro_replay import JsonResponse, compile_excludes
+from vedro_replay.decode_json import decode_json
+
+BODY = {
+    "meta": {"api_version": "v12", "request_id": "a82ec47d"},
+    "debug": {"sql": ["select 1", "select \"}]\""], "timings": [{"a": [1, {"b": None}]}], "log": "\\[{"},
+    "items": [
+        {"id": "1_abc", "name": "chair", "trace": {"span_id": 1}, "tags": ["new", "sale"]},
+        {"id": "2_sdv", "name": "table", "trace": [], "tags": []},
+        {"id": "3_xé", "name": "lamp"},
+    ],
+    "matrix": [[{"id": 1, "v": 1}], [{"id": 2, "v": 2}]],
+    "esc\\aped": {"k\"ey": 1},
+    "codes": ["a1", {"x": "b2"}],
+}
+
+
+@pytest.mark.parametrize("excludes", [
+    [],
+    ["debug"],
+    ["debug", "meta.request_id", "items.*.trace"],
+    ["meta.api_version:\\d+", "items.*.id:\\d+"],
+    ["items.*.tags.0", "items.1"],
+    ["items.*"],
+    ["matrix.*.*.id"],
+    ["esc\\aped.k\"ey", "missing.key", "debug.sql.*"],
+    ["codes.*:\\d+", "codes.*.x:\\d+"],
+])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_decode_json(excludes, indent):
+    expected = json.loads(json.dumps(BODY))
+    compile_excludes(excludes).execute(expected)
+
+    assert decode_json(json.dumps(BODY, indent=indent), excludes) == expected
+    assert decode_json(json.dumps(BODY, indent=indent, ensure_ascii=False).encode(), excludes) == expected
+
+
+@pytest.mark.parametrize("data", ["[1, 2]", "\"debug\"", "1.5", "null", " {} "])
+def test_decode_json_scalars_and_empty(data):
+    assert decode_json(data, ["debug"]) == json.loads(data)
+
+
+@pytest.mark.parametrize("data", [
+    "",
+    "{\"a\": 1",
+    "{\"a\" 1}",
+    "{\"a\": 1 \"b\": 2}",
+    "{a: 1}",
+    "[1 2]",
+    "{\"a\": }",
+    "{\"debug\": [1, 2}",
+    "{} []",
+])
+def test_decode_json_errors(data):
+    with pytest.raises(JSONDecodeError):
+        decode_json(data, ["debug"])
+
+
+def test_json_response_with_exclude_body():
+    response = httpx.Response(200, json=BODY, request=httpx.Request("GET", "http://localhost/items"))
+    expected = json.loads(json.dumps(BODY))
+    compile_excludes(["debug", "items.*.trace"]).execute(expected)
+
+    assert JsonResponse.from_response(response, ["debug", "items.*.trace"]).body == expected
+    assert JsonResponse.from_response(response).body == BODY
@@ -2,7 +2,8 @@ from typing import Any, Dict, List
 
 import pytest
 
-from vedro_replay import filter_data
+from vedro_replay import JsonResponse, compile_excludes, filter_data, filter_response
+from vedro_replay.exclude import IncorrectExclude
 
 
 @pytest.mark.parametrize("data,excludes,expected_data", [
@@ -78,8 +79,63 @@ from vedro_replay import filter_data
         {"data": [{"id": 123}, {"id": 124}]},
         id='cutting list item by not numeric index'
     ),
+    pytest.param(
+        {"data": [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}, {"id": 3, "name": "c"}]},
+        ["data.*.id", "data.0", "data.0"],
+        {"data": [{"name": "c"}]},
+        id='cutting by list items and sequentially by indexes'
+    ),
+    pytest.param(
+        {"data": {"id": "12_ab", "meta": {"rand": 1, "version": "2"}}, "random": 3},
+        ["data.meta.rand", r"data.id:\d+", "random", "data.meta.missing", r"data.id:\d"],
+        {"data": {"id": "1", "meta": {"version": "2"}}},
+        id='cutting by multiple paths with common prefix'
+    ),
+    pytest.param(
+        {"data": {"id": "12_ab", "items": [{"id": 1}]}},
+        [r"data.id:\d+", "data", "data.items.*.id"],
+        {},
+        id='cutting a path and its nested paths'
+    ),
+    pytest.param(
+        {"data": [{"id": "123"}, {"id": "124_ab"}, {"id": "id"}]},
+        [r"data.*.id:\d+"],
+        {"data": [{"id": "123"}, {"id": "124"}, {"id": "id"}]},
+        id='cutting out values consisting of digits by a regular expression'
+    ),
 ])
 def test_exclude(data: Dict[str, Any], excludes: List[str], expected_data: Dict[str, Any]):
     filter_data(excludes, data)
 
     assert data == expected_data
+
+
+def test_compile_excludes_is_cached():
+    exclude_set = compile_excludes(["data.id", "meta"])
+
+    assert compile_excludes(["data.id", "meta"]) is exclude_set
+    assert compile_excludes(exclude_set) is exclude_set
+    assert compile_excludes(["meta"]) is not exclude_set
+
+
+def test_filter_response_by_compiled_excludes():
+    response = JsonResponse(
+        status=200,
+        headers={"date": "Mon, 01 Jan 2024", "content-type": "application/json"},
+        body=[{"id": 1, "random": 5}, {"id": 2, "random": 7}],
+        request_url="/"
+    )
+
+    filter_response(response, compile_excludes(["date"]), compile_excludes(["random"]))
+
+    assert response.headers == {"content-type": "application/json"}
+    assert response.body == [{"id": 1}, {"id": 2}]
+
+
+@pytest.mark.parametrize("excludes", [
+    pytest.param([r"data:\d+("], id='incorrect regular expression'),
+    pytest.param([":\\d+"], id='empty path'),
+])
+def test_compile_incorrect_excludes(excludes: List[str]):
+    with pytest.raises(IncorrectExclude):
+        compile_excludes(excludes)
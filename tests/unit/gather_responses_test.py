@@ -0,0 +1,30 @@
+import asyncio
+
+import pytest
+
+from vedro_replay import JsonResponse, gather_responses
+
+
+async def response(status: int, delay: float = 0) -> JsonResponse:
+    await asyncio.sleep(delay)
+    return JsonResponse(status=status, headers={}, body={}, request_url="/")
+
+
+async def failure(delay: float = 0) -> JsonResponse:
+    await asyncio.sleep(delay)
+    raise ConnectionError("testing host is unavailable")
+
+
+def test_gather_responses():
+    responses = asyncio.run(gather_responses(response(200, delay=0.01), response(500)))
+
+    assert responses.golden().status == 200
+    assert responses.testing().status == 500
+
+
+def test_gather_responses_with_failure():
+    responses = asyncio.run(gather_responses(response(200, delay=0.01), failure()))
+
+    assert responses.golden().status == 200
+    with pytest.raises(ConnectionError):
+        responses.testing()
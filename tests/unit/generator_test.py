@@ -0,0 +1,32 @@
+import logging
+
+import pytest
+
+from vedro_replay.generator import COMPARISONS, MainGenerator
+
+
+def generate_project(tmp_path, monkeypatch, concurrent: bool, comparison: str) -> None:
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "requests").mkdir()
+    (tmp_path / "requests" / "get_items.http").write_text("### items\nGET https://{{host}}/items\n")
+    MainGenerator("requests", force=True, log=logging.getLogger("Generator"), concurrent=concurrent,
+                  comparison=comparison).all()
+
+
+@pytest.mark.parametrize("comparison", COMPARISONS)
+@pytest.mark.parametrize("concurrent", [False, True])
+def test_generated_scenario_ends_with_newline(tmp_path, monkeypatch, concurrent, comparison):
+    generate_project(tmp_path, monkeypatch, concurrent, comparison)
+
+    content = (tmp_path / "scenarios" / "get_items.py").read_text()
+
+    assert content.endswith(")\n")
+
+
+@pytest.mark.parametrize("file_path", ["contexts/api.py", "interfaces/api.py", "vedro.cfg.py"])
+def test_generated_file_ends_with_newline(tmp_path, monkeypatch, file_path):
+    generate_project(tmp_path, monkeypatch, concurrent=False, comparison=COMPARISONS[0])
+
+    content = (tmp_path / file_path).read_text()
+
+    assert content.endswith("\n") and not content.endswith("\n\n")
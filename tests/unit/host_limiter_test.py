@@ -0,0 +1,90 @@
+import asyncio
+
+import httpx
+import pytest
+
+from vedro_replay.host_limiter import AdaptiveLimit, HostLimiter, LimitedTransport, TokenBucket
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_bucket():
+    clock = Clock()
+    bucket = TokenBucket(rate=2, clock=clock)
+
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+
+    clock.now = 2.0
+    assert bucket.reserve() == 0.0
+
+
+@pytest.mark.parametrize("latencies,limit", [
+    ([0.1] * 2, 2.5),
+    ([0.1, 0.1, 0.5], 2.5 * 0.75),
+])
+def test_adaptive_limit(latencies, limit):
+    adaptive_limit = AdaptiveLimit(max_limit=10, latency_tolerance=2.0, backoff=0.75, clock=Clock())
+
+    for latency in latencies:
+        adaptive_limit.on_success(started_at=0.0, latency=latency)
+
+    assert adaptive_limit.limit == pytest.approx(limit, rel=0.05)
+
+
+def test_adaptive_limit_decreases_once_per_window():
+    clock = Clock()
+    adaptive_limit = AdaptiveLimit(max_limit=10, clock=clock)
+    adaptive_limit.limit = 8.0
+
+    clock.now = 1.0
+    adaptive_limit.on_failure(started_at=0.5)
+    adaptive_limit.on_failure(started_at=0.6)
+    assert adaptive_limit.limit == 6.0
+
+    adaptive_limit.on_failure(started_at=1.5)
+    assert adaptive_limit.limit == 4.5
+
+
+def test_adaptive_limit_bounds():
+    adaptive_limit = AdaptiveLimit(max_limit=2, min_limit=1, clock=Clock())
+
+    for _ in range(10):
+        adaptive_limit.on_success(started_at=0.0, latency=0.1)
+    assert adaptive_limit.limit == 2
+
+    for _ in range(10):
+        adaptive_limit.on_failure(started_at=float("inf"))
+    assert adaptive_limit.limit == 1
+
+
+@pytest.mark.parametrize("status,limit", [
+    (200, 3),
+    (503, 2),
+])
+def test_limited_transport_bounds_concurrency(status, limit):
+    max_in_flight = 0
+    limiter = HostLimiter(adaptive_limit=AdaptiveLimit(max_limit=3, min_limit=2))
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal max_in_flight
+        max_in_flight = max(max_in_flight, limiter.in_flight)
+        await asyncio.sleep(0.01)
+        return httpx.Response(status)
+
+    async def send_requests():
+        transport = LimitedTransport(httpx.MockTransport(handler), limiter)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testing") as client:
+            return await asyncio.gather(*[client.get("/") for _ in range(20)])
+
+    responses = asyncio.run(send_requests())
+
+    assert len(responses) == 20
+    assert max_in_flight == limit
+    assert limiter.in_flight == 0
+    assert limiter.adaptive_limit.limit == limit
@@ -0,0 +1,169 @@
+import io
+import json
+
+import pytest
+
+from vedro_replay import Request, parse_requests
+from vedro_replay.import_requests import (
+    IncorrectSource,
+    RequestFilter,
+    RequestWriter,
+    UnsupportedRequest,
+    get_endpoint_name,
+    import_sources,
+    iter_access_log_requests,
+    iter_har_entries,
+    iter_har_requests,
+)
+
+
+def har(entries):
+    return json.dumps({"log": {"version": "1.2", "creator": {"name": "test"}, "pages": [], "entries": entries}})
+
+
+def har_entry(method, url, headers=None, text=None):
+    request = {"method": method, "url": url, "headers": [{"name": k, "value": v} for k, v in (headers or {}).items()]}
+    if text is not None:
+        request["postData"] = {"mimeType": "application/json", "text": text}
+    return {"startedDateTime": "2023-10-10T13:55:36.000Z", "request": request, "response": {"status": 200}}
+
+
+def test_iter_access_log_requests():
+    lines = [
+        '10.0.0.1 - - [10/Oct/2023:13:55:36 +0000] "GET /api/users/1?full=1 HTTP/1.1" 200 12 "-" "curl/8.0"\n',
+        '10.0.0.1 - - [10/Oct/2023:13:55:37 +0000] "-" 400 0 "-" "-"\n',
+        '10.0.0.1 - - [10/Oct/2023:13:55:38 +0000] "POST http://api.example.com/search HTTP/2.0" 200 1 "-" "-"\n',
+    ]
+
+    requests = list(iter_access_log_requests(lines, "access.log"))
+
+    assert [(r.method, r.url, r.comment) for r in requests] == [
+        ("GET", "/api/users/1?full=1", "access.log:1"),
+        ("POST", "/search", "access.log:3"),
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+def test_iter_har_entries_by_chunks(chunk_size):
+    entries = [har_entry("GET", f"https://api.example.com/items/{i}", text="x" * i * 10) for i in range(20)]
+
+    assert list(iter_har_entries(io.StringIO(har(entries)), chunk_size=chunk_size)) == entries
+
+
+@pytest.mark.parametrize("content", [
+    pytest.param('{"log": {"version": "1.2"}}', id='without entries'),
+    pytest.param('{"log": {"entries": [{"request": {}}, {"request": ', id='unexpected end'),
+    pytest.param('{"log": {"entries": [1, 2]}}', id='entry not object'),
+])
+def test_iter_har_entries_with_incorrect_source(content):
+    with pytest.raises(IncorrectSource):
+        list(iter_har_entries(io.StringIO(content), chunk_size=4))
+
+
+def test_iter_har_requests():
+    entries = [
+        har_entry("POST", "https://api.example.com/v2/admin-users?x=1",
+                  headers={":authority": "api.example.com", "Host": "api.example.com",
+                           "Content-Type": "application/json"},
+                  text='{"name": "John"}'),
+        har_entry("POST", "https://api.example.com/form", text="name=John"),
+    ]
+
+    request, unsupported = iter_har_requests(io.StringIO(har(entries)), "traffic.har")
+
+    assert (request.method, request.url, request.comment) == ("POST", "/v2/admin-users?x=1", "traffic.har:1")
+    assert request.headers == {"Content-Type": "application/json"}
+    assert request.json_body == {"name": "John"}
+    assert isinstance(unsupported, UnsupportedRequest)
+
+
+@pytest.mark.parametrize("headers", [
+    [{"value": "application/json"}],
+    [{"name": "Content-Type"}],
+    [{"name": "X-Count", "value": 1}],
+    ["Content-Type: application/json"],
+])
+def test_iter_har_requests_with_incorrect_headers(headers):
+    entry = har_entry("GET", "https://api.example.com/items")
+    entry["request"]["headers"] = headers
+    entries = [entry, har_entry("GET", "https://api.example.com/users")]
+
+    unsupported, request = iter_har_requests(io.StringIO(har(entries)), "traffic.har")
+
+    assert isinstance(unsupported, UnsupportedRequest)
+    assert request.url == "/users"
+
+
+@pytest.mark.parametrize("method,url,endpoint_name", [
+    ("GET", "/", "get_root"),
+    ("GET", "/1.0/items?id=1", "get_1_0_items"),
+    ("POST", "/v2/admin-users", "post_v2_admin_users"),
+    ("GET", "/users/123/orders/5f1d7e3a9b1e8a6c2d3b4a59", "get_users_orders"),
+    ("DELETE", "/users/25b4fe6e-89d1-4b1a-8bd9-05624f7e7488", "delete_users"),
+])
+def test_get_endpoint_name(method, url, endpoint_name):
+    assert get_endpoint_name(Request(method=method, url=url)) == endpoint_name
+
+
+@pytest.mark.parametrize("methods,path_pattern,expected", [
+    (None, None, True),
+    (["get"], None, True),
+    (["POST"], None, False),
+    (None, r"^/api/", True),
+    (["GET"], r"^/admin", False),
+])
+def test_request_filter(methods, path_pattern, expected):
+    assert RequestFilter(methods, path_pattern)(Request(method="GET", url="/api/users?id=1")) is expected
+
+
+@pytest.mark.parametrize("output_format", ["http", "jsonl"])
+def test_import_sources(tmp_path, output_format):
+    access_log = tmp_path / "access.log"
+    access_log.write_text("".join(
+        f'10.0.0.1 - - [10/Oct/2023:13:55:36 +0000] "GET /users/{i}?full=1 HTTP/1.1" 200 12 "-" "-"\n'
+        for i in range(5)
+    ))
+    traffic = tmp_path / "traffic.har"
+    traffic.write_text(har([
+        har_entry("POST", "https://api.example.com/users", headers={"X-Request-Id": "1"}, text='[{"id": 1}]'),
+        har_entry("POST", "https://api.example.com/form", text="name=John"),
+        har_entry("GET", "https://api.example.com/admin"),
+    ]))
+    writer = RequestWriter(str(tmp_path / "requests"), output_format, max_open_files=1)
+
+    stats = import_sources([str(access_log), str(traffic)], writer, RequestFilter(path_pattern="^/users"))
+
+    assert stats == {"imported": 6, "filtered": 1, "unsupported": 1}
+    get_requests = parse_requests(str(tmp_path / "requests" / f"get_users.{output_format}"))
+    assert [r.url for r in get_requests] == [f"/users/{i}?full=1" for i in range(5)]
+    post_request, = parse_requests(str(tmp_path / "requests" / f"post_users.{output_format}"))
+    assert post_request.headers == {"X-Request-Id": "1"}
+    assert post_request.json_body == [{"id": 1}]
+
+
+def test_import_sources_doesnt_overwrite_files(tmp_path):
+    access_log = tmp_path / "access.log"
+    access_log.write_text('10.0.0.1 - - [10/Oct/2023:13:55:36 +0000] "GET /users HTTP/1.1" 200 12 "-" "-"\n')
+    (tmp_path / "requests").mkdir()
+    (tmp_path / "requests" / "get_users.http").write_text("### manual\nGET https://{{host}}/users?id=1\n")
+
+    stats = import_sources([str(access_log)], RequestWriter(str(tmp_path / "requests")), RequestFilter())
+
+    assert stats == {"skipped": 1}
+    assert parse_requests(str(tmp_path / "requests" / "get_users.http"))[0].comment == "manual"
+
+
+def test_import_sources_with_deduplication_and_sampling(tmp_path):
+    access_log = tmp_path / "access.log"
+    access_log.write_text("".join(
+        f'10.0.0.1 - - [10/Oct/2023:13:55:36 +0000] "GET /search?q={i % 4} HTTP/1.1" 200 12 "-" "-"\n'
+        for i in range(20)
+    ))
+    writer = RequestWriter(str(tmp_path / "requests"))
+
+    stats = import_sources([str(access_log)], writer, RequestFilter(), deduplicate=True, sample=3)
+
+    assert stats == {"imported": 3, "duplicates": 16, "sampled out": 1}
+    assert [r.url for r in parse_requests(str(tmp_path / "requests" / "get_search.http"))] == [
+        "/search?q=0", "/search?q=1", "/search?q=2"
+    ]
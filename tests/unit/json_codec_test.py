@@ -0,0 +1,97 @@
+import math
+from json import JSONDecodeError
+
+import httpx
+import pytest
+
+from vedro_replay import JsonResponse, Request, parse_requests
+from vedro_replay.compare import compare_responses
+from vedro_replay.json_codec import (
+    JSON_BACKEND_JSON,
+    JSON_BACKEND_ORJSON,
+    JSON_BACKENDS,
+    JsonCodec,
+)
+
+
+def make_codec(backend: str) -> JsonCodec:
+    codec = JsonCodec()
+    codec.configure(backend)
+    return codec
+
+
+@pytest.mark.parametrize("backend", JSON_BACKENDS)
+@pytest.mark.parametrize("data,expected", [
+    (b'{"id": 1, "name": "\xd1\x81\xd1\x82\xd1\x83\xd0\xbb", "items": [1.5, true, null]}',
+     {"id": 1, "name": "стул", "items": [1.5, True, None]}),
+    ('{"id": 1}', {"id": 1}),
+    ('"\\ud800"', "\ud800"),
+    ('{"id": 1}'.encode("utf-16"), {"id": 1}),
+])
+def test_loads(backend, data, expected):
+    assert make_codec(backend).loads(data) == expected
+
+
+@pytest.mark.parametrize("backend", JSON_BACKENDS)
+@pytest.mark.parametrize("data,expected", [
+    (b'[18446744073709551617]', [18446744073709551617]),
+    (b'18446744073709551617', 18446744073709551617),
+    (b'[0.00103777881012911971, 1]', [0.00103777881012911971, 1]),
+    ('{"id": -9223372036854775809}', {"id": -9223372036854775809}),
+    (memoryview(b'[123456789012345678901234567890, 1]'), [123456789012345678901234567890, 1]),
+])
+def test_loads_big_integers(backend, data, expected):
+    assert make_codec(backend).loads(data) == expected
+
+
+def test_different_big_integers_are_not_equal():
+    def make_response(content: bytes) -> JsonResponse:
+        return JsonResponse.from_response(httpx.Response(200, content=content, request=httpx.Request("GET", "/")))
+
+    golden = make_response(b'{"id": 18446744073709551617}')
+    testing = make_response(b'{"id": 18446744073709551616}')
+
+    assert [d.path for d in compare_responses(golden, testing)] == ["body.id"]
+
+
+def test_request_body_keeps_big_integers(tmp_path):
+    request_file = tmp_path / "requests.jsonl"
+    request_file.write_text('{"method": "POST", "url": "/users", "body": {"id": 18446744073709551617}}\n')
+
+    request, = parse_requests(str(request_file))
+
+    assert isinstance(request, Request)
+    assert request.json_body == {"id": 18446744073709551617}
+
+
+@pytest.mark.parametrize("backend", JSON_BACKENDS)
+def test_loads_nan(backend):
+    assert math.isnan(make_codec(backend).loads(b"NaN"))
+
+
+@pytest.mark.parametrize("backend", JSON_BACKENDS)
+@pytest.mark.parametrize("data", [b"", b"{", b"{'id': 1}", "[1,]"])
+def test_loads_error(backend, data):
+    with pytest.raises(JSONDecodeError):
+        make_codec(backend).loads(data)
+
+
+@pytest.mark.parametrize("backend", JSON_BACKENDS)
+@pytest.mark.parametrize("data,expected", [
+    ({"id": 1, "name": "стул"}, '{"id":1,"name":"стул"}'),
+    ([1.5, True, None], '[1.5,true,null]'),
+    ({1: 2**70}, '{"1":1180591620717411303424}'),
+])
+def test_dumps(backend, data, expected):
+    assert make_codec(backend).dumps(data) == expected
+
+
+def test_configure():
+    codec = JsonCodec()
+    assert codec.backend == JSON_BACKEND_ORJSON
+
+    codec.configure(JSON_BACKEND_JSON)
+    assert codec.backend == JSON_BACKEND_JSON
+
+    with pytest.raises(AssertionError):
+        codec.configure("ujson")
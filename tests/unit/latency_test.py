@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+from vedro_replay import Request
+from vedro_replay.latency import (
+    LATENCY_GROUP_BY_PATH,
+    LatencyRegression,
+    LatencyReport,
+    Timing,
+    TimingTrace,
+    percentile,
+)
+from vedro_replay.runner import ReplaySummary
+
+
+@pytest.mark.parametrize("p,expected", [(0, 1), (50, 5), (95, 10), (99, 10), (100, 10)])
+def test_percentile(p, expected):
+    assert percentile(list(range(1, 11)), p) == expected
+
+
+@pytest.mark.parametrize("events,timing", [
+    pytest.param(
+        [(0.0, "connection.connect_tcp.started"), (0.01, "connection.connect_tcp.complete"),
+         (0.01, "connection.start_tls.started"), (0.03, "connection.start_tls.complete"),
+         (0.03, "http11.send_request_headers.started"), (0.08, "http11.receive_response_headers.complete"),
+         (0.1, "http11.receive_response_body.complete"), (0.1, "http11.response_closed.complete")],
+        Timing(connect=0.03, ttfb=0.08, total=0.1), id="new connection"
+    ),
+    pytest.param(
+        [(1.0, "http2.send_request_headers.started"), (1.05, "http2.receive_response_headers.complete"),
+         (1.06, "http2.receive_response_body.complete")],
+        Timing(connect=0.0, ttfb=0.05, total=0.06), id="reused connection"
+    ),
+    pytest.param([(1.0, "http11.send_request_headers.started")], None, id="failed request"),
+])
+def test_timing_trace(events, timing):
+    times = iter(now for now, _ in events)
+    trace = TimingTrace(clock=lambda: next(times))
+
+    for _, event_name in events:
+        asyncio.run(trace(event_name, {}))
+
+    assert trace.timing() == (pytest.approx(timing) if timing else None)
+
+
+def add_timings(report: LatencyReport, path: str, golden_totals, testing_totals) -> None:
+    for golden, testing in zip(golden_totals, testing_totals):
+        report.add("get_items.http", path, Timing(0.0, golden / 2, golden), Timing(0.0, testing / 2, testing))
+
+
+def test_latency_regressions():
+    report = LatencyReport(group_by=LATENCY_GROUP_BY_PATH, threshold=20, min_requests=10)
+    add_timings(report, "/items", [0.1] * 100, [0.1] * 90 + [0.5] * 10)
+    add_timings(report, "/users", [0.1] * 100, [0.11] * 100)
+    add_timings(report, "/orders", [0.1] * 5, [1.0] * 5)
+
+    assert report.regressions() == [
+        LatencyRegression("/items", "total", 95, 0.1, 0.5),
+        LatencyRegression("/items", "total", 99, 0.1, 0.5),
+    ]
+    assert str(report.regressions()[0]) == "/items: total p95 100.0 -> 500.0 ms (+400%)"
+
+
+def test_latency_without_threshold():
+    report = LatencyReport()
+    add_timings(report, "/items", [0.1] * 100, [1.0] * 100)
+
+    assert report.regressions() == []
+    assert report.render() == [
+        "Latency of golden -> testing, ms:",
+        "  get_items.http: 100 requests",
+        "    connect p50 0.0 -> 0.0  p95 0.0 -> 0.0  p99 0.0 -> 0.0",
+        "    ttfb    p50 50.0 -> 500.0  p95 50.0 -> 500.0  p99 50.0 -> 500.0",
+        "    total   p50 100.0 -> 1000.0  p95 100.0 -> 1000.0  p99 100.0 -> 1000.0",
+    ]
+
+
+def test_replay_summary_with_latency():
+    summary = ReplaySummary(latency=LatencyReport(threshold=50, min_requests=1))
+    request = Request(method="GET", url="/items?id=1")
+
+    summary.add_timing("get_items.http", request, Timing(0.0, 0.05, 0.1), Timing(0.0, 0.1, 0.2))
+    summary.add_timing("get_items.http", request, None, Timing(0.0, 0.1, 0.2))
+    summary.add_result("get_items.http", request, [])
+
+    assert "  get_items.http: 1 requests" in summary.render()
+    assert "  get_items.http: total p50 100.0 -> 200.0 ms (+100%)" in summary.render()
@@ -0,0 +1,103 @@
+import json
+
+import httpx
+import pytest
+
+from vedro_replay import (
+    LazyMultipartResponse,
+    MultipartBody,
+    MultipartResponse,
+    Request,
+    SnapshotStore,
+    filter_response,
+)
+from vedro_replay.compare import Difference, compare_responses
+from vedro_replay.multipart import IncorrectMultipartContent, get_boundary, split_parts
+
+PARTS = [{"id": 1, "debug": {"sql": "select 1"}}, {"id": 2, "debug": None}, [{"id": 3}]]
+
+
+def make_content(parts, boundary="b0undary", preamble=b"") -> bytes:
+    content = preamble
+    for part in parts:
+        content += (f"--{boundary}\r\nContent-Type: application/json\r\n\r\n".encode()
+                    + json.dumps(part).encode() + b"\r\n")
+    return content + f"--{boundary}--\r\n".encode()
+
+
+def make_response(parts) -> httpx.Response:
+    return httpx.Response(
+        200,
+        headers={"content-type": 'multipart/mixed; boundary="b0undary"'},
+        content=make_content(parts),
+        request=httpx.Request("GET", "http://localhost/batch"),
+    )
+
+
+@pytest.mark.parametrize("content_type,boundary", [
+    ("multipart/mixed; boundary=abc", b"abc"),
+    ('multipart/form-data; charset=utf-8; Boundary="a b;c"', b"a b;c"),
+])
+def test_get_boundary(content_type, boundary):
+    assert get_boundary(content_type) == boundary
+
+
+@pytest.mark.parametrize("content_type", ["application/json; boundary=abc", "multipart/mixed", ""])
+def test_get_boundary_error(content_type):
+    with pytest.raises(IncorrectMultipartContent):
+        get_boundary(content_type)
+
+
+@pytest.mark.parametrize("content,parts", [
+    (make_content(PARTS), [json.dumps(part).encode() for part in PARTS]),
+    (make_content(PARTS[:1], preamble=b"preamble\r\n"), [json.dumps(PARTS[0]).encode()]),
+    (b"--b0undary\r\n\r\n{}\r\n--b0undary\r\n\r\n\r\n--b0undary--", [b"{}", b""]),
+    (b"--b0undary\r\n\r\n[1]", [b"[1]"]),
+])
+def test_split_parts(content, parts):
+    assert [content[start:end] for start, end in split_parts(content, b"b0undary")] == parts
+
+
+@pytest.mark.parametrize("content", [b"{}", b"--b0undary\r\nContent-Type: application/json"])
+def test_split_parts_error(content):
+    with pytest.raises(IncorrectMultipartContent):
+        split_parts(content, b"b0undary")
+
+
+def test_parts_are_decoded_on_access():
+    response = LazyMultipartResponse.from_response(make_response(PARTS))
+
+    assert [response.body.is_decoded(index) for index in range(3)] == [False, False, False]
+    assert response.body[1] == PARTS[1]
+    assert [response.body.is_decoded(index) for index in range(3)] == [False, True, False]
+    assert response.body == MultipartResponse.from_response(make_response(PARTS)).body == PARTS
+
+
+def test_filter_lazy_multipart_response():
+    response = LazyMultipartResponse.from_response(make_response(PARTS), ["id"])
+    first_part = response.body[0]
+    filter_response(response, [], ["debug"])
+
+    assert first_part == {}
+    assert response.body == [{}, {}, [{"id": 3}]]
+
+
+def test_compare_lazy_multipart_responses():
+    golden = LazyMultipartResponse.from_response(make_response(PARTS))
+    testing = LazyMultipartResponse.from_response(make_response([{**PARTS[0], "id": 9}] + PARTS[1:]))
+
+    assert compare_responses(golden, testing, limit=1) == [Difference("body.0.id", "value")]
+    assert not golden.body.is_decoded(1) and not testing.body.is_decoded(1)
+    assert golden.digest() == MultipartResponse.from_response(make_response(PARTS)).digest()
+
+
+def test_lazy_multipart_snapshot(tmp_path):
+    store = SnapshotStore(str(tmp_path), mode=SnapshotStore.MODE_USE)
+    request = Request(method="GET", url="/batch")
+    store.save(request, "prepare_batch", LazyMultipartResponse.from_response(make_response(PARTS)))
+    snapshot = store.load(request, "prepare_batch")
+
+    assert isinstance(snapshot, LazyMultipartResponse)
+    assert isinstance(snapshot.body, MultipartBody)
+    assert snapshot.body == PARTS
+    assert compare_responses(snapshot, LazyMultipartResponse.from_response(make_response(PARTS))) == []
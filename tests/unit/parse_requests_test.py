@@ -1,6 +1,7 @@
 import pytest
 
-from vedro_replay import Request, parse_requests
+from vedro_replay import Request, iter_requests, parse_requests
+from vedro_replay.parse_requests import IncorrectContentsRequestFile
 
 
 @pytest.mark.parametrize("request_file,expected_requests", [
@@ -135,6 +136,37 @@ from vedro_replay import Request, parse_requests
                 ),
             ]
     ),
+    (
+            "test_data/requests.jsonl",
+            [
+                Request(
+                    method="GET",
+                    url="/users?id=1",
+                ),
+                Request(
+                    method="GET",
+                    url="/search?query=Harry+Potter",
+                    headers={'Accept': 'application/json'}
+                ),
+                Request(
+                    method="POST",
+                    url="/post",
+                    headers={'Content-Type': 'application/json'},
+                    json_body={"id": 999, "value": "content"}
+                ),
+                Request(
+                    comment="Body captured as text",
+                    method="POST",
+                    url="/",
+                    json_body=[1, 2, 3]
+                ),
+                Request(
+                    method="GET",
+                    url="/articles/123/comments",
+                    json_body={"comment_rus": "Комментарий на русском"}
+                ),
+            ]
+    ),
 ])
 def test_parse(request_file, expected_requests):
     actual_requests = parse_requests(request_file)
@@ -147,3 +179,89 @@ def test_parse(request_file, expected_requests):
         assert expected_requests[request_number].url == actual_requests[request_number].url
         assert expected_requests[request_number].headers == actual_requests[request_number].headers
         assert expected_requests[request_number].json_body == actual_requests[request_number].json_body
+
+
+@pytest.mark.parametrize("content,error_message", [
+    pytest.param("", "Failed to process file contents", id='empty file'),
+    pytest.param("GET https://{{host}}/\n", "Failed to process file contents", id='without delimiter string'),
+    pytest.param("### comment\nget https://{{host}}/\n", "Failed to process file contents", id='lowercase method'),
+    pytest.param("### comment\nGET https://example.com/\n", "Failed to process file contents", id='url without host'),
+    pytest.param(
+        "### comment\nGET https://{{host}}/\nX-B3-TraceId: 1\n", "Failed to process file contents",
+        id='header name with digits'
+    ),
+    pytest.param(
+        "### comment\nPOST https://{{host}}/\n\ntext body\n", "Failed to process file contents", id='not json body'
+    ),
+    pytest.param(
+        "### comment\nPOST https://{{host}}/\n\n{\"id\": }\n", "Failed to process the json body",
+        id='incorrect json body'
+    ),
+    pytest.param(
+        "### comment\nPOST https://{{host}}/\n\n{\"id\": 1}\n### comment\nGET https://{{host}}/\n",
+        "Failed to process the json body",
+        id='json body without empty line before next request'
+    ),
+])
+def test_parse_incorrect_contents(tmp_path, content, error_message):
+    request_file = tmp_path / "requests.http"
+    request_file.write_text(content)
+
+    with pytest.raises(IncorrectContentsRequestFile, match=error_message):
+        parse_requests(str(request_file))
+
+
+@pytest.mark.parametrize("content", [
+    pytest.param('{"method": "GET", "url": "/"}\n{"method": "GET", "url": \n', id='incorrect json'),
+    pytest.param('["GET", "/"]\n', id='not json object'),
+    pytest.param('{"method": "GET"}\n', id='without url'),
+    pytest.param('{"url": "/", "headers": [["Accept", "*/*"]]}\n', id='headers not json object'),
+    pytest.param('{"url": "/", "body": "text body"}\n', id='not json body'),
+])
+def test_parse_incorrect_jsonl_contents(tmp_path, content):
+    request_file = tmp_path / "requests.jsonl"
+    request_file.write_text(content)
+
+    with pytest.raises(IncorrectContentsRequestFile, match="Failed to process file contents"):
+        parse_requests(str(request_file))
+
+
+def test_iter_requests_is_lazy(tmp_path):
+    request_file = tmp_path / "requests.http"
+    request_file.write_text("### first\nGET https://{{host}}/first\n\n### second\nget https://{{host}}/second\n")
+
+    requests = iter_requests(str(request_file))
+
+    assert next(requests).url == "/first"
+    with pytest.raises(IncorrectContentsRequestFile):
+        next(requests)
+
+
+@pytest.mark.parametrize("content", [
+    "### first\nGET https://{{host}}/first?id=1\nAccept: */*\n\n"
+    "### second\nGET https://{{host}}/second\nAccept: */*\n",
+    '{"method": "GET", "url": "/first?id=1", "headers": {"Accept": "*/*"}}\n'
+    '{"method": "GET", "url": "/second", "headers": {"Accept": "*/*"}}\n',
+])
+def test_parsed_requests_are_compact(tmp_path, content):
+    request_file = tmp_path / ("requests.http" if content.startswith("#") else "requests.jsonl")
+    request_file.write_text(content)
+
+    first, second = parse_requests(str(request_file))
+
+    assert not hasattr(first, "__dict__")
+    assert first.path == "/first" and second.path == "/second"
+    assert list(first.headers)[0] is list(second.headers)[0]
+    assert first.method is second.method
+
+
+def test_request_attributes():
+    request = Request(method="GET", url="/users/1?full=1")
+    assert str(request) == "GET /users/1?full=1\n"
+
+    request.add_header("Accept", "*/*").add_json_body({"id": 1})
+    request.path = "/users"
+
+    assert request.path == "/users"
+    assert request.headers == {"Accept": "*/*"}
+    assert str(request) == 'GET /users/1?full=1\nAccept: */*\n{"id":1}\n'
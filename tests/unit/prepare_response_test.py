@@ -0,0 +1,30 @@
+import asyncio
+
+import httpx
+
+from vedro_replay import BinaryResponse, JsonResponse, prepare_response
+
+
+def make_response(content: bytes) -> httpx.Response:
+    return httpx.Response(200, stream=httpx.ByteStream(content), request=httpx.Request("GET", "http://localhost/"))
+
+
+def test_prepare_response_reads_body_for_helper():
+    response = make_response(b'{"id": 1}')
+
+    prepared = asyncio.run(prepare_response(JsonResponse.from_response, response))
+
+    assert prepared.body == {"id": 1}
+    assert response.is_closed
+
+
+def test_prepare_response_streams_body_to_async_helper():
+    response = make_response(b"\x89PNG" * 1000)
+
+    async def prepare_image(response):
+        return await BinaryResponse.from_stream(response)
+
+    prepared = asyncio.run(prepare_response(prepare_image, response))
+
+    assert prepared.body.size == 4000
+    assert not hasattr(response, "_content")
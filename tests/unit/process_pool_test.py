@@ -0,0 +1,49 @@
+import gzip
+import pickle
+
+import httpx
+
+from vedro_replay.compare import Difference
+from vedro_replay.process_pool import (
+    create_process_pool,
+    dump_response,
+    load_response,
+    prepare_and_compare,
+)
+
+
+def response(body: bytes, headers=None) -> httpx.Response:
+    request = httpx.Request("GET", "http://api/items?id=1")
+    return httpx.Response(200, headers=headers or [], content=body, request=request)
+
+
+def test_dump_and_load_response():
+    headers = [
+        ("Content-Type", "application/json"), ("Content-Encoding", "gzip"), ("Set-Cookie", "a"), ("Set-Cookie", "b")
+    ]
+    original = response(gzip.compress(b'{"id": 1}'), headers)
+
+    loaded = load_response(pickle.loads(pickle.dumps(dump_response(original))))
+
+    assert loaded.status_code == original.status_code
+    assert loaded.headers.multi_items() == original.headers.multi_items()
+    assert loaded.json() == {"id": 1}
+    assert str(loaded.request.url) == "http://api/items?id=1"
+
+
+def test_prepare_and_compare_in_process_pool(tmp_path, monkeypatch):
+    (tmp_path / "pool_helpers.py").write_text(
+        "from vedro_replay import JsonResponse, filter_response\n\n\n"
+        "def prepare_items(response):\n"
+        "    return filter_response(JsonResponse.from_response(response), [], ['time'])\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    golden = dump_response(response(b'{"id": 1, "time": 1, "name": "a"}'))
+    testing = dump_response(response(b'{"id": 1, "time": 2, "name": "b"}'))
+
+    with create_process_pool(1, "pool_helpers") as process_pool:
+        with_helper = process_pool.submit(prepare_and_compare, "prepare_items", golden, testing).result()
+        without_helper = process_pool.submit(prepare_and_compare, "prepare_unknown", golden, testing).result()
+
+    assert with_helper == [Difference("body.name", "value")]
+    assert without_helper == [Difference("body.time", "value"), Difference("body.name", "value")]
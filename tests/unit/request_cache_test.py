@@ -0,0 +1,59 @@
+import os
+import shutil
+
+from vedro_replay import parse_requests
+from vedro_replay.request_cache import RequestCache
+
+
+def assert_same_requests(expected_requests, actual_requests):
+    assert len(expected_requests) == len(actual_requests)
+
+    for expected_request, actual_request in zip(expected_requests, actual_requests):
+        assert str(expected_request) == str(actual_request)
+        assert expected_request.comment == actual_request.comment
+
+
+def test_parse_requests_from_cache(tmp_path):
+    request_file = str(tmp_path / "post_requests.http")
+    shutil.copy("test_data/post_requests.http", request_file)
+    request_cache = RequestCache(str(tmp_path / "cache"))
+
+    assert request_cache.load(request_file) is None
+
+    request_cache.parse_requests(request_file)
+
+    assert_same_requests(parse_requests(request_file), request_cache.load(request_file))
+
+
+def test_cache_is_invalidated_by_changed_contents(tmp_path):
+    request_file = tmp_path / "requests.http"
+    request_file.write_text("### first\nGET https://{{host}}/first\n")
+    request_cache = RequestCache(str(tmp_path / "cache"))
+    request_cache.parse_requests(str(request_file))
+
+    request_file.write_text("### second\nGET https://{{host}}/second\n")
+
+    assert request_cache.load(str(request_file)) is None
+    assert request_cache.parse_requests(str(request_file))[0].url == "/second"
+
+
+def test_cache_is_used_for_touched_file(tmp_path):
+    request_file = tmp_path / "requests.http"
+    request_file.write_text("### first\nGET https://{{host}}/first\n")
+    request_cache = RequestCache(str(tmp_path / "cache"))
+    request_cache.parse_requests(str(request_file))
+
+    os.utime(request_file, ns=(0, 0))
+
+    assert request_cache.load(str(request_file))[0].url == "/first"
+
+
+def test_clear_cache(tmp_path):
+    request_file = tmp_path / "requests.http"
+    request_file.write_text("### first\nGET https://{{host}}/first\n")
+    request_cache = RequestCache(str(tmp_path / "cache"))
+    request_cache.parse_requests(str(request_file))
+
+    assert request_cache.clear() == 1
+    assert request_cache.load(str(request_file)) is None
+    assert not os.path.exists(tmp_path / "cache")
@@ -0,0 +1,101 @@
+from unittest.mock import patch
+
+import pytest
+
+from vedro_replay import Request, parse_requests
+from vedro_replay.parse_requests import IncorrectContentsRequestFile
+from vedro_replay.request_index import LazyRequest, index_requests
+
+
+@pytest.mark.parametrize("request_file", [
+    "test_data/get_requests.txt",
+    "test_data/get_requests.http",
+    "test_data/post_requests.http",
+    "test_data/requests.jsonl",
+])
+def test_index_requests(request_file):
+    expected_requests = parse_requests(request_file)
+
+    actual_requests = index_requests(request_file)
+
+    assert len(expected_requests) == len(actual_requests)
+
+    for expected_request, actual_request in zip(expected_requests, actual_requests):
+        assert isinstance(actual_request, Request)
+        assert expected_request.comment == actual_request.comment
+        assert expected_request.method == actual_request.method
+        assert expected_request.url == actual_request.url
+        assert expected_request.path == actual_request.path
+        assert expected_request.headers == actual_request.headers
+        assert expected_request.json_body == actual_request.json_body
+        assert str(expected_request) == str(actual_request)
+
+
+@pytest.mark.parametrize("content", ["/a\n/b\n\n", "/a\n\n/b\n", "\n/a\n/b"])
+def test_index_txt_requests_with_empty_lines(tmp_path, content):
+    request_file = tmp_path / "requests.txt"
+    request_file.write_text(content)
+
+    expected_requests = parse_requests(str(request_file))
+    actual_requests = index_requests(str(request_file))
+
+    assert [str(request) for request in actual_requests] == [str(request) for request in expected_requests]
+
+
+@pytest.mark.parametrize("content", [
+    "### a\nGET https://{{host}}/a\nX-A:\n### b\n\n### c\nGET https://{{host}}/c\n",
+    "### a\nGET https://{{host}}/a\nX-A:\n\n\t### b\nX-B: 1\n### c\nGET https://{{host}}/c\n",
+    "### a\nGET https://{{host}}/a\n\t### b\r\nGET https://{{host}}/b\r\n",
+])
+def test_index_http_requests_with_delimiter_in_request(tmp_path, content):
+    request_file = tmp_path / "requests.http"
+    request_file.write_text(content)
+
+    expected_requests = parse_requests(str(request_file))
+    actual_requests = index_requests(str(request_file))
+
+    assert [str(request) for request in actual_requests] == [str(request) for request in expected_requests]
+
+
+def test_lazy_request_is_parsed_on_access(tmp_path):
+    request_file = tmp_path / "requests.http"
+    request_file.write_text("### first\nGET https://{{host}}/first\n\n### second\nget https://{{host}}/second\n")
+
+    first_request, second_request = index_requests(str(request_file))
+
+    assert isinstance(second_request, LazyRequest)
+    assert first_request.url == "/first"
+    with pytest.raises(IncorrectContentsRequestFile):
+        second_request.url
+
+
+def test_changes_of_lazy_request_are_not_shared(tmp_path):
+    request_file = tmp_path / "requests.http"
+    request_file.write_text("### first\nGET https://{{host}}/first\n")
+
+    first_request, = index_requests(str(request_file))
+    first_request.add_header("X-Test", "1")
+    same_request, = index_requests(str(request_file))
+
+    assert first_request.headers == {"X-Test": "1"}
+    assert same_request.headers == {}
+
+
+def test_index_requests_with_selection(tmp_path):
+    request_file = tmp_path / "requests.http"
+    request_file.write_text("".join(f"### {i}\nGET https://{{{{host}}}}/items/{i}\n\n" for i in range(5)))
+    expected_requests = [r for r in parse_requests(str(request_file)) if r.path != "/items/2"]
+
+    with patch("vedro_replay.request_index.load_request") as load_request:
+        actual_requests = index_requests(str(request_file), select=lambda r: r.path != "/items/2")
+        assert load_request.call_count == 0
+
+    assert [str(request) for request in actual_requests] == [str(request) for request in expected_requests]
+
+
+def test_index_requests_with_incorrect_contents(tmp_path):
+    request_file = tmp_path / "requests.http"
+    request_file.write_text("GET https://{{host}}/\n")
+
+    with pytest.raises(IncorrectContentsRequestFile):
+        index_requests(str(request_file))
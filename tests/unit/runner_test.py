@@ -0,0 +1,119 @@
+import asyncio
+import logging
+import tracemalloc
+from types import ModuleType
+
+import httpx
+import pytest
+
+from vedro_replay import BinaryResponse, JsonResponse, Request
+from vedro_replay.compare import Difference, compare_responses
+from vedro_replay.generator import MainGenerator
+from vedro_replay.runner import ReplayRunner, ReplaySummary
+
+
+def response(body, status=200, headers=None) -> JsonResponse:
+    return JsonResponse(status=status, headers=headers or {}, body=body, request_url="/")
+
+
+@pytest.mark.parametrize("golden,testing,differences", [
+    (response({"a": [1, 2]}), response({"a": [1, 2]}), []),
+    (response({}), response({}, status=500), [Difference("status", "value")]),
+    (
+        response({"a": [1, 2], "c": 1, "m": 1}),
+        response({"a": [1], "c": "1", "d": 1}),
+        [
+            Difference("body.a.1", "missing element"),
+            Difference("body.c", "type"),
+            Difference("body.m", "missing key"),
+            Difference("body.d", "extra key"),
+        ]
+    ),
+    (response({}, headers={"x": "1"}), response({}, headers={"x": "2"}), [Difference("headers.x", "value")]),
+])
+def test_compare_responses(golden, testing, differences):
+    assert compare_responses(golden, testing) == differences
+
+
+def test_replay_summary():
+    summary = ReplaySummary(max_examples=1)
+    request = Request(method="GET", url="/items")
+
+    summary.add_result("get_items.http", request, [])
+    summary.add_result("get_items.http", request, [Difference("body.0.id", "value")])
+    summary.add_result("get_items.http", request, [Difference("body.1.id", "value")])
+    summary.add_error("post_users.http", ConnectionError("refused"))
+
+    assert (summary.total, summary.passed, summary.failed, summary.errors) == (4, 1, 2, 1)
+    assert summary.differences == {"body.*.id: value": 2}
+    assert len(summary.examples) == 1
+    assert "post_users.http: 0 passed, 0 failed, 1 errors" in summary.render()
+
+
+def test_replay_summary_examples_dont_depend_on_order_of_results():
+    summary = ReplaySummary(max_examples=2)
+    requests = {order: Request(method="GET", url=f"/items?id={order}") for order in [(1, 0), (0, 1), (0, 0), (1, 1)]}
+
+    for order, request in requests.items():
+        summary.add_result("get_items.http", request, [Difference("body", "type")], order)
+
+    assert [request.url for request, _ in summary.examples] == ["/items?id=(0, 0)", "/items?id=(0, 1)"]
+
+
+class LargeStream(httpx.AsyncByteStream):
+    def __init__(self, size: int, chunk: bytes = b"\x01" * (1 << 16)) -> None:
+        self.size = size
+        self.chunk = chunk
+
+    async def __aiter__(self):
+        for _ in range(self.size // len(self.chunk)):
+            yield self.chunk
+
+
+def test_streamed_response_is_not_loaded(tmp_path):
+    requests_file = tmp_path / "get_image.http"
+    requests_file.write_text("### image\nGET https://{{host}}/image.png\n")
+    size = 64 << 20
+
+    async def prepare_image(response):
+        return await BinaryResponse.from_stream(response)
+
+    helpers = ModuleType("helpers")
+    setattr(helpers, MainGenerator.get_helper_method_name(str(requests_file)), prepare_image)
+    runner = ReplayRunner("http://golden", "http://testing", concurrency=1, helpers=helpers,
+                          log=logging.getLogger("Runner"))
+    runner._pool._create_transport = lambda base_url: httpx.MockTransport(
+        lambda request: httpx.Response(200, stream=LargeStream(size))
+    )
+
+    tracemalloc.start()
+    try:
+        summary = asyncio.run(runner.run([str(requests_file)]))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert (summary.passed, summary.errors) == (1, 0)
+    assert peak < size // 8
+
+
+def test_failed_request_waits_for_other_request(tmp_path):
+    requests_file = tmp_path / "get_items.http"
+    requests_file.write_text("### items\nGET https://{{host}}/items\n")
+    completed = []
+
+    async def handle(request):
+        if request.url.host == "golden":
+            raise httpx.ConnectError("golden is unavailable", request=request)
+        await asyncio.sleep(0.05)
+        completed.append(request.url.host)
+        return httpx.Response(200, json={})
+
+    runner = ReplayRunner("http://golden", "http://testing", concurrency=1, helpers=None,
+                          log=logging.getLogger("Runner"))
+    runner._pool._create_transport = lambda base_url: httpx.MockTransport(handle)
+
+    summary = asyncio.run(runner.run([str(requests_file)]))
+
+    assert summary.errors == 1
+    assert completed == ["testing"]
@@ -0,0 +1,67 @@
+import pytest
+
+from vedro_replay import Request, replay
+from vedro_replay.sample_requests import deduplicate_requests, get_request_shape, sample_requests
+
+
+def test_deduplicate_requests():
+    requests = [
+        Request(method="GET", url="/search?q=a&page=1", headers={"Accept": "application/json"}),
+        Request(method="get", url="/search?page=1&q=a", headers={"accept": "application/json"}),
+        Request(method="GET", url="/search?q=b&page=1", headers={"Accept": "application/json"}),
+        Request(method="POST", url="/users", json_body={"id": 1, "name": "John"}),
+        Request(method="POST", url="/users", json_body={"name": "John", "id": 1}),
+        Request(method="POST", url="/users", json_body={"name": "John", "id": 2}),
+    ]
+
+    assert list(deduplicate_requests(requests)) == [requests[0], requests[2], requests[3], requests[5]]
+
+
+@pytest.mark.parametrize("first,second,same_shape", [
+    (Request(method="GET", url="/search?q=a&page=1"), Request(method="GET", url="/search?page=2&q=b"), True),
+    (Request(method="GET", url="/search?q=a"), Request(method="GET", url="/search?q=a&page=1"), False),
+    (Request(method="GET", url="/search"), Request(method="POST", url="/search"), False),
+    (
+        Request(method="POST", url="/users", json_body={"id": 1}),
+        Request(method="POST", url="/users", json_body={"id": 2}),
+        True
+    ),
+    (
+        Request(method="POST", url="/users", json_body={"id": 1}),
+        Request(method="POST", url="/users", json_body={"name": "John"}),
+        False
+    ),
+])
+def test_get_request_shape(first, second, same_shape):
+    assert (get_request_shape(first) == get_request_shape(second)) is same_shape
+
+
+@pytest.mark.parametrize("by,expected_urls", [
+    ("path", ["/search?q=a", "/search?q=b", "/users/1", "/users/1"]),
+    ("shape", ["/search?q=a", "/search?q=b", "/search?q=c&page=2", "/users/1", "/users/1"]),
+])
+def test_sample_requests(by, expected_urls):
+    urls = ["/search?q=a", "/search?q=b", "/search?q=c", "/search?q=c&page=2", "/users/1", "/users/1"]
+    requests = [Request(method="GET", url=url) for url in urls]
+
+    assert [r.url for r in sample_requests(requests, limit=2, by=by)] == expected_urls
+
+
+def test_sample_requests_with_unknown_sampling():
+    with pytest.raises(ValueError):
+        list(sample_requests([], limit=1, by="host"))
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_replay_with_deduplication_and_sampling(tmp_path, lazy):
+    request_file = tmp_path / "requests.http"
+    request_file.write_text("".join(
+        f"### {i}\nGET https://{{{{host}}}}/items?id={i % 3}\n\n" for i in range(9)
+    ) + "### other\nGET https://{{host}}/other\n")
+
+    @replay(str(request_file), lazy=lazy, cache=False, deduplicate=True, sample=2)
+    def fn(self, request):
+        pass
+
+    # The parameters are stored by vedro in the reversed order
+    assert [args[0].url for args, _, _ in reversed(fn.__vedro__params__)] == ["/items?id=0", "/items?id=1", "/other"]
@@ -0,0 +1,60 @@
+import pytest
+
+from vedro_replay import Request, Shard, ShardSettings, replay
+from vedro_replay.sharding import SHARD_ENV
+
+
+@pytest.mark.parametrize("spec,index,total", [
+    ("1/1", 1, 1),
+    ("3/16", 3, 16),
+    (" 2/ 4", 2, 4),
+])
+def test_parse_shard(spec, index, total):
+    assert Shard.parse(spec) == Shard(index, total)
+
+
+@pytest.mark.parametrize("spec", ["", "3", "0/16", "17/16", "3/0", "a/b", "1/2/3"])
+def test_parse_incorrect_shard(spec):
+    with pytest.raises(ValueError):
+        Shard.parse(spec)
+
+
+def test_shards_split_requests():
+    requests = [Request(method="GET", url=f"/items?id={i}") for i in range(1000)]
+
+    shards = [list(Shard(index, 4).select(requests)) for index in range(1, 5)]
+
+    assert sorted(r.url for shard in shards for r in shard) == sorted(r.url for r in requests)
+    assert all(200 < len(shard) < 300 for shard in shards)
+
+
+def test_shard_doesnt_depend_on_order_of_requests():
+    requests = [Request(method="GET", url=f"/items?id={i}") for i in range(100)]
+
+    assert {r.url for r in Shard(2, 3).select(requests)} == {r.url for r in Shard(2, 3).select(reversed(requests))}
+
+
+def test_shard_settings_from_env(monkeypatch):
+    settings = ShardSettings()
+    assert settings.get_shard() is None
+
+    monkeypatch.setenv(SHARD_ENV, "3/16")
+    assert settings.get_shard() == Shard(3, 16)
+
+    settings.configure(Shard(1, 2))
+    assert settings.get_shard() == Shard(1, 2)
+
+
+def test_replay_with_shard(tmp_path):
+    request_file = tmp_path / "requests.http"
+    request_file.write_text("".join(f"### {i}\nGET https://{{{{host}}}}/items?id={i}\n\n" for i in range(20)))
+
+    urls = []
+    for index in (1, 2):
+        @replay(str(request_file), cache=False, shard=Shard(index, 2))
+        def fn(self, request):
+            pass
+
+        urls += [args[0].url for args, _, _ in fn.__vedro__params__]
+
+    assert sorted(urls) == sorted(f"/items?id={i}" for i in range(20))
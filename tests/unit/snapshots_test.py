@@ -0,0 +1,59 @@
+import os
+
+from vedro_replay import JsonResponse, Request, SnapshotStore
+
+
+def make_response(status: int) -> JsonResponse:
+    return JsonResponse(status=status, headers={"content-type": "application/json"}, body={"id": 1}, request_url="/")
+
+
+def test_load_saved_snapshot(tmp_path):
+    store = SnapshotStore(str(tmp_path), mode=SnapshotStore.MODE_USE)
+    request = Request(method="GET", url="/items?b=2&a=1", headers={"Accept": "application/json"})
+
+    assert store.load(request, "prepare_items") is None
+
+    store.save(request, "prepare_items", make_response(200))
+    snapshot = store.load(Request(method="GET", url="/items?a=1&b=2", headers={"accept": "application/json"}),
+                          "prepare_items")
+
+    assert isinstance(snapshot, JsonResponse)
+    assert (snapshot.status, snapshot.headers, snapshot.body) == (200, {"content-type": "application/json"}, {"id": 1})
+    assert store.load(request, "prepare_other_items") is None
+
+
+def test_snapshots_are_not_loaded_in_refresh_mode(tmp_path):
+    request = Request(method="GET", url="/items")
+    SnapshotStore(str(tmp_path), mode=SnapshotStore.MODE_USE).save(request, "prepare_items", make_response(200))
+    store = SnapshotStore(str(tmp_path), mode=SnapshotStore.MODE_REFRESH)
+
+    assert store.load(request, "prepare_items") is None
+
+    store.save(request, "prepare_items", make_response(404))
+
+    assert SnapshotStore(str(tmp_path), mode=SnapshotStore.MODE_USE).load(request, "prepare_items").status == 404
+
+
+def test_prune_snapshots(tmp_path):
+    store = SnapshotStore(str(tmp_path), mode=SnapshotStore.MODE_USE)
+    actual_request, removed_request = Request(method="GET", url="/items"), Request(method="GET", url="/removed")
+    store.save(actual_request, "prepare_items", make_response(200))
+    store.save(removed_request, "prepare_items", make_response(200))
+
+    assert store.prune({actual_request.fingerprint()}) == 1
+    assert store.load(actual_request, "prepare_items") is not None
+    assert store.load(removed_request, "prepare_items") is None
+
+
+def test_same_snapshot_is_not_rewritten_in_refresh_mode(tmp_path):
+    request = Request(method="GET", url="/items")
+    store = SnapshotStore(str(tmp_path), mode=SnapshotStore.MODE_REFRESH)
+    store.save(request, "prepare_items", make_response(200))
+    snapshot_path = store._snapshot_path(request.fingerprint(), "prepare_items")
+    os.utime(snapshot_path, (0, 0))
+
+    store.save(request, "prepare_items", make_response(200))
+    assert os.stat(snapshot_path).st_mtime == 0
+
+    store.save(request, "prepare_items", make_response(404))
+    assert os.stat(snapshot_path).st_mtime != 0
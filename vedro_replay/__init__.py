@@ -1,18 +1,65 @@
+from .body_digest import BodyDigest
+from .client_pool import ClientPool, PooledClients, PooledClientsPlugin, client_pool
 from .command import command
+from .compare import Difference, assert_same_data, diff_data, is_same_data
+from .digest import digest_data
+from .exclude import ExcludeSet
 from .filtering import filter_data, filter_response
-from .parse_requests import parse_requests
+from .gather_responses import ResponsePair, gather_responses
+from .multipart import MultipartBody
+from .parse_excludes import compile_excludes
+from .parse_requests import iter_requests, parse_requests
+from .prepare_response import prepare_response
 from .replay import replay
 from .request import Request
-from .response import JsonResponse, MultipartResponse, Response
+from .response import (
+    BinaryResponse,
+    JsonResponse,
+    LazyMultipartResponse,
+    MultipartResponse,
+    Response,
+    TextResponse,
+)
+from .sharding import Shard, Sharding, ShardingPlugin, ShardSettings, shard_settings
+from .snapshots import Snapshots, SnapshotsPlugin, SnapshotStore, snapshot_store
 
 __all__ = (
     "replay",
     "parse_requests",
+    "iter_requests",
     "command",
     "filter_data",
     "filter_response",
+    "Difference",
+    "diff_data",
+    "is_same_data",
+    "assert_same_data",
+    "digest_data",
+    "gather_responses",
+    "ResponsePair",
+    "prepare_response",
+    "compile_excludes",
+    "ExcludeSet",
     "Request",
     "Response",
     "JsonResponse",
-    "MultipartResponse"
+    "MultipartResponse",
+    "LazyMultipartResponse",
+    "MultipartBody",
+    "BinaryResponse",
+    "TextResponse",
+    "BodyDigest",
+    "ClientPool",
+    "client_pool",
+    "PooledClients",
+    "PooledClientsPlugin",
+    "SnapshotStore",
+    "snapshot_store",
+    "Snapshots",
+    "SnapshotsPlugin",
+    "Shard",
+    "ShardSettings",
+    "shard_settings",
+    "Sharding",
+    "ShardingPlugin",
 )
@@ -0,0 +1,119 @@
+import hashlib
+from typing import Any, Dict, List, Optional, Tuple
+
+_DIGEST_SIZE = 8
+
+
+def _hash_block(data: Any) -> bytes:
+    return hashlib.blake2b(data, digest_size=_DIGEST_SIZE).digest()
+
+
+def _merge_blocks(blocks: bytes) -> bytes:
+    # The digest of a block twice as large is the digest of the digests of its halves, the last block without a pair
+    # is dropped: it isn't complete at the larger size
+    step = 2 * _DIGEST_SIZE
+    return b"".join(_hash_block(blocks[i:i + step]) for i in range(0, len(blocks) - step + 1, step))
+
+
+class BodyDigest:
+    # The body is hashed as it is read, only its size, sha256 and the digests of its blocks are kept.
+    # The number of blocks is bounded: when there are too many of them, the size of the blocks is doubled,
+    # so the memory is the same for a body of any size
+    BLOCK_SIZE = 4096
+    MAX_BLOCKS = 4096
+
+    __slots__ = ("size", "block_size", "_blocks", "_sha256", "_hash", "_leaf", "_leaf_size", "_stack")
+
+    def __init__(self) -> None:
+        self.size = 0
+        self.block_size = self.BLOCK_SIZE
+        self._blocks = bytearray()
+        self._sha256: Optional[str] = None
+        self._hash = hashlib.sha256()
+        self._leaf = hashlib.blake2b(digest_size=_DIGEST_SIZE)
+        self._leaf_size = 0
+        # The digests of the parts of the block which is not complete, by their heights: 1, 2, 4... base blocks
+        self._stack: List[Tuple[int, bytes]] = []
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BodyDigest":
+        body_digest = cls()
+        body_digest.size = data["size"]
+        body_digest.block_size = data["block_size"]
+        body_digest._blocks = bytearray.fromhex(data["blocks"])
+        body_digest._sha256 = data["sha256"]
+        return body_digest
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"size": self.size, "sha256": self.sha256, "block_size": self.block_size, "blocks": self._blocks.hex()}
+
+    @property
+    def sha256(self) -> str:
+        return self._sha256 if self._sha256 is not None else self._hash.hexdigest()
+
+    def update(self, data: bytes) -> None:
+        self.size += len(data)
+        self._hash.update(data)
+
+        view = memoryview(data)
+        position = 0
+        if self._leaf_size:
+            position = min(self.BLOCK_SIZE - self._leaf_size, len(view))
+            self._leaf.update(view[:position])
+            self._leaf_size += position
+            if self._leaf_size < self.BLOCK_SIZE:
+                return
+            self._push(self._leaf.digest())
+            self._leaf, self._leaf_size = hashlib.blake2b(digest_size=_DIGEST_SIZE), 0
+
+        while len(view) - position >= self.BLOCK_SIZE:
+            self._push(_hash_block(view[position:position + self.BLOCK_SIZE]))
+            position += self.BLOCK_SIZE
+        if position < len(view):
+            self._leaf.update(view[position:])
+            self._leaf_size = len(view) - position
+
+    def _push(self, digest: bytes) -> None:
+        height = 0
+        while self._stack and self._stack[-1][0] == height:
+            digest = _hash_block(self._stack.pop()[1] + digest)
+            height += 1
+        if self.BLOCK_SIZE << height < self.block_size:
+            self._stack.append((height, digest))
+            return
+
+        self._blocks += digest
+        if len(self._blocks) >= 2 * self.MAX_BLOCKS * _DIGEST_SIZE:
+            self._blocks = bytearray(_merge_blocks(bytes(self._blocks)))
+            self.block_size *= 2
+
+    def _get_blocks(self, block_size: int) -> bytes:
+        blocks = bytes(self._blocks)
+        size = self.block_size
+        while size < block_size:
+            blocks = _merge_blocks(blocks)
+            size *= 2
+        return blocks
+
+    def find_difference(self, other: "BodyDigest") -> Optional[int]:
+        # The offset of the first block which differs. The bytes after the complete blocks are covered only by sha256,
+        # so if the sizes differ and the complete blocks are the same, the offset is not known
+        if self.size == other.size and self.sha256 == other.sha256:
+            return None
+
+        block_size = max(self.block_size, other.block_size)
+        blocks, other_blocks = self._get_blocks(block_size), other._get_blocks(block_size)
+        for index in range(0, min(len(blocks), len(other_blocks)), _DIGEST_SIZE):
+            if blocks[index:index + _DIGEST_SIZE] != other_blocks[index:index + _DIGEST_SIZE]:
+                return index // _DIGEST_SIZE * block_size
+        if self.size != other.size:
+            return None
+        return min(len(blocks), len(other_blocks)) // _DIGEST_SIZE * block_size
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, BodyDigest):
+            return self.size == other.size and self.sha256 == other.sha256
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"<BodyDigest: {self.size} bytes, sha256 {self.sha256}>"
@@ -0,0 +1,139 @@
+from typing import Dict, Mapping, Optional, Type
+
+import httpx
+from vedro.core import Dispatcher, Plugin, PluginConfig
+from vedro.events import CleanupEvent, StartupEvent
+from vedro_httpx import AsyncClient
+from vedro_httpx.recorder import request_recorder
+
+from .host_limiter import AdaptiveLimit, HostLimiter, LimitedTransport
+
+
+class ClientPool:
+    def __init__(self) -> None:
+        self._clients: Dict[str, AsyncClient] = {}
+        self.configure()
+
+    def configure(
+        self,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        timeout: Optional[float] = 5.0,
+        rate_limit: Optional[float] = None,
+        rate_limits: Optional[Mapping[str, float]] = None,
+        adaptive_concurrency: bool = False,
+        min_concurrency: int = 1,
+        latency_tolerance: float = 2.0,
+    ) -> None:
+        # The settings are applied to the clients created after the call
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._http2 = http2
+        self._timeout = timeout
+        self._rate_limit = rate_limit
+        self._rate_limits = dict(rate_limits or {})
+        self._adaptive_concurrency = adaptive_concurrency
+        self._min_concurrency = min_concurrency
+        self._latency_tolerance = latency_tolerance
+        self.limiters: Dict[str, HostLimiter] = {}
+
+    def get(self, base_url: str) -> AsyncClient:
+        client = self._clients.get(base_url)
+        if client is None or client.is_closed:
+            client = AsyncClient(base_url=base_url, timeout=self._timeout, transport=self._create_transport(base_url))
+            client.event_hooks["response"].append(request_recorder.async_record)
+            self._clients[base_url] = client
+        return client
+
+    def _create_transport(self, base_url: str) -> httpx.AsyncBaseTransport:
+        transport = httpx.AsyncHTTPTransport(limits=self._limits, http2=self._http2)
+        rate_limit = self._rate_limits.get(base_url, self._rate_limit)
+        if not rate_limit and not self._adaptive_concurrency:
+            return transport
+
+        # Each api has its own limiter, so golden and testing are limited independently
+        adaptive_limit = None
+        if self._adaptive_concurrency:
+            adaptive_limit = AdaptiveLimit(
+                max_limit=self._limits.max_connections or 100,
+                min_limit=self._min_concurrency,
+                latency_tolerance=self._latency_tolerance,
+            )
+        limiter = self.limiters[base_url] = HostLimiter(rate_limit, adaptive_limit)
+        return LimitedTransport(transport, limiter)
+
+    async def aclose(self) -> None:
+        clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            await client.aclose()
+
+
+client_pool = ClientPool()
+
+
+class PooledClientsPlugin(Plugin):
+    def __init__(self, config: Type["PooledClients"], *, pool: ClientPool = client_pool) -> None:
+        super().__init__(config)
+        self._pool = pool
+        self._config_pool = config
+
+    def subscribe(self, dispatcher: Dispatcher) -> None:
+        dispatcher.listen(StartupEvent, self.on_startup) \
+                  .listen(CleanupEvent, self.on_cleanup)
+
+    def on_startup(self, event: StartupEvent) -> None:
+        self._pool.configure(
+            max_connections=self._config_pool.max_connections,
+            max_keepalive_connections=self._config_pool.max_keepalive_connections,
+            keepalive_expiry=self._config_pool.keepalive_expiry,
+            http2=self._config_pool.http2,
+            timeout=self._config_pool.timeout,
+            rate_limit=self._config_pool.rate_limit,
+            rate_limits=self._config_pool.rate_limits,
+            adaptive_concurrency=self._config_pool.adaptive_concurrency,
+            min_concurrency=self._config_pool.min_concurrency,
+            latency_tolerance=self._config_pool.latency_tolerance,
+        )
+
+    async def on_cleanup(self, event: CleanupEvent) -> None:
+        await self._pool.aclose()
+
+
+class PooledClients(PluginConfig):
+    plugin = PooledClientsPlugin
+    description = "Shares pooled HTTP clients between vedro-replay scenarios"
+
+    # Maximum number of connections to one api
+    max_connections: Optional[int] = 100
+
+    # Maximum number of idle connections kept alive to one api
+    max_keepalive_connections: Optional[int] = 20
+
+    # Time in seconds after which an idle connection is closed
+    keepalive_expiry: Optional[float] = 5.0
+
+    # Use HTTP/2, requires the h2 package (pip install httpx[http2])
+    http2: bool = False
+
+    # Timeout of requests in seconds
+    timeout: Optional[float] = 5.0
+
+    # Maximum number of requests per second to one api, None - unlimited
+    rate_limit: Optional[float] = None
+
+    # Maximum number of requests per second by api url, overrides rate_limit, e.g. {"http://testing.app": 50}
+    rate_limits: Dict[str, float] = {}
+
+    # Adapt the number of concurrent requests to one api (up to max_connections) to its latency and errors.
+    # The concurrency grows while the latency is close to the minimal observed one
+    # and is decreased on 5xx, 429 responses, timeouts and when the latency grows latency_tolerance times
+    adaptive_concurrency: bool = False
+
+    min_concurrency: int = 1
+
+    latency_tolerance: float = 2.0
@@ -1,6 +1,29 @@
 import argparse
+import os
 
-from .generator import MainGenerator, generate
+from .generator import COMPARISON_D42, COMPARISONS, MainGenerator, generate
+from .import_requests import OUTPUT_FORMATS, SOURCE_FORMATS, import_requests
+from .latency import LATENCY_GROUP_BY
+from .request_cache import DEFAULT_CACHE_DIR, cache
+from .runner import run
+from .sample_requests import SAMPLE_BY, SAMPLE_BY_PATH
+from .sharding import SHARD_ENV, Shard
+from .snapshots import DEFAULT_SNAPSHOTS_DIR, snapshots
+
+
+def add_sampling_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        '--deduplicate', help='Skip the repeated requests with the same method, path, query, headers and body',
+        action='store_true'
+    )
+    parser.add_argument(
+        '--sample', help='Keep only the first N requests of each path (or shape, see --sample-by)', type=int,
+        metavar='N'
+    )
+    parser.add_argument(
+        '--sample-by', help='Sample by the path or by the shape: the method, path, names of query parameters '
+                            'and keys of json body', choices=SAMPLE_BY, default=SAMPLE_BY_PATH
+    )
 
 
 def command() -> None:
@@ -17,7 +40,115 @@ def command() -> None:
     generate_parser.add_argument(
         '--force', help='Forced regeneration. The files will be overwritten', action='store_true'
     )
+    generate_parser.add_argument(
+        '--concurrent', help='Generate scenarios sending requests to golden and testing concurrently',
+        action='store_true'
+    )
+    generate_parser.add_argument(
+        '--comparison', help='Compare responses in scenarios with d42 schemas or with the native diff, '
+                             'which is faster on large bodies', choices=COMPARISONS, default=COMPARISON_D42
+    )
+    add_sampling_arguments(generate_parser)
     generate_parser.set_defaults(func=generate)
 
+    cache_parser = subparsers.add_parser('cache', help='Manage the cache of parsed request files')
+    cache_parser.add_argument(
+        '--cache-dir', help='The path to the directory with the cache', default=DEFAULT_CACHE_DIR
+    )
+    cache_parser.add_argument(
+        '--clear', help='Remove all cached request files', action='store_true'
+    )
+    cache_parser.set_defaults(func=cache)
+
+    snapshots_parser = subparsers.add_parser('snapshots', help='Manage the store of golden response snapshots')
+    snapshots_parser.add_argument(
+        '--snapshots-dir', help='The path to the directory with the snapshots', default=DEFAULT_SNAPSHOTS_DIR
+    )
+    snapshots_parser.add_argument(
+        '--requests-dir', help='The path to the directory containing the request files', default='requests'
+    )
+    snapshots_action = snapshots_parser.add_mutually_exclusive_group(required=True)
+    snapshots_action.add_argument(
+        '--prune', help='Remove the snapshots of requests missing in the request files', action='store_true'
+    )
+    snapshots_action.add_argument(
+        '--clear', help='Remove all snapshots, they will be recorded again', action='store_true'
+    )
+    snapshots_parser.set_defaults(func=snapshots)
+
+    import_parser = subparsers.add_parser('import', help='Import requests from access logs and HAR files')
+    import_parser.add_argument(
+        'sources', nargs='+', help='Paths to nginx access logs (.log, .log.gz) or HAR files (.har)'
+    )
+    import_parser.add_argument(
+        '--format', help='Format of the sources, by default it is detected by the file extension',
+        choices=SOURCE_FORMATS, default='auto'
+    )
+    import_parser.add_argument(
+        '--output-dir', help='The path to the directory for the request files', default='requests'
+    )
+    import_parser.add_argument(
+        '--output-format', help='Format of the request files', choices=OUTPUT_FORMATS, default='http'
+    )
+    import_parser.add_argument(
+        '--method', help='Import only requests with the method, can be repeated', action='append'
+    )
+    import_parser.add_argument(
+        '--path', help='Import only requests with the path matching the regular expression'
+    )
+    import_parser.add_argument(
+        '--force', help='Overwrite the existing request files', action='store_true'
+    )
+    add_sampling_arguments(import_parser)
+    import_parser.set_defaults(func=import_requests)
+
+    run_parser = subparsers.add_parser('run', help='Replay requests against golden and testing without vedro')
+    run_parser.add_argument(
+        '--requests-dir', help='The path to the directory containing the request files', default='requests'
+    )
+    run_parser.add_argument(
+        '--golden-url', help='The url of golden api', default=os.environ.get('GOLDEN_API_URL')
+    )
+    run_parser.add_argument(
+        '--testing-url', help='The url of testing api', default=os.environ.get('TESTING_API_URL')
+    )
+    run_parser.add_argument(
+        '--concurrency', help='The number of requests replayed at the same time', type=int, default=16
+    )
+    run_parser.add_argument(
+        '--helpers-module', help='The module with the helpers preparing responses', default='helpers.helpers'
+    )
+    run_parser.add_argument(
+        '--timeout', help='The timeout of requests in seconds', type=float, default=5.0
+    )
+    run_parser.add_argument(
+        '--rate-limit', help='Maximum number of requests per second to each api', type=float, default=None
+    )
+    run_parser.add_argument(
+        '--adaptive-concurrency', action='store_true',
+        help='Adapt the number of concurrent requests to each api to its latency and errors, up to --concurrency'
+    )
+    run_parser.add_argument(
+        '--shard', help=f'Replay only the requests of the shard, e.g. 3/16 (default from {SHARD_ENV})',
+        type=Shard.parse, default=os.environ.get(SHARD_ENV) or None, metavar='INDEX/TOTAL'
+    )
+    run_parser.add_argument(
+        '--processes', help='The number of processes decoding, filtering and comparing responses, '
+                            '0 - in the process sending requests', type=int, default=0
+    )
+    run_parser.add_argument(
+        '--latency-group-by', help='Report p50/p95/p99 of connect, time to first byte and total time '
+                                   'of golden and testing by request file or path', choices=LATENCY_GROUP_BY
+    )
+    run_parser.add_argument(
+        '--latency-threshold', help='Fail the run if p50, p95 or p99 of total time of testing exceeds '
+                                    'the one of golden by more than PERCENT', type=float, metavar='PERCENT'
+    )
+    run_parser.add_argument(
+        '--latency-min-requests', help='Check the latency threshold only for the groups with at least N requests',
+        type=int, default=20, metavar='N'
+    )
+    run_parser.set_defaults(func=run)
+
     args = parser.parse_args()
     args.func(args)
@@ -0,0 +1,98 @@
+from typing import Any, List, Optional
+
+from .body_digest import BodyDigest
+from .multipart import MultipartBody
+from .response import Response
+
+
+class Difference:
+    __slots__ = ("path", "kind")
+
+    def __init__(self, path: str, kind: str) -> None:
+        self.path = path
+        self.kind = kind
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, Difference) and (self.path, self.kind) == (other.path, other.kind)
+
+    def __repr__(self) -> str:
+        return f"{self.path}: {self.kind}"
+
+
+class _LimitReached(Exception):
+    pass
+
+
+def _join(path: str, key: Any) -> str:
+    # The paths have the same syntax as excludes: items.0.id
+    return f"{path}.{key}" if path else str(key)
+
+
+def _diff(golden: Any, testing: Any, path: str, differences: List[Difference], limit: Optional[int]) -> None:
+    # The types are compared strictly, as testing == from_native(golden) in d42: 1, 1.0 and True are different
+    if type(golden) is not type(testing):
+        differences.append(Difference(path, "type"))
+    elif isinstance(golden, dict):
+        missing_keys = 0
+        for key, value in golden.items():
+            if key in testing:
+                _diff(value, testing[key], _join(path, key), differences, limit)
+            else:
+                missing_keys += 1
+                differences.append(Difference(_join(path, key), "missing key"))
+        # All keys of golden are found in testing, so the extra keys are looked for only if testing has more keys
+        if len(testing) > len(golden) - missing_keys:
+            for key in testing:
+                if key not in golden:
+                    differences.append(Difference(_join(path, key), "extra key"))
+    elif isinstance(golden, (list, MultipartBody)):
+        # The parts of a multipart body are decoded one by one, until the limit of differences is reached
+        for index, (golden_value, testing_value) in enumerate(zip(golden, testing)):
+            _diff(golden_value, testing_value, _join(path, index), differences, limit)
+        for index in range(len(testing), len(golden)):
+            differences.append(Difference(_join(path, index), "missing element"))
+        for index in range(len(golden), len(testing)):
+            differences.append(Difference(_join(path, index), "extra element"))
+    elif isinstance(golden, BodyDigest):
+        # The path of the difference of binary bodies is the offset of the first differing block: body.8192
+        if golden.size != testing.size:
+            differences.append(Difference(path, "size"))
+        offset = golden.find_difference(testing)
+        if offset is not None:
+            differences.append(Difference(_join(path, offset), "value"))
+    elif golden != testing:
+        differences.append(Difference(path, "value"))
+
+    if limit is not None and len(differences) >= limit:
+        raise _LimitReached()
+
+
+def diff_data(golden: Any, testing: Any, path: str = "", limit: Optional[int] = None) -> List[Difference]:
+    differences: List[Difference] = []
+    try:
+        _diff(golden, testing, path, differences, limit)
+    except _LimitReached:
+        del differences[limit:]
+    return differences
+
+
+def is_same_data(golden: Any, testing: Any) -> bool:
+    # The walk stops on the first difference
+    return not diff_data(golden, testing, limit=1)
+
+
+def assert_same_data(golden: Any, testing: Any, name: str = "", limit: int = 20) -> None:
+    differences = diff_data(golden, testing, name, limit=limit)
+    if differences:
+        raise AssertionError("\n".join(
+            [f"The testing {name or 'data'} differs from the golden one:"] + [f"  {d}" for d in differences]
+        ))
+
+
+def compare_responses(golden: Response, testing: Response, limit: Optional[int] = None) -> List[Difference]:
+    differences = []
+    if testing.status != golden.status:
+        differences.append(Difference("status", "value"))
+    differences += diff_data(golden.headers, testing.headers, "headers", limit)
+    differences += diff_data(golden.body, testing.body, "body", limit)
+    return differences
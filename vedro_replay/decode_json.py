@@ -0,0 +1,151 @@
+import json
+import re
+from json.decoder import JSONDecodeError, JSONDecoder, scanstring  # type: ignore[attr-defined]
+from typing import Any, Dict, List, Sequence, Tuple, Union
+
+from .exclude import ExcludeNode, ExcludeSet
+from .parse_excludes import compile_excludes
+
+# Runs of characters up to the next bracket outside strings, the excluded subtrees are skipped by brackets
+_SKIP = re.compile(r'[^"{}\[\]]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"{}\[\]]*)*')
+_KEY = re.compile(r'[ \t\n\r]*"([^"\\\x00-\x1f]*)"[ \t\n\r]*:[ \t\n\r]*')
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+# The scanners of json are implemented in C, they decode the values which are not excluded
+_scan_once = JSONDecoder().scan_once  # type: ignore[attr-defined]
+
+
+def _skip_whitespace(s: str, idx: int) -> int:
+    return _WHITESPACE.match(s, idx).end()  # type: ignore[union-attr]
+
+
+def _skip(s: str, idx: int) -> int:
+    c = s[idx]
+    if c != '{' and c != '[':
+        return _scan(s, idx)[1]
+    depth = 0
+    while True:
+        c = s[idx]
+        if c == '{' or c == '[':
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return idx + 1
+        idx = _SKIP.match(s, idx + 1).end()  # type: ignore[union-attr]
+
+
+def _scan(s: str, idx: int) -> Tuple[Any, int]:
+    try:
+        return _scan_once(s, idx)  # type: ignore[no-any-return]
+    except StopIteration as e:
+        raise JSONDecodeError("Expecting value", s, e.value) from None
+
+
+def _decode_object(s: str, idx: int, node: ExcludeNode) -> Tuple[Dict[str, Any], int]:
+    result: Dict[str, Any] = {}
+    idx = _skip_whitespace(s, idx)
+    if s[idx] == '}':
+        return result, idx + 1
+
+    while True:
+        match = _KEY.match(s, idx)
+        if match is not None:
+            key, idx = match.group(1), match.end()
+        else:
+            # Keys with escapes are decoded by the scanner of json
+            idx = _skip_whitespace(s, idx)
+            if s[idx:idx + 1] != '"':
+                raise JSONDecodeError("Expecting property name enclosed in double quotes", s, idx)
+            key, idx = scanstring(s, idx + 1)
+            idx = _skip_whitespace(s, idx)
+            if s[idx:idx + 1] != ':':
+                raise JSONDecodeError("Expecting ':' delimiter", s, idx)
+            idx = _skip_whitespace(s, idx + 1)
+
+        child = node.children.get(key)
+        if child is None:
+            result[key], idx = _scan(s, idx)
+        elif child.delete:
+            result.pop(key, None)
+            idx = _skip(s, idx)
+        else:
+            result[key], idx = _decode_value(s, idx, child)
+
+        idx = _skip_whitespace(s, idx)
+        c = s[idx:idx + 1]
+        if c == '}':
+            return result, idx + 1
+        if c != ',':
+            raise JSONDecodeError("Expecting ',' delimiter", s, idx)
+        idx += 1
+
+
+def _decode_array(s: str, idx: int, node: ExcludeNode) -> Tuple[List[Any], int]:
+    result: List[Any] = []
+    value: Any
+    items_node = node.children.get('*')
+    if items_node is not None and not items_node.children:
+        items_node = None
+
+    idx = _skip_whitespace(s, idx)
+    if s[idx:idx + 1] == ']':
+        idx += 1
+    else:
+        while True:
+            # The items are only traversed by the excludes, the values of the list are not replaced
+            c = s[idx:idx + 1]
+            if items_node is not None and c == '{':
+                value, idx = _decode_object(s, idx + 1, items_node)
+            elif items_node is not None and c == '[':
+                value, idx = _decode_array(s, idx + 1, items_node)
+            else:
+                value, idx = _scan(s, idx)
+            result.append(value)
+            idx = _skip_whitespace(s, idx)
+            c = s[idx:idx + 1]
+            if c == ']':
+                idx += 1
+                break
+            if c != ',':
+                raise JSONDecodeError("Expecting ',' delimiter", s, idx)
+            idx = _skip_whitespace(s, idx + 1)
+
+    for index in node.list_indexes:
+        if len(result) > index:
+            result.pop(index)
+    return result, idx
+
+
+def _decode_value(s: str, idx: int, node: ExcludeNode) -> Tuple[Any, int]:
+    # The same rules as in ExcludeNode: the values are replaced in strings, the children are looked for in containers
+    c = s[idx:idx + 1]
+    if c == '{' and node.children:
+        return _decode_object(s, idx + 1, node)
+    if c == '[' and node.children:
+        return _decode_array(s, idx + 1, node)
+
+    value, idx = _scan(s, idx)
+    if node.replaces and isinstance(value, str):
+        for replace in node.replaces:
+            value = replace(value)
+    return value, idx
+
+
+def decode_json(data: Union[str, bytes, memoryview], excludes: Union[Sequence[str], ExcludeSet]) -> Any:
+    # The result is the same as of json.loads() and execution of the excludes, but the excluded subtrees
+    # are skipped while parsing and never built. They are not validated, only their brackets are matched
+    if not isinstance(data, str):
+        data = bytes(data)
+        data = data.decode(json.detect_encoding(data), 'surrogatepass')
+
+    root = compile_excludes(excludes).root
+    try:
+        idx = _skip_whitespace(data, 0)
+        value, idx = _decode_value(data, idx, root)
+        idx = _skip_whitespace(data, idx)
+    except IndexError:
+        raise JSONDecodeError("Unexpected end of data", data, len(data)) from None
+    if idx != len(data):
+        raise JSONDecodeError("Extra data", data, idx)
+    return value
@@ -0,0 +1,21 @@
+import hashlib
+import json
+from typing import Any
+
+from .body_digest import BodyDigest
+from .multipart import MultipartBody
+
+
+def _encode_default(data: Any) -> Any:
+    if isinstance(data, MultipartBody):
+        return list(data)
+    if isinstance(data, BodyDigest):
+        return {"size": data.size, "sha256": data.sha256}
+    raise TypeError(f"Object of type {type(data).__name__} is not JSON serializable")
+
+
+def digest_data(data: Any) -> str:
+    # Keys of objects are sorted and numbers keep their type (1, 1.0 and true are serialized differently),
+    # so equal digests mean the same data for the structural diff
+    canonical_data = json.dumps(data, sort_keys=True, separators=(",", ":"), default=_encode_default)
+    return hashlib.sha256(canonical_data.encode()).hexdigest()
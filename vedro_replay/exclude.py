@@ -1,12 +1,47 @@
 import re
 from copy import deepcopy
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Pattern
+
+
+class ExcludeException(Exception):
+    pass
+
+
+class IncorrectExclude(ExcludeException):
+    pass
 
 
 class Exclude:
+    # Patterns that match the whole value when it consists only of digits, such values are returned as is
+    __DIGITS_PATTERNS = (r'\d+', r'^\d+', r'\d+$', r'^\d+$')
+
     def __init__(self, parts_path: List[str], reg_exp: str) -> None:
         self.parts_path = parts_path
         self.reg_exp = reg_exp
+        self.pattern = self.__compile(reg_exp) if reg_exp else None
+        self.replace: Callable[[str], str] = self._replace
+        if reg_exp in self.__DIGITS_PATTERNS:
+            self.replace = self._replace_digits
+
+    def __compile(self, reg_exp: str) -> Pattern[str]:
+        try:
+            return re.compile(reg_exp)
+        except re.error as e:
+            raise IncorrectExclude(
+                f"Incorrect regular expression '{reg_exp}' in exclude {'.'.join(self.parts_path)}: {e}"
+            ) from e
+
+    def _replace(self, value: str) -> str:
+        assert self.pattern is not None
+        result = self.pattern.search(value)
+        if result is not None and result[0]:
+            return result[0]
+        return value
+
+    def _replace_digits(self, value: str) -> str:
+        if value.isdecimal():
+            return value
+        return self._replace(value)
 
     def execute(self, data: Dict[str, Any]) -> None:
         self._exclude(data, deepcopy(self.parts_path))
@@ -19,9 +54,7 @@ class Exclude:
             if isinstance(data, dict) and current_path_part in data.keys():
                 if self.reg_exp:
                     if isinstance(data[current_path_part], str):
-                        result = re.search(self.reg_exp, data[current_path_part])
-                        if result is not None and result[0]:
-                            data[current_path_part] = result[0]
+                        data[current_path_part] = self.replace(data[current_path_part])
                 else:
                     del data[current_path_part]
             elif isinstance(data, list) and current_path_part.isdigit() and len(data) > int(current_path_part):
@@ -33,3 +66,69 @@ class Exclude:
                 self._exclude(elem, deepcopy(excluded_path))
         elif isinstance(data, dict) and current_path_part in data.keys():
             self._exclude(data[current_path_part], deepcopy(excluded_path))
+
+
+class ExcludeNode:
+    def __init__(self) -> None:
+        self.children: Dict[str, "ExcludeNode"] = {}
+        self.delete = False
+        self.replaces: List[Callable[[str], str]] = []
+        # Indexes of the list items to delete, in the order of the rules: each deletion shifts the next items
+        self.list_indexes: List[int] = []
+
+    def add(self, exclude: Exclude) -> None:
+        node = self
+        for path_part in exclude.parts_path[:-1]:
+            node = node.children.setdefault(path_part, ExcludeNode())
+
+        last_part = exclude.parts_path[-1]
+        if last_part.isdigit():
+            node.list_indexes.append(int(last_part))
+
+        leaf = node.children.setdefault(last_part, ExcludeNode())
+        if exclude.reg_exp:
+            leaf.replaces.append(exclude.replace)
+        else:
+            leaf.delete = True
+
+    def execute(self, data: Any) -> None:
+        if isinstance(data, dict):
+            for path_part, child in self.children.items():
+                if path_part in data:
+                    child._execute_value(data, path_part)
+        elif isinstance(data, list):
+            items_node = self.children.get('*')
+            if items_node is not None and items_node.children:
+                for elem in data:
+                    items_node.execute(elem)
+            for index in self.list_indexes:
+                if len(data) > index:
+                    data.pop(index)
+
+    def _execute_value(self, data: Dict[str, Any], key: str) -> None:
+        if self.delete:
+            del data[key]
+            return
+
+        value = data[key]
+        if self.replaces and isinstance(value, str):
+            for replace in self.replaces:
+                value = replace(value)
+            data[key] = value
+        elif self.children:
+            self.execute(value)
+
+
+class ExcludeSet:
+    def __init__(self, excludes: List[Exclude]) -> None:
+        self.excludes = excludes
+        # All paths are merged into a prefix tree, so the data is traversed once for all the rules
+        self.root = ExcludeNode()
+        for exclude in excludes:
+            self.root.add(exclude)
+
+    def execute(self, data: Any) -> None:
+        self.root.execute(data)
+
+    def __len__(self) -> int:
+        return len(self.excludes)
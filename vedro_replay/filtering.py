@@ -1,21 +1,29 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, Sequence, Union
 
-from .parse_excludes import parse_excludes
+from .exclude import ExcludeSet
+from .multipart import MultipartBody
+from .parse_excludes import compile_excludes
 from .response import Response
 
 
-def filter_response(response: Response, exclude_headers: List[Any], exclude_body: List[Any]) -> Response:
-    filter_data(raw_excludes=exclude_headers, data=response.headers)
+def filter_response(
+    response: Response,
+    exclude_headers: Union[Sequence[str], ExcludeSet],
+    exclude_body: Union[Sequence[str], ExcludeSet]
+) -> Response:
+    compile_excludes(exclude_headers).execute(response.headers)
 
-    if isinstance(response.body, list):
+    body_excludes = compile_excludes(exclude_body)
+    if isinstance(response.body, MultipartBody):
+        response.body.exclude(body_excludes)
+    elif isinstance(response.body, list):
         for body_part in response.body:
-            filter_data(raw_excludes=exclude_body, data=body_part)
+            body_excludes.execute(body_part)
     else:
-        filter_data(raw_excludes=exclude_body, data=response.body)
+        body_excludes.execute(response.body)
 
     return response
 
 
-def filter_data(raw_excludes: List[str], data: Dict[str, Any]) -> None:
-    for exclude in parse_excludes(raw_excludes):
-        exclude.execute(data)
+def filter_data(raw_excludes: Union[Sequence[str], ExcludeSet], data: Dict[str, Any]) -> None:
+    compile_excludes(raw_excludes).execute(data)
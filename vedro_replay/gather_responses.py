@@ -0,0 +1,30 @@
+import asyncio
+from typing import Awaitable, Union
+
+from .response import Response
+
+
+class ResponsePair:
+    def __init__(
+        self, golden: Union[Response, BaseException], testing: Union[Response, BaseException]
+    ) -> None:
+        self._golden = golden
+        self._testing = testing
+
+    def golden(self) -> Response:
+        return self._result(self._golden)
+
+    def testing(self) -> Response:
+        return self._result(self._testing)
+
+    @staticmethod
+    def _result(result: Union[Response, BaseException]) -> Response:
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+
+async def gather_responses(golden: Awaitable[Response], testing: Awaitable[Response]) -> ResponsePair:
+    # The failure of one request doesn't cancel the other, each failure is raised when its response is taken
+    golden_result, testing_result = await asyncio.gather(golden, testing, return_exceptions=True)
+    return ResponsePair(golden=golden_result, testing=testing_result)
@@ -3,10 +3,17 @@ import os
 from abc import ABC, abstractmethod
 from pathlib import Path
 from types import FunctionType
-from typing import Any, List
+from typing import Any, List, Optional
 
 from jinja2 import Environment, FileSystemLoader, Template
 
+from .parse_requests import find_request_files
+from .sample_requests import SAMPLE_BY_PATH
+
+COMPARISON_D42 = 'd42'
+COMPARISON_NATIVE = 'native'
+COMPARISONS = (COMPARISON_D42, COMPARISON_NATIVE)
+
 
 class GeneratorException(Exception):
     pass
@@ -55,6 +62,7 @@ class MainGenerator(Generator):
     __PATH_TEMPLATES = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'templates')
     __TEMPLATE_INTERFACES = 'interfaces.py.j2'
     __TEMPLATE_SCENARIO = 'scenario.py.j2'
+    __TEMPLATE_SCENARIO_CONCURRENT = 'scenario_concurrent.py.j2'
     __TEMPLATE_CONTEXTS = 'contexts.py.j2'
     __TEMPLATE_HELPERS = 'helpers.py.j2'
     __TEMPLATE_HELPER_METHOD = 'helper_method.j2'
@@ -72,9 +80,16 @@ class MainGenerator(Generator):
     __FILE_VEDRO_CFG = 'vedro.cfg.py'
     __FILE_CONFIG = 'config.py'
 
-    def __init__(self, requests_dir: str, force: bool, log: logging.Logger):
+    def __init__(self, requests_dir: str, force: bool, log: logging.Logger, concurrent: bool = False,
+                 deduplicate: bool = False, sample: Optional[int] = None, sample_by: str = SAMPLE_BY_PATH,
+                 comparison: str = COMPARISON_D42):
         super().__init__(force=force, log=log)
         self.__requests_dir = requests_dir
+        self.__concurrent = concurrent
+        self.__deduplicate = deduplicate
+        self.__sample = sample
+        self.__sample_by = sample_by
+        self.__comparison = comparison
         self.__templates = Environment(loader=FileSystemLoader(self.__PATH_TEMPLATES))
 
     def all(self) -> None:
@@ -127,7 +142,7 @@ class MainGenerator(Generator):
 
         with open(file_path, 'a') as f:
             for file_with_requests in self._get_file_paths_with_requests():
-                helper_method_name = self._get_helper_method_name(file_with_requests)
+                helper_method_name = self.get_helper_method_name(file_with_requests)
                 if helper_method_name not in content_helpers:
                     self.log.info(f'Generate helper: "{helper_method_name}" for file {file_with_requests}')
                     template = self._get_template(self.__TEMPLATE_HELPER_METHOD)
@@ -145,13 +160,25 @@ class MainGenerator(Generator):
             file_path=os.path.join(
                 self.__DIRECTORY_SCENARIOS, dirname, f'{self._get_scenario_name(file_path_with_requests)}.py'
             ),
-            template_name=self.__TEMPLATE_SCENARIO,
+            template_name=self.__TEMPLATE_SCENARIO_CONCURRENT if self.__concurrent else self.__TEMPLATE_SCENARIO,
             file_path_with_requests=file_path_with_requests,
-            helper_method_name=self._get_helper_method_name(file_path_with_requests)
+            helper_method_name=self.get_helper_method_name(file_path_with_requests),
+            replay_arguments=self._get_replay_arguments(),
+            comparison=self.__comparison
         )
 
+    def _get_replay_arguments(self) -> str:
+        arguments = ''
+        if self.__deduplicate:
+            arguments += ', deduplicate=True'
+        if self.__sample is not None:
+            arguments += f', sample={self.__sample}'
+            if self.__sample_by != SAMPLE_BY_PATH:
+                arguments += f', sample_by="{self.__sample_by}"'
+        return arguments
+
     @classmethod
-    def _get_helper_method_name(cls, file_path_with_requests: str) -> str:
+    def get_helper_method_name(cls, file_path_with_requests: str) -> str:
         return 'prepare_' + cls._get_scenario_name(file_path_with_requests)
 
     @staticmethod
@@ -162,12 +189,7 @@ class MainGenerator(Generator):
         if not os.path.exists(self.__requests_dir):
             raise DirectoryWithRequestsNotFound(f"The directory with requests: {self.__requests_dir} was not found")
 
-        file_with_requests = []
-        for root, _, files in os.walk(self.__requests_dir):
-            for file in files:
-                if file.endswith('.txt') or file.endswith('.http'):
-                    file_with_requests.append(os.path.join(root, file))
-        return file_with_requests
+        return find_request_files(self.__requests_dir)
 
     def _get_template(self, template_name: str) -> Template:
         return self.__templates.get_template(name=template_name)
@@ -178,7 +200,12 @@ def generate(args: Any) -> None:
     log = logging.getLogger("Generator")
 
     try:
-        getattr(MainGenerator(requests_dir=args.requests_dir, force=args.force, log=log), args.option)()
+        generator = MainGenerator(
+            requests_dir=args.requests_dir, force=args.force, log=log, concurrent=args.concurrent,
+            deduplicate=args.deduplicate, sample=args.sample, sample_by=args.sample_by,
+            comparison=args.comparison
+        )
+        getattr(generator, args.option)()
         log.info("The necessary files have been generated!\n"
                  "To run the tests, you need to specify two api url to which request will be sent."
                  "You need to set environment variables in any convenient way, for example:\n"
@@ -0,0 +1,129 @@
+import asyncio
+import time
+from collections import deque
+from typing import Callable, Deque, Optional
+
+import httpx
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate, 1.0)
+        self._clock = clock
+        self._tokens = self.burst
+        self._updated_at = clock()
+
+    def reserve(self) -> float:
+        # Tokens may go into debt, the caller waits until its token is refilled, so callers are served in order
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class AdaptiveLimit:
+    def __init__(self, max_limit: int, min_limit: int = 1, latency_tolerance: float = 2.0,
+                 backoff: float = 0.75, clock: Callable[[], float] = time.monotonic) -> None:
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.latency_tolerance = latency_tolerance
+        self.backoff = backoff
+        self.limit = float(min_limit)
+        self.min_latency: Optional[float] = None
+        self._clock = clock
+        self._decreased_at = float("-inf")
+
+    def on_success(self, started_at: float, latency: float) -> None:
+        if self.min_latency is None or latency < self.min_latency:
+            self.min_latency = latency
+        if latency > self.min_latency * self.latency_tolerance:
+            self._decrease(started_at)
+        else:
+            # Additive increase: about one more concurrent request per `limit` successful requests
+            self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+
+    def on_failure(self, started_at: float) -> None:
+        self._decrease(started_at)
+
+    def _decrease(self, started_at: float) -> None:
+        # The requests sent before the previous decrease don't reflect the current limit
+        if started_at < self._decreased_at:
+            return
+        self.limit = max(float(self.min_limit), self.limit * self.backoff)
+        self._decreased_at = self._clock()
+
+
+class HostLimiter:
+    def __init__(self, rate_limit: Optional[float] = None, adaptive_limit: Optional[AdaptiveLimit] = None,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self.bucket = TokenBucket(rate_limit, clock=clock) if rate_limit else None
+        self.adaptive_limit = adaptive_limit
+        self.in_flight = 0
+        self._clock = clock
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+
+    async def acquire(self) -> float:
+        if self.adaptive_limit is not None:
+            while self.in_flight >= int(self.adaptive_limit.limit):
+                waiter = asyncio.get_running_loop().create_future()
+                self._waiters.append(waiter)
+                try:
+                    await waiter
+                except asyncio.CancelledError:
+                    # The slot given to the cancelled waiter is passed to the next one
+                    self._wake_up()
+                    raise
+            self.in_flight += 1
+        if self.bucket is not None:
+            delay = self.bucket.reserve()
+            if delay > 0:
+                try:
+                    await asyncio.sleep(delay)
+                except asyncio.CancelledError:
+                    if self.adaptive_limit is not None:
+                        self.in_flight -= 1
+                        self._wake_up()
+                    raise
+        return self._clock()
+
+    def release(self, started_at: float, failed: bool) -> None:
+        if self.adaptive_limit is None:
+            return
+        if failed:
+            self.adaptive_limit.on_failure(started_at)
+        else:
+            self.adaptive_limit.on_success(started_at, self._clock() - started_at)
+        self.in_flight -= 1
+        self._wake_up()
+
+    def _wake_up(self) -> None:
+        assert self.adaptive_limit is not None
+        free_slots = int(self.adaptive_limit.limit) - self.in_flight
+        while free_slots > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free_slots -= 1
+
+
+class LimitedTransport(httpx.AsyncBaseTransport):
+    def __init__(self, transport: httpx.AsyncBaseTransport, limiter: HostLimiter) -> None:
+        self._transport = transport
+        self._limiter = limiter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started_at = await self._limiter.acquire()
+        failed = True
+        try:
+            response = await self._transport.handle_async_request(request)
+            # Overloaded api answers with 5xx or 429, the concurrency is decreased as on timeouts
+            failed = response.status_code >= 500 or response.status_code == 429
+            return response
+        finally:
+            self._limiter.release(started_at, failed)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
@@ -0,0 +1,315 @@
+import gzip
+import json
+import logging
+import os
+import re
+import sys
+from collections import Counter, OrderedDict
+from json import JSONDecodeError
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Pattern, Set, Union
+
+from .parse_requests import get_relative_url
+from .request import Request
+from .sample_requests import SAMPLE_BY_PATH, RequestDeduplicator, RequestSampler
+
+SOURCE_FORMATS = ("auto", "nginx", "har")
+OUTPUT_FORMATS = ("http", "jsonl")
+
+# Headers describing the connection to the recorded api, not the request itself
+SKIPPED_HEADERS = {"host", "content-length", "connection", "keep-alive", "transfer-encoding", "accept-encoding"}
+
+
+class ImportException(Exception):
+    pass
+
+
+class IncorrectSource(ImportException):
+    pass
+
+
+class UnsupportedRequest(ImportException):
+    pass
+
+
+def open_source(source: str) -> IO[str]:
+    if source.endswith(".gz"):
+        return gzip.open(source, "rt", errors="replace")
+    return open(source, errors="replace")
+
+
+def get_source_format(source: str) -> str:
+    name = source[:-len(".gz")] if source.endswith(".gz") else source
+    return "har" if name.endswith(".har") else "nginx"
+
+
+_access_log_request = re.compile(r'"([A-Z]+) (\S+) HTTP/[0-9.]+"')
+
+
+def iter_access_log_requests(lines: Iterable[str], source: str = "") -> Iterator[Request]:
+    # The request line is found in any format of the log, the default one is "combined":
+    # $remote_addr - $remote_user [$time_local] "$request" $status $body_bytes_sent "$http_referer" "$http_user_agent"
+    for line_number, line in enumerate(lines, start=1):
+        match = _access_log_request.search(line)
+        if match is not None:
+            method, target = match.groups()
+            yield Request(method=method, url=get_relative_url(target), comment=f"{source}:{line_number}")
+
+
+_har_entries = re.compile(r'"entries"\s*:\s*\[')
+
+
+def iter_har_entries(f: IO[str], chunk_size: int = 1 << 16,
+                     max_entry_size: int = 1 << 27) -> Iterator[Dict[str, Any]]:
+    # Only the current entry and the unread part of the chunk are kept in memory
+    buffer = ""
+    while True:
+        match = _har_entries.search(buffer)
+        if match is not None:
+            buffer = buffer[match.end():]
+            break
+        chunk = f.read(chunk_size)
+        if not chunk:
+            raise IncorrectSource("Expected the list of entries in HAR")
+        buffer = buffer[-64:] + chunk
+
+    decoder = json.JSONDecoder()
+    position = 0
+    read_size = chunk_size
+    while True:
+        while position < len(buffer) and buffer[position] in " \t\r\n,":
+            position += 1
+        if position < len(buffer) and buffer[position] == "]":
+            return
+
+        try:
+            if position == len(buffer):
+                raise JSONDecodeError("Expected entry", buffer, position)
+            entry, position = decoder.raw_decode(buffer, position)
+        except JSONDecodeError:
+            # The entry is not read to the end, the size of reading is doubled for the large entries
+            if len(buffer) - position > max_entry_size:
+                raise IncorrectSource(f"Failed to read the entry of HAR, it is incorrect "
+                                      f"or larger than {max_entry_size} bytes")
+            chunk = f.read(read_size)
+            if not chunk:
+                raise IncorrectSource("Failed to read the entry of HAR, unexpected end of file")
+            buffer, position = buffer[position:] + chunk, 0
+            read_size *= 2
+            continue
+
+        if not isinstance(entry, dict):
+            raise IncorrectSource("Expected entry of HAR as json object")
+        read_size = chunk_size
+        if position > chunk_size:
+            buffer, position = buffer[position:], 0
+        yield entry
+
+
+def _get_har_headers(request: Dict[str, Any]) -> Optional[Dict[str, str]]:
+    headers = {}
+    for header in request.get("headers") or []:
+        name = header.get("name") if isinstance(header, dict) else None
+        value = header.get("value") if isinstance(header, dict) else None
+        if not isinstance(name, str) or not isinstance(value, str):
+            return None
+        if not name.startswith(":") and name.lower() not in SKIPPED_HEADERS:
+            headers[name] = value
+    return headers
+
+
+def iter_har_requests(f: IO[str], source: str = "") -> Iterator[Union[Request, UnsupportedRequest]]:
+    for number, entry in enumerate(iter_har_entries(f), start=1):
+        request = entry.get("request") or {}
+        post_data = request.get("postData") or {}
+        text = post_data.get("text") or ""
+        try:
+            json_body = json.loads(text) if text.strip() else None
+        except JSONDecodeError:
+            # The request files support only json bodies
+            yield UnsupportedRequest(f"{source}:{number}: the body of the request is not json")
+            continue
+        headers = _get_har_headers(request)
+        if headers is None:
+            yield UnsupportedRequest(f"{source}:{number}: the headers of the request are incorrect")
+            continue
+        yield Request(
+            method=request.get("method", "GET"),
+            url=get_relative_url(request.get("url", "/")),
+            comment=f"{source}:{number}",
+            headers=headers,
+            json_body=json_body,
+        )
+
+
+def iter_source_requests(source: str, source_format: str = "auto") -> Iterator[Union[Request, UnsupportedRequest]]:
+    if source_format == "auto":
+        source_format = get_source_format(source)
+    with open_source(source) as f:
+        if source_format == "har":
+            yield from iter_har_requests(f, os.path.basename(source))
+        else:
+            yield from iter_access_log_requests(f, os.path.basename(source))
+
+
+# Numbers, uuids and long hex ids like ObjectId
+_id_segment = re.compile(r"\d+|[0-9a-fA-F]{8}(-?[0-9a-fA-F]{4}){3}-?[0-9a-fA-F]{12}|[0-9a-fA-F]{24,}")
+
+
+def get_endpoint_name(request: Request) -> str:
+    # The ids in the path are dropped, so /users/1 and /users/2 are the requests of one endpoint
+    segments = [segment for segment in request.path.split("/") if segment and not _id_segment.fullmatch(segment)]
+    name = re.sub(r"[^a-z0-9]+", "_", "_".join([request.method.lower()] + segments).lower()).strip("_")
+    return name if segments else f"{name}_root"
+
+
+_http_header_name = re.compile(r"[A-Za-z-]+")
+_http_header_value = re.compile(r"[!-~][ -~]*")
+
+
+def format_http_request(request: Request) -> str:
+    if request.json_body is not None and not isinstance(request.json_body, (dict, list)):
+        raise UnsupportedRequest("The body of .http request should be a json object or list")
+    lines = [f"### {request.comment}".rstrip(), f"{request.method} https://{{{{host}}}}{request.url}"]
+    for name, value in request.headers.items():
+        # The headers which the format of .http file doesn't allow are dropped
+        if _http_header_name.fullmatch(name) and _http_header_value.fullmatch(value.strip()):
+            lines.append(f"{name}: {value.strip()}")
+    if request.json_body is not None:
+        lines += ["", json.dumps(request.json_body, ensure_ascii=False)]
+    return "\n".join(lines) + "\n\n"
+
+
+def format_jsonl_request(request: Request) -> str:
+    data: Dict[str, Any] = {"method": request.method, "url": request.url}
+    if request.comment:
+        data["comment"] = request.comment
+    if request.headers:
+        data["headers"] = request.headers
+    if request.json_body is not None:
+        data["body"] = request.json_body
+    return json.dumps(data, ensure_ascii=False) + "\n"
+
+
+class RequestFilter:
+    def __init__(self, methods: Optional[Iterable[str]] = None, path_pattern: Optional[str] = None) -> None:
+        self.methods = {method.upper() for method in methods} if methods else None
+        self.path_pattern: Optional[Pattern[str]] = re.compile(path_pattern) if path_pattern else None
+
+    def __call__(self, request: Request) -> bool:
+        if self.methods is not None and request.method.upper() not in self.methods:
+            return False
+        return self.path_pattern is None or self.path_pattern.search(request.path) is not None
+
+
+class RequestWriter:
+    def __init__(self, output_dir: str, output_format: str = "http", force: bool = False,
+                 log: Optional[logging.Logger] = None, max_open_files: int = 64) -> None:
+        self.output_dir = output_dir
+        self.output_format = output_format
+        self.force = force
+        self.log = log or logging.getLogger("Import")
+        self.max_open_files = max_open_files
+        self.written: Counter[str] = Counter()
+        self._files: "OrderedDict[str, IO[str]]" = OrderedDict()
+        self._skipped_files: Set[str] = set()
+
+    def write(self, request: Request) -> bool:
+        file_path = os.path.join(self.output_dir, f"{get_endpoint_name(request)}.{self.output_format}")
+        if file_path in self._skipped_files:
+            return False
+        if self.output_format == "http":
+            data = format_http_request(request)
+        else:
+            data = format_jsonl_request(request)
+
+        f = self._open(file_path)
+        if f is None:
+            return False
+        f.write(data)
+        self.written[file_path] += 1
+        return True
+
+    def close(self) -> None:
+        while self._files:
+            self._files.popitem()[1].close()
+
+    def _open(self, file_path: str) -> Optional[IO[str]]:
+        f = self._files.get(file_path)
+        if f is not None:
+            self._files.move_to_end(file_path)
+            return f
+
+        if file_path not in self.written:
+            if os.path.exists(file_path) and not self.force:
+                self.log.warning(f'Skip: "{file_path}" already exists, use --force to overwrite it')
+                self._skipped_files.add(file_path)
+                return None
+            os.makedirs(self.output_dir, exist_ok=True)
+            mode = "w"
+        else:
+            # The file was closed to keep the number of open files bounded, the requests are appended to it
+            mode = "a"
+
+        if len(self._files) >= self.max_open_files:
+            self._files.popitem(last=False)[1].close()
+        f = self._files[file_path] = open(file_path, mode)
+        return f
+
+
+def import_sources(
+    sources: List[str],
+    writer: RequestWriter,
+    request_filter: RequestFilter,
+    source_format: str = "auto",
+    deduplicate: bool = False,
+    sample: Optional[int] = None,
+    sample_by: str = SAMPLE_BY_PATH,
+) -> Counter[str]:
+    stats: Counter[str] = Counter()
+    deduplicator = RequestDeduplicator() if deduplicate else None
+    sampler = RequestSampler(sample, sample_by) if sample is not None else None
+    try:
+        for source in sources:
+            for request in iter_source_requests(source, source_format):
+                if isinstance(request, UnsupportedRequest):
+                    stats["unsupported"] += 1
+                    continue
+                if not request_filter(request):
+                    stats["filtered"] += 1
+                    continue
+                if deduplicator is not None and not deduplicator(request):
+                    stats["duplicates"] += 1
+                    continue
+                if sampler is not None and not sampler(request):
+                    stats["sampled out"] += 1
+                    continue
+                try:
+                    imported = writer.write(request)
+                except UnsupportedRequest:
+                    stats["unsupported"] += 1
+                    continue
+                stats["imported" if imported else "skipped"] += 1
+    finally:
+        writer.close()
+    return stats
+
+
+def import_requests(args: Any) -> None:
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    log = logging.getLogger("Import")
+
+    writer = RequestWriter(args.output_dir, args.output_format, force=args.force, log=log)
+    try:
+        stats = import_sources(
+            args.sources, writer, RequestFilter(args.method, args.path), args.format,
+            deduplicate=args.deduplicate, sample=args.sample, sample_by=args.sample_by,
+        )
+    except (ImportException, OSError) as e:
+        log.critical(f"{type(e).__name__}: {e}")
+        sys.exit(2)
+
+    for file_path, count in sorted(writer.written.items()):
+        log.info(f'Import: {count} requests into "{file_path}"')
+    log.info(f"Imported {stats['imported']} requests into {len(writer.written)} files, "
+             f"filtered out {stats['filtered']}, duplicates {stats['duplicates']}, "
+             f"sampled out {stats['sampled out']}, unsupported {stats['unsupported']}, skipped {stats['skipped']}")
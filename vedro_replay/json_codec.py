@@ -0,0 +1,74 @@
+import json
+from typing import Any, Callable, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+JSON_BACKEND_JSON = "json"
+JSON_BACKEND_ORJSON = "orjson"
+JSON_BACKENDS = (JSON_BACKEND_JSON, JSON_BACKEND_ORJSON)
+
+# orjson decodes integers beyond 64 bits as floats, so different big integers would be equal.
+# The data with a run of 19 digits, which is not the fraction or the exponent of a float, is decoded by json.
+# The digits are found by bytes.translate(), it is about 10 times faster than orjson.loads(), a regex is slower
+_DIGITS_TABLE = bytes(
+    ord("0") if chr(i) in "0123456789" else ord(".") if chr(i) in ".eE" else ord(" ") for i in range(256)
+)
+_LONG_NUMBER = b" " + b"0" * 19
+
+
+class JsonCodec:
+    def __init__(self) -> None:
+        self.loads: Callable[[Union[str, bytes, memoryview]], Any]
+        self.dumps: Callable[[Any], str]
+        self.configure(JSON_BACKEND_ORJSON if orjson is not None else JSON_BACKEND_JSON)
+
+    def configure(self, backend: str) -> None:
+        assert backend in JSON_BACKENDS, f"Unknown json backend '{backend}', expected one of {JSON_BACKENDS}"
+        if backend == JSON_BACKEND_ORJSON and orjson is None:
+            raise ValueError("The json backend 'orjson' is not installed, use pip install orjson")
+        self.backend = backend
+        # The functions of the backend are bound once, so there are no checks on every call
+        if backend == JSON_BACKEND_ORJSON:
+            self.loads, self.dumps = self._orjson_loads, self._orjson_dumps
+        else:
+            self.loads, self.dumps = self._json_loads, self._json_dumps
+
+    @staticmethod
+    def _json_loads(data: Union[str, bytes, memoryview]) -> Any:
+        return json.loads(bytes(data) if isinstance(data, memoryview) else data)
+
+    @staticmethod
+    def _json_dumps(data: Any) -> str:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def _orjson_loads(cls, data: Union[str, bytes, memoryview]) -> Any:
+        # The bytes are decoded directly, without a str. The data orjson rejects and json accepts
+        # (NaN, lone surrogates, utf-16) is decoded by json, it raises the error if the data is not json
+        if cls._has_long_number(data):
+            return cls._json_loads(data)
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return cls._json_loads(data)
+
+    @staticmethod
+    def _has_long_number(data: Union[str, bytes, memoryview]) -> bool:
+        if isinstance(data, str):
+            data = data.encode(errors="surrogatepass")
+        digits = bytes(data).translate(_DIGITS_TABLE)
+        return _LONG_NUMBER in digits or digits.startswith(_LONG_NUMBER[1:])
+
+    @classmethod
+    def _orjson_dumps(cls, data: Any) -> str:
+        # Keys which are not strings and integers beyond 64 bits are not supported by orjson
+        try:
+            return orjson.dumps(data).decode()
+        except TypeError:
+            return cls._json_dumps(data)
+
+
+json_codec = JsonCodec()
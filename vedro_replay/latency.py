@@ -0,0 +1,124 @@
+import math
+import time
+from array import array
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+LATENCY_GROUP_BY_FILE = "file"
+LATENCY_GROUP_BY_PATH = "path"
+LATENCY_GROUP_BY = (LATENCY_GROUP_BY_FILE, LATENCY_GROUP_BY_PATH)
+
+METRICS = ("connect", "ttfb", "total")
+PERCENTILES = (50, 95, 99)
+
+
+class Timing(NamedTuple):
+    connect: float
+    ttfb: float
+    total: float
+
+
+class TimingTrace:
+    # The trace extension of httpx is called by httpcore on each step of the request: connection.connect_tcp.started,
+    # http11.receive_response_headers.complete... The time waiting for a free connection or for the rate limit
+    # is not traced, so the timing of golden and testing doesn't depend on the limits of the client
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self._started_at: Optional[float] = None
+        self._connect_started_at = 0.0
+        self.connect = 0.0
+        self.ttfb: Optional[float] = None
+        self.total: Optional[float] = None
+
+    async def __call__(self, event_name: str, info: Dict[str, Any]) -> None:
+        now = self._clock()
+        if self._started_at is None:
+            self._started_at = now
+        step = event_name.split(".", 1)[-1]
+        if step in ("connect_tcp.started", "start_tls.started"):
+            self._connect_started_at = now
+        elif step in ("connect_tcp.complete", "start_tls.complete"):
+            self.connect += now - self._connect_started_at
+        elif step == "receive_response_headers.complete":
+            self.ttfb = now - self._started_at
+        elif step == "receive_response_body.complete":
+            self.total = now - self._started_at
+
+    def timing(self) -> Optional[Timing]:
+        # A transport which doesn't send the events (e.g. a mock one) has no timing
+        if self.ttfb is None or self.total is None:
+            return None
+        return Timing(self.connect, self.ttfb, self.total)
+
+
+def percentile(sorted_values: Sequence[float], p: float) -> float:
+    # The nearest-rank percentile: the smallest value which is not less than p percent of the values
+    return sorted_values[max(0, math.ceil(p / 100 * len(sorted_values)) - 1)]
+
+
+class LatencyRegression(NamedTuple):
+    group: str
+    metric: str
+    p: int
+    golden: float
+    testing: float
+
+    def __str__(self) -> str:
+        increase = f" (+{(self.testing / self.golden - 1) * 100:.0f}%)" if self.golden else ""
+        return (f"{self.group}: {self.metric} p{self.p} "
+                f"{self.golden * 1000:.1f} -> {self.testing * 1000:.1f} ms{increase}")
+
+
+class LatencyReport:
+    def __init__(self, group_by: str = LATENCY_GROUP_BY_FILE, threshold: Optional[float] = None,
+                 min_requests: int = 20, metrics: Sequence[str] = ("total",)) -> None:
+        assert group_by in LATENCY_GROUP_BY, f"Unknown grouping '{group_by}', expected one of {LATENCY_GROUP_BY}"
+        self.group_by = group_by
+        # Percents by which a percentile of testing may exceed the one of golden, None - the latency is only reported
+        self.threshold = threshold
+        self.min_requests = min_requests
+        self.metrics = metrics
+        # The timings of each group are kept in arrays of doubles: 8 bytes per value, columns by METRICS
+        self._timings: Dict[str, Tuple[List["array[float]"], List["array[float]"]]] = {}
+
+    def add(self, requests_file: str, path: str, golden: Timing, testing: Timing) -> None:
+        group = requests_file if self.group_by == LATENCY_GROUP_BY_FILE else path
+        timings = self._timings.get(group)
+        if timings is None:
+            timings = self._timings[group] = ([array("d") for _ in METRICS], [array("d") for _ in METRICS])
+        for golden_values, testing_values, golden_value, testing_value in zip(*timings, golden, testing):
+            golden_values.append(golden_value)
+            testing_values.append(testing_value)
+
+    def percentiles(self, group: str, metric: str) -> List[Tuple[int, float, float]]:
+        index = METRICS.index(metric)
+        golden, testing = (sorted(values[index]) for values in self._timings[group])
+        return [(p, percentile(golden, p), percentile(testing, p)) for p in PERCENTILES]
+
+    def regressions(self) -> List[LatencyRegression]:
+        if self.threshold is None:
+            return []
+        regressions = []
+        for group, (golden, _) in sorted(self._timings.items()):
+            # The percentiles of a few requests are mostly noise
+            if len(golden[0]) < self.min_requests:
+                continue
+            for metric in self.metrics:
+                for p, golden_value, testing_value in self.percentiles(group, metric):
+                    if testing_value > golden_value * (1 + self.threshold / 100):
+                        regressions.append(LatencyRegression(group, metric, p, golden_value, testing_value))
+        return regressions
+
+    def render(self) -> List[str]:
+        lines = ["Latency of golden -> testing, ms:"]
+        for group, (golden, _) in sorted(self._timings.items()):
+            lines.append(f"  {group}: {len(golden[0])} requests")
+            for metric in METRICS:
+                lines.append(f"    {metric:<8}" + "  ".join(
+                    f"p{p} {golden_value * 1000:.1f} -> {testing_value * 1000:.1f}"
+                    for p, golden_value, testing_value in self.percentiles(group, metric)
+                ))
+        regressions = self.regressions()
+        if regressions:
+            lines.append(f"Latency regressions (threshold +{self.threshold:g}%):")
+            lines += [f"  {regression}" for regression in regressions]
+        return lines
@@ -0,0 +1,121 @@
+import re
+from typing import Any, Iterator, List, Sequence, Tuple, Union, overload
+
+from .decode_json import decode_json
+from .exclude import ExcludeSet
+from .json_codec import json_codec
+
+_BOUNDARY = re.compile(r';\s*boundary\s*=\s*(?:"([^"]+)"|([^\s;]+))', re.IGNORECASE)
+
+
+class IncorrectMultipartContent(Exception):
+    pass
+
+
+def get_boundary(content_type: str) -> bytes:
+    match = _BOUNDARY.search(content_type)
+    if not content_type.lower().startswith("multipart/") or match is None:
+        raise IncorrectMultipartContent(f"Expected multipart content type with boundary, got '{content_type}'")
+    return (match.group(1) or match.group(2)).encode()
+
+
+def split_parts(content: bytes, boundary: bytes) -> List[Tuple[int, int]]:
+    # Only the offsets of the bodies of the parts are found, the content is not copied
+    delimiter = b"--" + boundary
+    if content.startswith(delimiter):
+        position = len(delimiter)
+    else:
+        position = content.find(b"\r\n" + delimiter)
+        if position == -1:
+            raise IncorrectMultipartContent("The boundary of the parts was not found in the content")
+        position += 2 + len(delimiter)
+
+    spans = []
+    delimiter = b"\r\n" + delimiter
+    while not content.startswith(b"--", position):
+        headers_end = content.find(b"\r\n\r\n", position)
+        if headers_end == -1:
+            raise IncorrectMultipartContent(f"Expected the end of headers of the part at byte {position}")
+        start = headers_end + 4
+        end = content.find(delimiter, start)
+        if end == -1:
+            spans.append((start, len(content)))
+            break
+        spans.append((start, end))
+        position = end + len(delimiter)
+    return spans
+
+
+class MultipartBody(Sequence[Any]):
+    _NOT_DECODED = object()
+
+    def __init__(self, content: bytes, spans: List[Tuple[int, int]]) -> None:
+        self._content = memoryview(content)
+        self._spans = spans
+        self._parts: List[Any] = [self._NOT_DECODED] * len(spans)
+        self._excludes: List[ExcludeSet] = []
+
+    @classmethod
+    def from_content(cls, content: bytes, content_type: str) -> "MultipartBody":
+        return cls(content, split_parts(content, get_boundary(content_type)))
+
+    @classmethod
+    def from_parts(cls, parts: List[Any]) -> "MultipartBody":
+        body = cls(b"", [])
+        body._parts = list(parts)
+        return body
+
+    def exclude(self, excludes: ExcludeSet) -> None:
+        # The decoded parts are filtered now, the others are filtered while they are decoded
+        for part in self._parts:
+            if part is not self._NOT_DECODED:
+                excludes.execute(part)
+        self._excludes.append(excludes)
+
+    def is_decoded(self, index: int) -> bool:
+        return self._parts[index] is not self._NOT_DECODED
+
+    def _decode(self, index: int) -> Any:
+        start, end = self._spans[index]
+        data = self._content[start:end]
+        if not self._excludes:
+            return json_codec.loads(data)
+        part = decode_json(data, self._excludes[0])
+        for excludes in self._excludes[1:]:
+            excludes.execute(part)
+        return part
+
+    @overload
+    def __getitem__(self, index: int) -> Any:
+        pass
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Any]:
+        pass
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        part = self._parts[index]
+        if part is self._NOT_DECODED:
+            # Each part is decoded once, on the first access
+            part = self._parts[index] = self._decode(index)
+        return part
+
+    def __len__(self) -> int:
+        return len(self._parts)
+
+    def __iter__(self) -> Iterator[Any]:
+        # The parts which were not accessed by index are not kept, so a comparison of the bodies part by part
+        # keeps in memory only the current parts
+        for index, part in enumerate(self._parts):
+            yield self._decode(index) if part is self._NOT_DECODED else part
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (MultipartBody, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        decoded = sum(part is not self._NOT_DECODED for part in self._parts)
+        return f"<MultipartBody: {len(self)} parts, {decoded} decoded>"
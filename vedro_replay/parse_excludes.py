@@ -1,8 +1,9 @@
-from typing import List
+from functools import lru_cache
+from typing import List, Sequence, Tuple, Union
 
-from pyparsing import CharsNotIn, Optional, Suppress, ZeroOrMore, restOfLine
+from pyparsing import CharsNotIn, Optional, ParseException, Suppress, ZeroOrMore, restOfLine
 
-from .exclude import Exclude
+from .exclude import Exclude, ExcludeSet, IncorrectExclude
 
 
 class ExcludeParser:
@@ -24,8 +25,23 @@ class ExcludeParser:
 
     @classmethod
     def parse(cls, data: str) -> Exclude:
-        return Exclude(**cls.exclude.parse_string(data)[0])
+        try:
+            return Exclude(**cls.exclude.parse_string(data)[0])
+        except ParseException as e:
+            raise IncorrectExclude(f"Failed to process exclude '{data}'") from e
 
 
 def parse_excludes(raw_excludes: List[str]) -> List[Exclude]:
     return [ExcludeParser.parse(raw_exclude) for raw_exclude in raw_excludes]
+
+
+@lru_cache(maxsize=1024)
+def _compile_excludes(raw_excludes: Tuple[str, ...]) -> ExcludeSet:
+    return ExcludeSet(parse_excludes(list(raw_excludes)))
+
+
+def compile_excludes(raw_excludes: Union[Sequence[str], ExcludeSet]) -> ExcludeSet:
+    # The rules of the helpers are the same for every response, so they are parsed once per distinct list
+    if isinstance(raw_excludes, ExcludeSet):
+        return raw_excludes
+    return _compile_excludes(tuple(raw_excludes))
@@ -1,26 +1,18 @@
+import io
 import json
-import string
+import os
+import re
+import sys
 from abc import ABC, abstractmethod
 from json import JSONDecodeError
 from pathlib import PurePosixPath
-from typing import List
-
-from pyparsing import (
-    CharsNotIn,
-    Combine,
-    OneOrMore,
-    Optional,
-    ParseException,
-    Suppress,
-    Word,
-    ZeroOrMore,
-    alphas,
-    printables,
-    restOfLine,
-)
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Type
+from urllib.parse import urlsplit
 
 from .request import Request
 
+REQUEST_FILE_SUFFIXES = (".http", ".txt", ".jsonl")
+
 
 class RequestParserException(Exception):
     pass
@@ -34,85 +26,232 @@ class UnsupportedRequestFileFormat(RequestParserException):
     pass
 
 
+class RequestSyntaxError(RequestParserException):
+    def __init__(self, message: str, line_number: int) -> None:
+        super().__init__(f"{message} (line {line_number})")
+        self.line_number = line_number
+
+
+def get_relative_url(url: str) -> str:
+    # Captured urls contain the host of the recorded api, the requests are sent to golden and testing instead
+    if url.startswith("https://{{host}}") or url.startswith("http://{{host}}"):
+        return url[url.index("}}") + 2:] or "/"
+    parts = urlsplit(url)
+    if not parts.scheme and not parts.netloc:
+        return url
+    return (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+
 class RequestParser(ABC):
     @classmethod
     @abstractmethod
-    def parse(cls, data: str) -> List[Request]:
+    def parse_lines(cls, lines: Iterable[str]) -> Iterator[Request]:
         pass
 
+    @classmethod
+    def parse(cls, data: str) -> Iterator[Request]:
+        return cls.parse_lines(io.StringIO(data))
+
 
 class TxtRequestParser(RequestParser):
     @classmethod
-    def parse(cls, data: str) -> List[Request]:
-        return [Request(method="GET", url=url) for url in data.splitlines()]
+    def parse_lines(cls, lines: Iterable[str]) -> Iterator[Request]:
+        for line in lines:
+            for url in line.splitlines():
+                yield Request(method="GET", url=url)
 
 
 class HttpRequestParser(RequestParser):
-    delimiter_string = Combine(
-        Suppress("###") +
-        Optional(Suppress(ZeroOrMore(" "))) +
-        restOfLine
-    ).set_name("delimiter string with the format '### comment'").set_results_name("comment")
-
-    method = Word(string.ascii_uppercase).set_name("http method").set_results_name("method")
-
-    url = Combine(
-        Suppress("http" + Optional("s")) +
-        Suppress("://{{host}}") +
-        restOfLine
-    ).set_name("request uri with the format http(s)://{{host}}/...").set_results_name("url")
-
-    header_name = Word(alphas + "-").set_results_name("header_name")
-    header_value = Word(printables + " ").set_results_name("header_value")
-    header = (header_name + Suppress(":") + header_value).set_parse_action(
-        lambda t: {"key": t.header_name, "value": t.header_value})
-    headers = ZeroOrMore(header).set_results_name("headers").set_parse_action(
-        lambda t: {h["key"]: h["value"] for h in t})
-
-    json_body = Combine(
-        Word("{[") +
-        Optional(Suppress("\n")) +
-        OneOrMore(CharsNotIn("\n") + Optional(Suppress("\n")))
-    ).set_results_name("json_body")
-
-    request = (
-            delimiter_string +
-            method +
-            url +
-            Optional(headers) +
-            Optional(json_body)
-    ).set_results_name("request").set_parse_action(
-        lambda t: {
-            "comment": t.comment or "",
-            "method": t.method,
-            "url": t.url,
-            "headers": t.headers or None,
-            "json_body": json.loads(t.json_body) if t.json_body else None
-        }
-    )
+    _WHITESPACE = " \r"
+    _BODY_START = "{["
+
+    _method = re.compile(r"([A-Z]+)[ \r]*")
+    _url = re.compile(r"https?://\{\{host\}\}(.*)", re.DOTALL)
+    _header = re.compile(r"([A-Za-z-]+)[ \r]*:[ \r]*([!-~ ]*)(.*)", re.DOTALL)
+    _header_value = re.compile(r"([!-~ ]+)(.*)", re.DOTALL)
+
+    _STATE_DELIMITER = "delimiter"
+    _STATE_METHOD = "method"
+    _STATE_URL = "url"
+    _STATE_HEADERS = "headers"
+    _STATE_BODY = "body"
 
     @classmethod
-    def parse(cls, data: str) -> List[Request]:
-        return [
-            Request(**request_data)
-            for request_data in OneOrMore(cls.request).parse_string(data, parse_all=True).as_list()
-        ]
+    def parse_lines(cls, lines: Iterable[str]) -> Iterator[Request]:
+        # Single pass over the lines, the request is yielded as soon as the next one begins
+        state = cls._STATE_DELIMITER
+        request: Dict[str, Any] = {}
+        body: List[str] = []
+        header_without_value: Optional[str] = None
+        line_number = 0
+        parsed_any = False
 
+        for line_number, raw_line in enumerate(lines, start=1):
+            line = raw_line.rstrip("\n").expandtabs()
 
-def parse_requests(requests_file: str) -> List[Request]:
-    with open(requests_file) as f:
-        data = f.read()
+            if state == cls._STATE_BODY:
+                if line:
+                    body.append(line)
+                    continue
+                yield cls._build_request(request, body, line_number)
+                state, request, body = cls._STATE_DELIMITER, {}, []
+                continue
+
+            text = line.lstrip(cls._WHITESPACE)
+            if not text:
+                continue
+
+            if header_without_value is not None:
+                # The value of a header without a value on its line is taken from the next non-empty line
+                match = cls._header_value.fullmatch(text)
+                if match is None or match.group(2).strip(cls._WHITESPACE):
+                    raise RequestSyntaxError("Expected header value", line_number)
+                request["headers"][header_without_value] = match.group(1)
+                header_without_value = None
+                continue
+
+            if text.startswith("###") and state in (cls._STATE_DELIMITER, cls._STATE_HEADERS):
+                if state == cls._STATE_HEADERS:
+                    yield cls._build_request(request, body, line_number)
+                request = {"comment": text[3:].lstrip(" "), "headers": {}}
+                state = cls._STATE_METHOD
+                parsed_any = True
+                continue
+
+            if state == cls._STATE_DELIMITER:
+                raise RequestSyntaxError("Expected delimiter string with the format '### comment'", line_number)
+
+            if state == cls._STATE_METHOD:
+                match = cls._method.match(text)
+                if match is None:
+                    raise RequestSyntaxError("Expected http method", line_number)
+                # Methods and names of headers repeat in all requests, the interned strings are shared by them
+                request["method"] = sys.intern(match.group(1))
+                text = text[match.end():]
+                state = cls._STATE_URL
+                if not text:
+                    continue
+
+            if state == cls._STATE_URL:
+                match = cls._url.fullmatch(text)
+                if match is None:
+                    raise RequestSyntaxError(
+                        "Expected request uri with the format http(s)://{{host}}/...", line_number
+                    )
+                request["url"] = match.group(1)
+                state = cls._STATE_HEADERS
+                continue
+
+            match = cls._header.fullmatch(text)
+            if match is not None:
+                name, value, rest = match.groups()
+                if rest.strip(cls._WHITESPACE):
+                    raise RequestSyntaxError("Expected header with the format 'Name: value'", line_number)
+                if value:
+                    request["headers"][sys.intern(name)] = value
+                else:
+                    header_without_value = sys.intern(name)
+                continue
+
+            if text[0] in cls._BODY_START:
+                body.append(text)
+                state = cls._STATE_BODY
+                continue
+
+            raise RequestSyntaxError("Expected header, json body or delimiter string", line_number)
 
+        if header_without_value is not None:
+            raise RequestSyntaxError("Expected header value", line_number)
+        if state in (cls._STATE_METHOD, cls._STATE_URL):
+            raise RequestSyntaxError(f"Expected {state}, found end of file", line_number)
+        if not parsed_any:
+            raise RequestSyntaxError("Expected delimiter string with the format '### comment'", line_number)
+        if state != cls._STATE_DELIMITER:
+            yield cls._build_request(request, body, line_number)
+
+    @classmethod
+    def _build_request(cls, request: Dict[str, Any], body: List[str], line_number: int) -> Request:
+        if body and not body[0].strip(cls._BODY_START) and len(body) == 1:
+            raise RequestSyntaxError("Expected json body", line_number)
+        # Lines of the body are glued together without separators, as in the original format grammar
+        json_body = json.loads("".join(body)) if body else None
+        return Request(json_body=json_body, **request)
+
+
+class JsonlRequestParser(RequestParser):
+    @classmethod
+    def parse_lines(cls, lines: Iterable[str]) -> Iterator[Request]:
+        # One json object per line: {"method": "POST", "url": "/users?id=1", "headers": {...}, "body": {...}}
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+            except JSONDecodeError as e:
+                raise RequestSyntaxError("Expected json object", line_number) from e
+            if not isinstance(data, dict) or not isinstance(data.get("url"), str):
+                raise RequestSyntaxError("Expected json object with the url of the request", line_number)
+            headers = data.get("headers") or {}
+            if not isinstance(headers, dict):
+                raise RequestSyntaxError("Expected headers as a json object", line_number)
+            yield Request(
+                method=sys.intern(str(data.get("method") or "GET").upper()),
+                url=get_relative_url(data["url"]),
+                comment=str(data.get("comment") or ""),
+                headers={sys.intern(str(name)): str(value) for name, value in headers.items()},
+                json_body=cls._json_body(data.get("body"), line_number),
+            )
+
+    @staticmethod
+    def _json_body(body: Any, line_number: int) -> Any:
+        # The body may be captured as raw text of the json
+        if isinstance(body, str):
+            if not body.strip():
+                return None
+            try:
+                return json.loads(body)
+            except JSONDecodeError as e:
+                raise RequestSyntaxError("Expected json body", line_number) from e
+        return body
+
+
+def get_request_parser(requests_file: str) -> Type[RequestParser]:
     file_suffix = PurePosixPath(requests_file).suffix
 
+    if file_suffix == ".http":
+        return HttpRequestParser
+    elif file_suffix == ".txt":
+        return TxtRequestParser
+    elif file_suffix == ".jsonl":
+        return JsonlRequestParser
+    else:
+        raise UnsupportedRequestFileFormat(f"File format {requests_file} not supported")
+
+
+def parse_request_lines(requests_file: str, lines: Iterable[str]) -> Iterator[Request]:
     try:
-        if file_suffix == ".http":
-            return HttpRequestParser.parse(data=data)
-        elif file_suffix == ".txt":
-            return TxtRequestParser.parse(data=data)
-        else:
-            raise UnsupportedRequestFileFormat(f"File format {requests_file} not supported")
-    except ParseException as e:
+        yield from get_request_parser(requests_file).parse_lines(lines)
+    except RequestSyntaxError as e:
         raise IncorrectContentsRequestFile(f"Failed to process file contents {requests_file}") from e
     except JSONDecodeError as e:
         raise IncorrectContentsRequestFile(f"Failed to process the json body in the file {requests_file}") from e
+
+
+def iter_requests(requests_file: str) -> Iterator[Request]:
+    get_request_parser(requests_file)
+
+    with open(requests_file) as f:
+        yield from parse_request_lines(requests_file, f)
+
+
+def parse_requests(requests_file: str) -> List[Request]:
+    return list(iter_requests(requests_file))
+
+
+def find_request_files(requests_dir: str) -> List[str]:
+    request_files = []
+    for root, _, files in os.walk(requests_dir):
+        for file in files:
+            if file.endswith(REQUEST_FILE_SUFFIXES):
+                request_files.append(os.path.join(root, file))
+    return request_files
@@ -0,0 +1,24 @@
+import inspect
+from typing import Any
+
+from .response import Response
+
+
+def is_streamed(prepare_response_method: Any) -> bool:
+    # An async helper takes the response before its body is read (it is sent with stream=True),
+    # e.g. to hash the body chunk by chunk with BinaryResponse.from_stream
+    return inspect.iscoroutinefunction(prepare_response_method)
+
+
+async def read_response(response: Any) -> None:
+    try:
+        await response.aread()
+    finally:
+        await response.aclose()
+
+
+async def prepare_response(prepare_response_method: Any, response: Any) -> Response:
+    if is_streamed(prepare_response_method):
+        return await prepare_response_method(response)  # type: ignore[no-any-return]
+    await read_response(response)
+    return prepare_response_method(response)  # type: ignore[no-any-return]
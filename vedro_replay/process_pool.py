@@ -0,0 +1,57 @@
+import importlib
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from types import ModuleType
+from typing import Any, List, Optional, Tuple
+
+import httpx
+
+from .compare import Difference, compare_responses
+from .response import JsonResponse
+
+# Status, headers, decoded content, method and url of the request: the response is sent to a process as bytes
+RawResponse = Tuple[int, List[Tuple[str, str]], bytes, str, str]
+
+_helpers: Optional[ModuleType] = None
+
+
+def dump_response(response: Any) -> RawResponse:
+    return (
+        response.status_code,
+        response.headers.multi_items(),
+        response.content,
+        response.request.method,
+        str(response.request.url),
+    )
+
+
+def load_response(raw_response: RawResponse) -> httpx.Response:
+    status, headers, content, method, url = raw_response
+    # The content is already decoded, so the response is created without Content-Encoding to not decode it again
+    response = httpx.Response(
+        status,
+        headers=[(name, value) for name, value in headers if name.lower() != "content-encoding"],
+        content=content,
+        request=httpx.Request(method, url),
+    )
+    response.headers = httpx.Headers(headers)
+    return response
+
+
+def init_process(cwd: str, helpers_module: Optional[str]) -> None:
+    global _helpers
+    sys.path.insert(0, cwd)
+    _helpers = importlib.import_module(helpers_module) if helpers_module else None
+
+
+def prepare_and_compare(helper_method_name: str, golden: RawResponse, testing: RawResponse) -> List[Difference]:
+    # Decoding, filtering and comparison of the responses are done in the process of the pool
+    prepare_response_method = getattr(_helpers, helper_method_name, JsonResponse.from_response)
+    return compare_responses(
+        prepare_response_method(load_response(golden)), prepare_response_method(load_response(testing))
+    )
+
+
+def create_process_pool(processes: int, helpers_module: Optional[str]) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(processes, initializer=init_process, initargs=(os.getcwd(), helpers_module))
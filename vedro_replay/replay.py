@@ -1,16 +1,51 @@
 import os
-from typing import Any, Callable
+from typing import Any, Callable, List, Optional, Sequence
 
 from vedro import params
 
 from .parse_requests import parse_requests
+from .request import Request
+from .request_cache import RequestCache
+from .request_index import index_requests
+from .sample_requests import SAMPLE_BY_PATH, RequestDeduplicator, RequestSampler
+from .sharding import Shard, shard_settings
 
 
-def replay(requests_file: str) -> Callable[..., Any]:
+def replay(
+    requests_file: str,
+    lazy: bool = False,
+    cache: bool = True,
+    deduplicate: bool = False,
+    sample: Optional[int] = None,
+    sample_by: str = SAMPLE_BY_PATH,
+    shard: Optional[Shard] = None,
+) -> Callable[..., Any]:
     assert os.path.exists(requests_file)
 
     def wrapped(fn: Callable[..., Any]) -> Callable[..., Any]:
-        for request in reversed(parse_requests(requests_file)):
+        selectors: List[Callable[[Request], bool]] = []
+        if deduplicate:
+            selectors.append(RequestDeduplicator())
+        if sample is not None:
+            selectors.append(RequestSampler(sample, sample_by))
+        # The shard is applied last, so the shards together replay the same requests as one run
+        selected_shard = shard or shard_settings.get_shard()
+        if selected_shard is not None:
+            selectors.append(selected_shard.__contains__)
+
+        def select(request: Request) -> bool:
+            return all(selector(request) for selector in selectors)
+
+        requests: Sequence[Request]
+        if lazy:
+            # The lazy requests are selected while the file is indexed, so they are not loaded one by one
+            requests = index_requests(requests_file, select if selectors else None)
+        else:
+            requests = RequestCache().parse_requests(requests_file) if cache else parse_requests(requests_file)
+            if selectors:
+                requests = list(filter(select, requests))
+
+        for request in reversed(requests):
             params(request)(fn)
         return fn
 
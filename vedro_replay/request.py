@@ -1,9 +1,16 @@
+import hashlib
 import json
 from typing import Any, Dict, List, Optional, Union
-from urllib.parse import urlparse
+from urllib.parse import parse_qsl, urlparse
+
+from .json_codec import json_codec
 
 
 class Request:
+    # Hundreds of thousands of requests can be loaded by replay(), so the requests have no __dict__,
+    # the path is parsed on the first access and the headers dict is created only if there are headers
+    __slots__ = ("comment", "method", "url", "json_body", "_headers", "_path")
+
     def __init__(
         self,
         method: str,
@@ -15,9 +22,29 @@ class Request:
         self.comment = comment
         self.method = method
         self.url = url
-        self.path = urlparse(url).path
-        self.headers = headers or {}
         self.json_body = json_body
+        self._headers = headers or None
+        self._path: Optional[str] = None
+
+    @property
+    def path(self) -> str:
+        if self._path is None:
+            self._path = urlparse(self.url).path
+        return self._path
+
+    @path.setter
+    def path(self, path: str) -> None:
+        self._path = path
+
+    @property
+    def headers(self) -> Dict[Any, Any]:
+        if self._headers is None:
+            self._headers = {}
+        return self._headers
+
+    @headers.setter
+    def headers(self, headers: Dict[Any, Any]) -> None:
+        self._headers = headers
 
     def add_header(self, key: str, value: str) -> "Request":
         self.headers[key] = value
@@ -27,17 +54,29 @@ class Request:
         self.json_body = json_body
         return self
 
+    def fingerprint(self) -> str:
+        # Equal requests have the same fingerprint regardless of the order of query parameters and headers
+        parsed_url = urlparse(self.url)
+        canonical_request = json.dumps([
+            self.method.upper(),
+            parsed_url.path,
+            sorted(parse_qsl(parsed_url.query, keep_blank_values=True)),
+            sorted((str(key).lower(), str(value)) for key, value in (self._headers or {}).items()),
+            self.json_body,
+        ], sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        return hashlib.sha256(canonical_request.encode()).hexdigest()
+
     def __repr__(self) -> str:
         return self.__str__()
 
     def __str__(self) -> str:
-        result = f"{self.method} {self.url}\n"
+        lines = [f"{self.method} {self.url}"]
 
-        if self.headers:
-            for key, value in self.headers.items():
-                result += f"{key}: {value}\n"
+        if self._headers:
+            lines += [f"{key}: {value}" for key, value in self._headers.items()]
 
         if self.json_body:
-            result += f"{json.dumps(self.json_body)}\n"
+            lines.append(json_codec.dumps(self.json_body))
 
-        return result
+        lines.append("")
+        return "\n".join(lines)
@@ -0,0 +1,121 @@
+import hashlib
+import logging
+import marshal
+import os
+import shutil
+from typing import Any, List, Optional, Tuple
+
+from .parse_requests import parse_requests
+from .request import Request
+
+DEFAULT_CACHE_DIR = '.vedro-replay-cache'
+
+
+class RequestCache:
+    __VERSION = 1
+    __ENTRY_SUFFIX = '.requests'
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR) -> None:
+        self.cache_dir = cache_dir
+
+    def parse_requests(self, requests_file: str) -> List[Request]:
+        requests = self.load(requests_file)
+        if requests is None:
+            requests = parse_requests(requests_file)
+            self.save(requests_file, requests)
+        return requests
+
+    def load(self, requests_file: str) -> Optional[List[Request]]:
+        entry = self._read_entry(requests_file)
+        if entry is None:
+            return None
+
+        version, size, mtime_ns, digest, requests_data = entry
+        stat = os.stat(requests_file)
+        if version != self.__VERSION:
+            return None
+        if (stat.st_size, stat.st_mtime_ns) != (size, mtime_ns):
+            # The file could be touched without changes (e.g. by a fresh checkout in CI), so the content is checked
+            if stat.st_size != size or self._digest(requests_file) != digest:
+                return None
+            self._write_entry(requests_file, (version, stat.st_size, stat.st_mtime_ns, digest, requests_data))
+
+        return [
+            Request(comment=comment, method=method, url=url, headers=headers, json_body=json_body)
+            for comment, method, url, headers, json_body in requests_data
+        ]
+
+    def save(self, requests_file: str, requests: List[Request]) -> None:
+        stat = os.stat(requests_file)
+        requests_data = [
+            (request.comment, request.method, request.url, request.headers, request.json_body)
+            for request in requests
+        ]
+        self._write_entry(
+            requests_file,
+            (self.__VERSION, stat.st_size, stat.st_mtime_ns, self._digest(requests_file), requests_data)
+        )
+
+    def entries(self) -> List[str]:
+        if not os.path.exists(self.cache_dir):
+            return []
+        return [
+            os.path.join(self.cache_dir, name)
+            for name in os.listdir(self.cache_dir) if name.endswith(self.__ENTRY_SUFFIX)
+        ]
+
+    def clear(self) -> int:
+        number_entries = len(self.entries())
+        if os.path.exists(self.cache_dir):
+            shutil.rmtree(self.cache_dir)
+        return number_entries
+
+    def _entry_path(self, requests_file: str) -> str:
+        key = hashlib.sha1(os.path.abspath(requests_file).encode()).hexdigest()
+        return os.path.join(self.cache_dir, key + self.__ENTRY_SUFFIX)
+
+    def _read_entry(self, requests_file: str) -> Optional[Tuple[Any, ...]]:
+        try:
+            with open(self._entry_path(requests_file), 'rb') as f:
+                entry = marshal.loads(f.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        return entry if isinstance(entry, tuple) and len(entry) == 5 else None
+
+    def _write_entry(self, requests_file: str, entry: Tuple[Any, ...]) -> None:
+        entry_path = self._entry_path(requests_file)
+        tmp_path = f'{entry_path}.{os.getpid()}.tmp'
+        try:
+            self._create_cache_dir()
+            with open(tmp_path, 'wb') as f:
+                marshal.dump(entry, f)
+            os.replace(tmp_path, entry_path)
+        except (OSError, ValueError):
+            # The cache is an optimization: an unwritable directory or unsupported data must not break the run
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _create_cache_dir(self) -> None:
+        if not os.path.exists(self.cache_dir):
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(os.path.join(self.cache_dir, '.gitignore'), 'w') as f:
+                f.write('# Created by vedro-replay automatically.\n*\n')
+
+    @staticmethod
+    def _digest(requests_file: str) -> str:
+        digest = hashlib.sha256()
+        with open(requests_file, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+
+def cache(args: Any) -> None:
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    log = logging.getLogger("Cache")
+
+    request_cache = RequestCache(args.cache_dir)
+    if args.clear:
+        log.info(f'Removed {request_cache.clear()} cached request files from "{args.cache_dir}"')
+    else:
+        log.info(f'Cached request files in "{args.cache_dir}": {len(request_cache.entries())}')
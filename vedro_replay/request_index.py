@@ -0,0 +1,127 @@
+import io
+import re
+from functools import lru_cache
+from itertools import zip_longest
+from typing import Any, Callable, Iterator, List, Optional
+
+from .parse_requests import (
+    HttpRequestParser,
+    IncorrectContentsRequestFile,
+    JsonlRequestParser,
+    get_request_parser,
+    iter_requests,
+    parse_request_lines,
+)
+from .request import Request
+
+
+class LazyRequest(Request):
+    __slots__ = ("_requests_file", "_offset", "_length")
+
+    def __init__(self, requests_file: str, offset: int, length: int) -> None:
+        # Request.__init__ is not called: the attributes of the request are read from the file on access
+        self._requests_file = requests_file
+        self._offset = offset
+        self._length = length
+
+    def load(self) -> Request:
+        return _load_lazy_request(self)
+
+    def __getattr__(self, name: str) -> Any:
+        if name in LazyRequest.__slots__:
+            raise AttributeError(name)
+        return getattr(self.load(), name)
+
+
+def load_request(requests_file: str, offset: int, length: int) -> Request:
+    with open(requests_file, 'rb') as f:
+        f.seek(offset)
+        data = f.read(length)
+
+    requests = list(parse_request_lines(requests_file, io.TextIOWrapper(io.BytesIO(data))))
+    if len(requests) != 1:
+        raise IncorrectContentsRequestFile(
+            f"Failed to process file contents {requests_file}: expected one request at byte {offset}"
+        )
+    return requests[0]
+
+
+# Scenarios are executed one by one, so only the requests of the recent scenarios are kept in memory.
+# The requests are cached by LazyRequest, not by the offset: a request changed by a scenario, e.g. by add_header,
+# doesn't change the requests of the other scenarios, even of the same file
+@lru_cache(maxsize=256)
+def _load_lazy_request(request: LazyRequest) -> Request:
+    return load_request(request._requests_file, request._offset, request._length)
+
+
+# A header with the value on the next line, as matched by HttpRequestParser._header with an empty value
+_header_without_value = re.compile(rb"[A-Za-z-]+[ \r]*:[ \r]*")
+_body_start = HttpRequestParser._BODY_START.encode()
+
+
+def _iter_request_offsets(requests_file: str) -> Iterator[int]:
+    request_parser = get_request_parser(requests_file)
+    if request_parser is HttpRequestParser:
+        yield from _iter_http_request_offsets(requests_file)
+        return
+
+    # Only the parser of .jsonl skips empty lines, each line of .txt is a request, as in parse_requests()
+    skip_empty_lines = request_parser is JsonlRequestParser
+    offset = 0
+    with open(requests_file, 'rb') as f:
+        for line in f:
+            if not skip_empty_lines or line.strip():
+                yield offset
+            offset += len(line)
+    yield offset
+
+
+def _iter_http_request_offsets(requests_file: str) -> Iterator[int]:
+    # The requests are delimited as by HttpRequestParser: a line with ### is not a delimiter in the body
+    # (it ends with an empty line) and after a header without a value (the line is the value of the header)
+    offset = 0
+    started = in_body = header_without_value = False
+
+    with open(requests_file, 'rb') as f:
+        for line in f:
+            text = line.rstrip(b"\n").expandtabs()
+            if in_body:
+                in_body = bool(text)
+            else:
+                text = text.lstrip(b" \r")
+                if not text:
+                    pass
+                elif header_without_value:
+                    header_without_value = False
+                elif text.startswith(b"###"):
+                    started = True
+                    yield offset
+                elif not started:
+                    raise IncorrectContentsRequestFile(f"Failed to process file contents {requests_file}")
+                elif _header_without_value.fullmatch(text):
+                    header_without_value = True
+                elif text[0] in _body_start:
+                    in_body = True
+            offset += len(line)
+    yield offset
+
+    if not started:
+        raise IncorrectContentsRequestFile(f"Failed to process file contents {requests_file}")
+
+
+def index_requests(requests_file: str, select: Optional[Callable[[Request], bool]] = None) -> List[LazyRequest]:
+    offsets = list(_iter_request_offsets(requests_file))
+    spans = zip(offsets, offsets[1:])
+    if select is None:
+        return [LazyRequest(requests_file, offset, next_offset - offset) for offset, next_offset in spans]
+
+    # The requests are selected (e.g. by the fingerprint) in one pass of the parser over the file,
+    # only the offsets of the selected requests are kept
+    selected = []
+    for span, request in zip_longest(spans, iter_requests(requests_file)):
+        if span is None or request is None:
+            raise IncorrectContentsRequestFile(f"Failed to process file contents {requests_file}")
+        if select(request):
+            offset, next_offset = span
+            selected.append(LazyRequest(requests_file, offset, next_offset - offset))
+    return selected
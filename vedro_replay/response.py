@@ -1,11 +1,20 @@
-import json
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Dict, Iterator, Sequence, Union
 
 from requests_toolbelt.multipart import decoder
 
+from .body_digest import BodyDigest
+from .decode_json import decode_json
+from .digest import digest_data
+from .exclude import ExcludeSet
+from .json_codec import json_codec
+from .multipart import MultipartBody
+from .parse_excludes import compile_excludes
+
 
 class Response(ABC):
+    __slots__ = ("status", "headers", "body", "request_url")
+
     def __init__(self, status: int, headers: Dict[Any, Any], body: Any, request_url: str) -> None:
         self.status = status
         self.headers = headers
@@ -17,6 +26,10 @@ class Response(ABC):
     def from_response(cls, response: Any) -> "Response":
         pass
 
+    def digest(self) -> str:
+        # The digest is computed on every call: the headers and the body are changed in place by the excludes
+        return digest_data([self.status, self.headers, self.body])
+
     def __repr__(self) -> str:
         r = f'REQUEST: {self.request_url}\n'
         r += f'STATUS CODE: {self.status}'
@@ -24,22 +37,113 @@ class Response(ABC):
 
 
 class JsonResponse(Response):
+    __slots__ = ()
+
     @classmethod
-    def from_response(cls, response: Any) -> "JsonResponse":
+    def from_response(cls, response: Any, exclude_body: Union[Sequence[str], ExcludeSet] = ()) -> "JsonResponse":
+        # The excludes of the body can be applied while it is decoded, so the excluded subtrees are never built
         return cls(
             status=response.status_code,
             headers=dict(response.headers),
-            body=response.json(),
+            body=decode_json(response.content, exclude_body) if exclude_body else json_codec.loads(response.content),
             request_url=response.request.url
         )
 
 
 class MultipartResponse(Response):
+    __slots__ = ()
+
+    @classmethod
+    def from_response(
+        cls, response: Any, exclude_body: Union[Sequence[str], ExcludeSet] = ()
+    ) -> "MultipartResponse":
+        return cls(
+            status=response.status_code,
+            headers=dict(response.headers),
+            body=[
+                decode_json(part.content, exclude_body) if exclude_body else json_codec.loads(part.content)
+                for part in decoder.MultipartDecoder.from_response(response).parts
+            ],
+            request_url=response.request.url
+        )
+
+
+class LazyMultipartResponse(Response):
+    __slots__ = ()
+
+    def __init__(self, status: int, headers: Dict[Any, Any], body: Any, request_url: str) -> None:
+        # The body of a snapshot is a list of the decoded parts
+        super().__init__(status, headers, body if isinstance(body, MultipartBody) else MultipartBody.from_parts(body),
+                         request_url)
+
     @classmethod
-    def from_response(cls, response: Any) -> "MultipartResponse":
+    def from_response(
+        cls, response: Any, exclude_body: Union[Sequence[str], ExcludeSet] = ()
+    ) -> "LazyMultipartResponse":
+        # The parts are split in the content of the response and each of them is decoded on the first access
+        body = MultipartBody.from_content(response.content, response.headers.get("content-type", ""))
+        if exclude_body:
+            body.exclude(compile_excludes(exclude_body))
         return cls(
             status=response.status_code,
             headers=dict(response.headers),
-            body=[json.loads(part.text) for part in decoder.MultipartDecoder.from_response(response).parts],
+            body=body,
             request_url=response.request.url
         )
+
+
+class BinaryResponse(Response):
+    __slots__ = ()
+
+    CHUNK_SIZE = 1 << 16
+
+    def __init__(self, status: int, headers: Dict[Any, Any], body: Any, request_url: str) -> None:
+        # The body of a snapshot is the dict of the digest
+        super().__init__(status, headers, body if isinstance(body, BodyDigest) else BodyDigest.from_dict(body),
+                         request_url)
+
+    @classmethod
+    def from_response(cls, response: Any) -> "BinaryResponse":
+        # The body is not kept, it is only hashed chunk by chunk. A response which is not read yet
+        # (sent with stream=True) is never loaded into memory
+        body = BodyDigest()
+        for chunk in cls._iter_chunks(response):
+            body.update(chunk)
+        return cls(status=response.status_code, headers=dict(response.headers), body=body,
+                   request_url=response.request.url)
+
+    @classmethod
+    async def from_stream(cls, response: Any) -> "BinaryResponse":
+        # The same for the responses of an async client sent with stream=True
+        body = BodyDigest()
+        try:
+            async for chunk in cls._aiter_chunks(response):
+                body.update(chunk)
+        finally:
+            await response.aclose()
+        return cls(status=response.status_code, headers=dict(response.headers), body=body,
+                   request_url=response.request.url)
+
+    @classmethod
+    def _iter_chunks(cls, response: Any) -> Iterator[bytes]:
+        return response.iter_bytes(cls.CHUNK_SIZE)  # type: ignore[no-any-return]
+
+    @classmethod
+    def _aiter_chunks(cls, response: Any) -> AsyncIterator[bytes]:
+        return response.aiter_bytes(cls.CHUNK_SIZE)  # type: ignore[no-any-return]
+
+
+class TextResponse(BinaryResponse):
+    # The text is decoded by the charset of the response and hashed in utf-8, so the same text in different charsets
+    # is the same body, the offsets of differences are in the bytes of utf-8
+    __slots__ = ()
+
+    @classmethod
+    def _iter_chunks(cls, response: Any) -> Iterator[bytes]:
+        for text in response.iter_text(cls.CHUNK_SIZE):
+            yield text.encode()
+
+    @classmethod
+    async def _aiter_chunks(cls, response: Any) -> AsyncIterator[bytes]:
+        async for text in response.aiter_text(cls.CHUNK_SIZE):
+            yield text.encode()
@@ -0,0 +1,299 @@
+import asyncio
+import importlib
+import logging
+import os
+import re
+import sys
+import time
+from collections import Counter
+from types import ModuleType
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from .client_pool import ClientPool
+from .compare import Difference, compare_responses
+from .generator import DirectoryWithRequestsNotFound, MainGenerator
+from .latency import LATENCY_GROUP_BY_FILE, LatencyReport, Timing, TimingTrace
+from .parse_requests import RequestParserException, find_request_files, iter_requests
+from .prepare_response import is_streamed, read_response
+from .process_pool import create_process_pool, dump_response, prepare_and_compare
+from .request import Request
+from .response import JsonResponse
+from .sharding import Shard
+
+# A helper returns the response, an async one returns the awaitable of it
+PrepareResponseMethod = Callable[[Any], Any]
+
+# Indexes of list items in the paths of differences: body.items.0.id
+INDEX_PATTERN = re.compile(r"(?<=\.)\d+(?=\.|$)")
+
+
+class ReplayItem(NamedTuple):
+    requests_file: str
+    order: Tuple[int, int]
+    request: Request
+    helper_method_name: str
+    prepare_response_method: PrepareResponseMethod
+
+
+class ReplaySummary:
+    def __init__(self, max_examples: int = 10, latency: Optional[LatencyReport] = None) -> None:
+        self.max_examples = max_examples
+        self.latency = latency
+        self.passed = 0
+        self.failed = 0
+        self.errors = 0
+        self.files: Dict[str, Counter[str]] = {}
+        self.differences: Counter[str] = Counter()
+        self.error_messages: Counter[str] = Counter()
+        self._examples: List[Tuple[Tuple[int, ...], Request, List[Difference]]] = []
+        self.started_at = time.monotonic()
+
+    @property
+    def total(self) -> int:
+        return self.passed + self.failed + self.errors
+
+    @property
+    def examples(self) -> List[Tuple[Request, List[Difference]]]:
+        return [(request, differences) for _, request, differences in self._examples]
+
+    def add_result(self, requests_file: str, request: Request, differences: List[Difference],
+                   order: Tuple[int, ...] = ()) -> None:
+        if differences:
+            self.failed += 1
+            self._file(requests_file)["failed"] += 1
+            # Indexes of list items are generalized, so the same difference in all items is counted together
+            self.differences.update({f"{INDEX_PATTERN.sub('*', d.path)}: {d.kind}" for d in differences})
+            # The examples are the first failed requests in the files, whatever order the responses come in
+            self._examples.append((order, request, differences))
+            self._examples.sort(key=lambda example: example[0])
+            del self._examples[self.max_examples:]
+        else:
+            self.passed += 1
+            self._file(requests_file)["passed"] += 1
+
+    def add_timing(self, requests_file: str, request: Request,
+                   golden: Optional[Timing], testing: Optional[Timing]) -> None:
+        if self.latency is not None and golden is not None and testing is not None:
+            self.latency.add(requests_file, request.path, golden, testing)
+
+    def add_error(self, requests_file: str, error: BaseException) -> None:
+        self.errors += 1
+        self._file(requests_file)["errors"] += 1
+        self.error_messages[f"{type(error).__name__}: {error}"] += 1
+
+    def render(self) -> str:
+        duration = time.monotonic() - self.started_at
+        lines = [
+            f"Replayed {self.total} requests from {len(self.files)} files in {duration:.1f}s "
+            f"({self.total / duration if duration else 0:.1f} requests/s): "
+            f"{self.passed} passed, {self.failed} failed, {self.errors} errors",
+        ]
+        for requests_file, counter in sorted(self.files.items()):
+            lines.append(f"  {requests_file}: {counter['passed']} passed, "
+                         f"{counter['failed']} failed, {counter['errors']} errors")
+        if self.differences:
+            lines.append("Most frequent differences:")
+            lines += [f"  {count:>8}  {difference}" for difference, count in self.differences.most_common(20)]
+        if self.error_messages:
+            lines.append("Most frequent errors:")
+            lines += [f"  {count:>8}  {message}" for message, count in self.error_messages.most_common(10)]
+        for request, differences in self.examples:
+            lines.append(f"Example of failed request: {request.method} {request.url}")
+            lines += [f"  {difference}" for difference in differences[:10]]
+        if self.latency is not None:
+            lines += self.latency.render()
+        return "\n".join(lines)
+
+    def _file(self, requests_file: str) -> Counter[str]:
+        return self.files.setdefault(requests_file, Counter())
+
+
+class ReplayRunner:
+    def __init__(
+        self,
+        golden_url: str,
+        testing_url: str,
+        concurrency: int,
+        helpers: Optional[ModuleType],
+        log: logging.Logger,
+        timeout: Optional[float] = 5.0,
+        rate_limit: Optional[float] = None,
+        adaptive_concurrency: bool = False,
+        shard: Optional[Shard] = None,
+        processes: int = 0,
+        latency: Optional[LatencyReport] = None,
+    ) -> None:
+        self.golden_url = golden_url
+        self.testing_url = testing_url
+        self.concurrency = concurrency
+        self.helpers = helpers
+        self.log = log
+        self.shard = shard
+        self.summary = ReplaySummary(latency=latency)
+        # Decoding, filtering and comparison of responses are CPU-bound, they can be done in a pool of processes
+        # while the requests are sent by this process
+        self._process_pool = None
+        if processes:
+            self._process_pool = create_process_pool(processes, helpers.__name__ if helpers else None)
+        self._pool = ClientPool()
+        self._pool.configure(
+            max_connections=concurrency,
+            max_keepalive_connections=concurrency,
+            timeout=timeout,
+            rate_limit=rate_limit,
+            adaptive_concurrency=adaptive_concurrency,
+        )
+
+    async def run(self, request_files: List[str]) -> ReplaySummary:
+        # The queue is bounded, so the requests are read from the files as fast as they are replayed
+        queue: "asyncio.Queue[Optional[ReplayItem]]" = asyncio.Queue(maxsize=self.concurrency * 2)
+        workers = [asyncio.create_task(self._worker(queue)) for _ in range(self.concurrency)]
+
+        try:
+            for file_number, requests_file in enumerate(request_files):
+                helper_method_name = MainGenerator.get_helper_method_name(requests_file)
+                prepare_response_method = self._get_prepare_response_method(requests_file, helper_method_name)
+                try:
+                    requests = iter_requests(requests_file)
+                    for number, request in enumerate(requests if self.shard is None else self.shard.select(requests)):
+                        await queue.put(ReplayItem(
+                            requests_file, (file_number, number), request, helper_method_name, prepare_response_method
+                        ))
+                except RequestParserException as e:
+                    self.summary.add_error(requests_file, e)
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            await self._pool.aclose()
+            if self._process_pool is not None:
+                self._process_pool.shutdown()
+
+        return self.summary
+
+    async def _worker(self, queue: "asyncio.Queue[Optional[ReplayItem]]") -> None:
+        golden_response: Any
+        testing_response: Any
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+
+            golden_trace = testing_trace = None
+            if self.summary.latency is not None:
+                golden_trace, testing_trace = TimingTrace(), TimingTrace()
+            try:
+                # Both requests are finished before the error of one of them is raised,
+                # so the other one doesn't keep running and holding a connection after the worker moves on
+                golden_response, testing_response = await asyncio.gather(
+                    self._fetch(self.golden_url, item, golden_trace),
+                    self._fetch(self.testing_url, item, testing_trace),
+                    return_exceptions=True,
+                )
+                for response in (golden_response, testing_response):
+                    if isinstance(response, BaseException):
+                        raise response
+                if golden_trace is not None and testing_trace is not None:
+                    self.summary.add_timing(
+                        item.requests_file, item.request, golden_trace.timing(), testing_trace.timing()
+                    )
+                if is_streamed(item.prepare_response_method):
+                    # The responses are already prepared by the async helper while their bodies were read
+                    differences = compare_responses(golden_response, testing_response)
+                elif self._process_pool is None:
+                    differences = compare_responses(
+                        item.prepare_response_method(golden_response), item.prepare_response_method(testing_response)
+                    )
+                else:
+                    differences = await asyncio.get_running_loop().run_in_executor(
+                        self._process_pool, prepare_and_compare,
+                        item.helper_method_name, dump_response(golden_response), dump_response(testing_response)
+                    )
+            except Exception as e:
+                self.summary.add_error(item.requests_file, e)
+            else:
+                self.summary.add_result(item.requests_file, item.request, differences, item.order)
+
+    async def _fetch(self, base_url: str, item: ReplayItem, trace: Optional[TimingTrace] = None) -> Any:
+        response = await self._send(base_url, item.request, trace)
+        if is_streamed(item.prepare_response_method):
+            return await item.prepare_response_method(response)
+        await read_response(response)
+        return response
+
+    async def _send(self, base_url: str, request: Request, trace: Optional[TimingTrace] = None) -> Any:
+        # The body of the response is not read here: an async helper hashes it as it is received
+        client = self._pool.get(base_url)
+        http_request = client.build_request(
+            method=request.method,
+            url=request.url,
+            headers=request.headers,
+            json=request.json_body,
+            extensions={"trace": trace} if trace is not None else None,
+        )
+        return await client.send(http_request, stream=True)
+
+    def _get_prepare_response_method(self, requests_file: str, helper_method_name: str) -> PrepareResponseMethod:
+        prepare_response_method = getattr(self.helpers, helper_method_name, None)
+        if prepare_response_method is None:
+            self.log.warning(f'Helper "{helper_method_name}" was not found, responses of {requests_file} '
+                             'are compared without excludes')
+            return JsonResponse.from_response
+        return prepare_response_method  # type: ignore[no-any-return]
+
+
+def import_helpers(helpers_module: str, log: logging.Logger) -> Optional[ModuleType]:
+    # The helpers of the generated project are imported from the current directory, as vedro does
+    sys.path.insert(0, os.getcwd())
+    try:
+        return importlib.import_module(helpers_module)
+    except ImportError as e:
+        log.warning(f'Failed to import helpers "{helpers_module}" ({e}), responses are compared without excludes')
+        return None
+
+
+def get_latency_report(args: Any) -> Optional[LatencyReport]:
+    # The latency is reported if it is grouped or has a threshold, by default the requests are grouped by file
+    if args.latency_group_by is None and args.latency_threshold is None:
+        return None
+    return LatencyReport(
+        group_by=args.latency_group_by or LATENCY_GROUP_BY_FILE,
+        threshold=args.latency_threshold,
+        min_requests=args.latency_min_requests,
+    )
+
+
+def run(args: Any) -> None:
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    log = logging.getLogger("Runner")
+    # Every request is logged by httpx at the info level, it hides the summary
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    if not args.golden_url or not args.testing_url:
+        log.critical("The api urls are not specified. Use --golden-url and --testing-url "
+                     "or the environment variables GOLDEN_API_URL and TESTING_API_URL")
+        sys.exit(2)
+
+    if not os.path.exists(args.requests_dir):
+        log.critical(f"{DirectoryWithRequestsNotFound.__name__}: "
+                     f"The directory with requests: {args.requests_dir} was not found")
+        sys.exit(2)
+
+    runner = ReplayRunner(
+        golden_url=args.golden_url,
+        testing_url=args.testing_url,
+        concurrency=args.concurrency,
+        helpers=import_helpers(args.helpers_module, log),
+        log=log,
+        timeout=args.timeout,
+        rate_limit=args.rate_limit,
+        adaptive_concurrency=args.adaptive_concurrency,
+        shard=args.shard,
+        processes=args.processes,
+        latency=get_latency_report(args),
+    )
+    summary = asyncio.run(runner.run(sorted(find_request_files(args.requests_dir))))
+    log.info(summary.render())
+
+    if summary.failed or summary.errors or (summary.latency is not None and summary.latency.regressions()):
+        sys.exit(1)
@@ -0,0 +1,58 @@
+from collections import Counter
+from typing import Any, Hashable, Iterable, Iterator, Set, Tuple, TypeVar
+from urllib.parse import parse_qsl, urlparse
+
+from .request import Request
+
+SAMPLE_BY_PATH = "path"
+SAMPLE_BY_SHAPE = "shape"
+SAMPLE_BY = (SAMPLE_BY_PATH, SAMPLE_BY_SHAPE)
+
+RequestType = TypeVar("RequestType", bound=Request)
+
+
+class RequestDeduplicator:
+    def __init__(self) -> None:
+        # The half of the sha256 fingerprint is enough to tell requests apart and takes less memory
+        self._seen: Set[bytes] = set()
+
+    def __call__(self, request: Request) -> bool:
+        fingerprint = bytes.fromhex(request.fingerprint()[:32])
+        if fingerprint in self._seen:
+            return False
+        self._seen.add(fingerprint)
+        return True
+
+
+def get_request_shape(request: Request) -> Tuple[Hashable, ...]:
+    # The shape of the request doesn't depend on the values: /search?q=a and /search?q=b have the same shape
+    query = urlparse(request.url).query
+    query_names = tuple(sorted({name for name, _ in parse_qsl(query, keep_blank_values=True)}))
+    body: Any = request.json_body
+    body_shape = tuple(sorted(body)) if isinstance(body, dict) else type(body).__name__
+    return request.method.upper(), request.path, query_names, body_shape
+
+
+class RequestSampler:
+    def __init__(self, limit: int, by: str = SAMPLE_BY_PATH) -> None:
+        if by not in SAMPLE_BY:
+            raise ValueError(f"Unknown sampling '{by}', expected one of {SAMPLE_BY}")
+        self.limit = limit
+        self.by = by
+        self._counter: Counter[Hashable] = Counter()
+
+    def __call__(self, request: Request) -> bool:
+        key = request.path if self.by == SAMPLE_BY_PATH else get_request_shape(request)
+        if self._counter[key] >= self.limit:
+            return False
+        self._counter[key] += 1
+        return True
+
+
+def deduplicate_requests(requests: Iterable[RequestType]) -> Iterator[RequestType]:
+    return filter(RequestDeduplicator(), requests)
+
+
+def sample_requests(requests: Iterable[RequestType], limit: int, by: str = SAMPLE_BY_PATH) -> Iterator[RequestType]:
+    # The first requests of each path or shape are kept, so the sample is the same on every run
+    return filter(RequestSampler(limit, by), requests)
@@ -0,0 +1,85 @@
+import os
+from typing import Iterable, Iterator, Optional, Type, TypeVar
+
+from vedro.core import Dispatcher, Plugin, PluginConfig
+from vedro.events import ArgParsedEvent, ArgParseEvent
+
+from .request import Request
+
+SHARD_ENV = "VEDRO_REPLAY_SHARD"
+
+RequestType = TypeVar("RequestType", bound=Request)
+
+
+class Shard:
+    def __init__(self, index: int, total: int) -> None:
+        if total < 1 or not 1 <= index <= total:
+            raise ValueError(f"Incorrect shard {index}/{total}, expected 1 <= index <= total")
+        self.index = index
+        self.total = total
+
+    @classmethod
+    def parse(cls, spec: str) -> "Shard":
+        try:
+            index, total = spec.split("/")
+            return cls(int(index), int(total))
+        except ValueError as e:
+            raise ValueError(f"Incorrect shard '{spec}', expected the format 'index/total', e.g. 3/16") from e
+
+    def __contains__(self, request: Request) -> bool:
+        # The fingerprint doesn't depend on the order of requests, so a shard gets the same requests on every runner
+        return int(request.fingerprint()[:16], 16) % self.total == self.index - 1
+
+    def select(self, requests: Iterable[RequestType]) -> Iterator[RequestType]:
+        return (request for request in requests if request in self)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Shard) and (self.index, self.total) == (other.index, other.total)
+
+    def __repr__(self) -> str:
+        return f"{self.index}/{self.total}"
+
+
+class ShardSettings:
+    def __init__(self) -> None:
+        self.shard: Optional[Shard] = None
+
+    def configure(self, shard: Optional[Shard]) -> None:
+        self.shard = shard
+
+    def get_shard(self) -> Optional[Shard]:
+        if self.shard is not None:
+            return self.shard
+        spec = os.environ.get(SHARD_ENV)
+        return Shard.parse(spec) if spec else None
+
+
+shard_settings = ShardSettings()
+
+
+class ShardingPlugin(Plugin):
+    def __init__(self, config: Type["Sharding"], *, settings: ShardSettings = shard_settings) -> None:
+        super().__init__(config)
+        self._settings = settings
+
+    def subscribe(self, dispatcher: Dispatcher) -> None:
+        dispatcher.listen(ArgParseEvent, self.on_arg_parse) \
+                  .listen(ArgParsedEvent, self.on_arg_parsed)
+
+    def on_arg_parse(self, event: ArgParseEvent) -> None:
+        group = event.arg_parser.add_argument_group("VedroReplay Sharding")
+        group.add_argument(
+            "--replay-shard", type=Shard.parse, default=None, metavar="INDEX/TOTAL",
+            help=f"Replay only the requests of the shard, e.g. 3/16 (or set {SHARD_ENV}). "
+                 "Requests are split between the shards by their fingerprint"
+        )
+
+    def on_arg_parsed(self, event: ArgParsedEvent) -> None:
+        # The scenarios are loaded after the arguments are parsed, so replay() selects the requests of the shard
+        if event.args.replay_shard is not None:
+            self._settings.configure(event.args.replay_shard)
+
+
+class Sharding(PluginConfig):
+    plugin = ShardingPlugin
+    description = "Splits the requests of vedro-replay scenarios between shards, e.g. CI runners"
@@ -0,0 +1,174 @@
+import logging
+import os
+import shutil
+from typing import Any, Dict, Optional, Set, Type
+
+from vedro.core import Dispatcher, Plugin, PluginConfig
+from vedro.events import ArgParsedEvent, ArgParseEvent
+
+from .body_digest import BodyDigest
+from .json_codec import json_codec
+from .multipart import MultipartBody
+from .parse_requests import find_request_files, iter_requests
+from .request import Request
+from .response import (
+    BinaryResponse,
+    JsonResponse,
+    LazyMultipartResponse,
+    MultipartResponse,
+    Response,
+    TextResponse,
+)
+
+DEFAULT_SNAPSHOTS_DIR = '.vedro-replay-snapshots'
+
+
+class SnapshotStore:
+    MODE_OFF = 'off'
+    MODE_USE = 'use'
+    MODE_REFRESH = 'refresh'
+    MODES = (MODE_OFF, MODE_USE, MODE_REFRESH)
+
+    __RESPONSE_TYPES: Dict[str, Type[Response]] = {
+        response_type.__name__: response_type
+        for response_type in (JsonResponse, MultipartResponse, LazyMultipartResponse, BinaryResponse, TextResponse)
+    }
+
+    def __init__(self, snapshots_dir: str = DEFAULT_SNAPSHOTS_DIR, mode: str = MODE_OFF) -> None:
+        self.configure(snapshots_dir, mode)
+
+    def configure(self, snapshots_dir: str, mode: str) -> None:
+        assert mode in self.MODES, f"Unknown snapshots mode '{mode}', expected one of {self.MODES}"
+        self.snapshots_dir = snapshots_dir
+        self.mode = mode
+
+    def load(self, request: Request, namespace: str) -> Optional[Response]:
+        if self.mode != self.MODE_USE:
+            return None
+
+        try:
+            with open(self._snapshot_path(request.fingerprint(), namespace), 'rb') as f:
+                snapshot = json_codec.loads(f.read())
+        except FileNotFoundError:
+            return None
+
+        return self.__RESPONSE_TYPES[snapshot['type']](
+            status=snapshot['status'],
+            headers=snapshot['headers'],
+            body=snapshot['body'],
+            request_url=snapshot['request_url'],
+        )
+
+    @staticmethod
+    def _dump_body(body: Any) -> Any:
+        if isinstance(body, MultipartBody):
+            return list(body)
+        if isinstance(body, BodyDigest):
+            return body.to_dict()
+        return body
+
+    def save(self, request: Request, namespace: str, response: Response) -> None:
+        if self.mode == self.MODE_OFF:
+            return
+
+        snapshot_path = self._snapshot_path(request.fingerprint(), namespace)
+        digest = response.digest()
+        # The refreshed snapshot is not rewritten if the golden response is the same
+        if self._load_digest(snapshot_path) == digest:
+            return
+
+        snapshot = json_codec.dumps({
+            'type': type(response).__name__,
+            'request': str(request),
+            'digest': digest,
+            'status': response.status,
+            'headers': response.headers,
+            'body': self._dump_body(response.body),
+            'request_url': str(response.request_url),
+        })
+
+        os.makedirs(os.path.dirname(snapshot_path), exist_ok=True)
+        tmp_path = f'{snapshot_path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w') as f:
+            f.write(snapshot)
+        os.replace(tmp_path, snapshot_path)
+
+    def prune(self, fingerprints: Set[str]) -> int:
+        number_removed = 0
+        for root, _, files in os.walk(self.snapshots_dir, topdown=False):
+            for file in files:
+                if file.endswith('.json') and file[:-len('.json')] not in fingerprints:
+                    os.remove(os.path.join(root, file))
+                    number_removed += 1
+            if root != self.snapshots_dir and not os.listdir(root):
+                os.rmdir(root)
+        return number_removed
+
+    def clear(self) -> None:
+        if os.path.exists(self.snapshots_dir):
+            shutil.rmtree(self.snapshots_dir)
+
+    def _load_digest(self, snapshot_path: str) -> Optional[str]:
+        try:
+            with open(snapshot_path, 'rb') as f:
+                return json_codec.loads(f.read()).get('digest')  # type: ignore[no-any-return]
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _snapshot_path(self, fingerprint: str, namespace: str) -> str:
+        # Snapshots are addressed by the fingerprint of the request, namespace separates the preparation methods
+        return os.path.join(self.snapshots_dir, namespace, fingerprint[:2], f'{fingerprint}.json')
+
+
+snapshot_store = SnapshotStore()
+
+
+class SnapshotsPlugin(Plugin):
+    def __init__(self, config: Type["Snapshots"], *, store: SnapshotStore = snapshot_store) -> None:
+        super().__init__(config)
+        self._store = store
+        self._mode = config.mode
+        self._snapshots_dir = config.snapshots_dir
+
+    def subscribe(self, dispatcher: Dispatcher) -> None:
+        dispatcher.listen(ArgParseEvent, self.on_arg_parse) \
+                  .listen(ArgParsedEvent, self.on_arg_parsed)
+
+    def on_arg_parse(self, event: ArgParseEvent) -> None:
+        group = event.arg_parser.add_argument_group("VedroReplay Snapshots")
+        group.add_argument(
+            "--replay-snapshots", choices=SnapshotStore.MODES, default=self._mode,
+            help="Compare testing responses with the stored golden responses ('use', missing ones are recorded) "
+                 "or record all golden responses again ('refresh')"
+        )
+
+    def on_arg_parsed(self, event: ArgParsedEvent) -> None:
+        self._store.configure(snapshots_dir=self._snapshots_dir, mode=event.args.replay_snapshots)
+
+
+class Snapshots(PluginConfig):
+    plugin = SnapshotsPlugin
+    description = "Records golden responses of vedro-replay scenarios and replays them from the local store"
+
+    # Mode of snapshots: 'off', 'use' or 'refresh'
+    mode: str = SnapshotStore.MODE_OFF
+
+    # Directory of the snapshots store
+    snapshots_dir: str = DEFAULT_SNAPSHOTS_DIR
+
+
+def snapshots(args: Any) -> None:
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    log = logging.getLogger("Snapshots")
+
+    store = SnapshotStore(args.snapshots_dir)
+    if args.clear:
+        store.clear()
+        log.info(f'Removed snapshots from "{args.snapshots_dir}"')
+    elif args.prune:
+        fingerprints = {
+            request.fingerprint()
+            for requests_file in find_request_files(args.requests_dir)
+            for request in iter_requests(requests_file)
+        }
+        log.info(f'Removed {store.prune(fingerprints)} snapshots of requests missing in "{args.requests_dir}"')